@@ -1,20 +1,1576 @@
+import argparse
+import csv
+import glob
+import hashlib
+import io
+import json
+import math
 import os
+import queue
+import signal
 import sys
+import threading
 import time
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 
 # Prüfen, ob PIL (Pillow) installiert ist
 try:
-    from PIL import Image
+    from PIL import Image, ImageChops, ImageStat
 
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# tkinter wird erst für die GUI geladen, damit Kommandozeile und Benchmark ohne Tk laufen
+tk = ttk = filedialog = messagebox = None
+
+# Für den maximalen Speicherbedarf pro Prozess (nicht unter Windows verfügbar)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Standardanzahl paralleler Konvertierungsprozesse
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+# Unterstützte Eingabeformate
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Spalten für den CSV-Export der Statistik
+STATS_FIELDS = ['filename', 'input_path', 'output_path', 'original_size', 'webp_size',
+                'savings_percent', 'peak_rss', 'time_decode', 'time_convert', 'time_encode',
+                'time_write', 'cached', 'resumed', 'error']
+
+# Gemessene Phasen pro Datei mit Beschriftung für die Zusammenfassung
+TIMING_STAGES = {
+    'decode': "Öffnen/Dekodieren",
+    'convert': "Farbkonvertierung/Skalierung",
+    'encode': "Kodieren",
+    'write': "Schreiben"
+}
+
+# Geschätzter Speicherbedarf pro dekodiertem Byte (dekodiertes Bild + Encoder-Puffer)
+MEMORY_OVERHEAD_FACTOR = 3
+
+# Maximale Anzahl offener Aufträge pro Prozess, damit die Warteschlange begrenzt bleibt
+PENDING_PER_WORKER = 4
+
+# Auto-Modus: Pixelanzahl der verkleinerten Probe, auf der Kandidaten getestet werden
+AUTO_PROBE_PIXELS = 384 * 384
+# Auto-Modus: Die Probe besteht aus AUTO_PROBE_GRID x AUTO_PROBE_GRID Ausschnitten
+AUTO_PROBE_GRID = 3
+# Auto-Modus: getesteter Qualitätsbereich
+AUTO_QUALITY_RANGE = (40, 100)
+# Auto-Modus: Methoden vom Startwert abwärts; method=6 wird nur mit Zeitbudget geprüft
+AUTO_METHODS = (4, 2, 0)
+# Auto-Modus: Mindestgewinn, damit sich method=6 gegenüber method=4 lohnt
+AUTO_MIN_METHOD_GAIN = 0.02
+# Auto-Modus: geschätzte Kodierzeit von method=6 im Verhältnis zu method=4
+AUTO_METHOD_6_COST = 2.5
+# Auto-Modus: Die Qualitätssuche endet, sobald das Suchintervall höchstens so breit ist
+AUTO_QUALITY_TOLERANCE = 2
+
+# SSIM: Quadrate der Grauwerte, aufgeteilt in oberes und unteres Byte (v * v = 256 * hoch + tief)
+SQUARE_HIGH = [value * value // 256 for value in range(256)]
+SQUARE_LOW = [value * value % 256 for value in range(256)]
+
+# Auto-Modus: Zielarten in der GUI (Beschriftung -> Schlüssel, Umrechnungsfaktor)
+AUTO_TARGETS = {
+    "Max. Größe (KB)": ('max_bytes', 1024),
+    "Min. SSIM": ('min_ssim', 1),
+    "Min. PSNR (dB)": ('min_psnr', 1),
+    "Zeitbudget (s)": ('max_seconds', 1)
+}
+
+# Varianten: Standardbreiten und Name des srcset-Manifests im Ausgabeordner
+DEFAULT_VARIANT_WIDTHS = (320, 640, 1280, 2560)
+SRCSET_MANIFEST = "srcset.json"
+# AVIF-Encoder-Geschwindigkeit 0-10 (0 = langsamste, beste Kompression)
+AVIF_SPEED = 6
+
+# Name der Manifest-Datei für den inkrementellen Cache im Ausgabeordner
+CACHE_MANIFEST = ".webp_manifest.json"
+CACHE_VERSION = 1
+
+# Ordner für die Checkpoint-Logs unterbrochener Aufträge im Ausgabeordner
+JOB_DIR = ".webp_jobs"
+
+
+def get_encode_settings(file_path, jpg_quality=90, png_quality=95, png_lossless=True, lossless=False):
+    """
+    Ermittelt Qualität und Kompressionsart basierend auf dem Dateityp
+
+    Returns:
+        Tupel (quality, lossless)
+    """
+    if lossless:
+        return jpg_quality, True
+
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == '.png':
+        if png_lossless:
+            return png_quality, True
+        return png_quality, False
+
+    return jpg_quality, False
+
+
+def image_psnr(reference, candidate):
+    """Berechnet den PSNR (dB) zweier gleich großer Bilder im RGB-Raum"""
+    diff = ImageChops.difference(reference.convert('RGB'), candidate.convert('RGB'))
+    rms = ImageStat.Stat(diff).rms
+    mse = sum(value * value for value in rms) / len(rms)
+    if mse == 0:
+        return float('inf')
+    return 20 * math.log10(255 / math.sqrt(mse))
+
+
+def _window_moments(image, window):
+    """
+    Gibt Mittelwert und Varianz jedes window x window-Fensters eines L-Bildes zurück
+
+    Image.reduce mittelt die Fenster in C; E[v²] kommt aus zwei Lookup-Bildern
+    (oberes und unteres Byte von v²), sodass weder numpy noch ImageMath nötig ist.
+    """
+    means = array('f', image.convert('F').reduce(window).tobytes())
+    high = array('f', image.point(SQUARE_HIGH).convert('F').reduce(window).tobytes())
+    low = array('f', image.point(SQUARE_LOW).convert('F').reduce(window).tobytes())
+    return [(mean, 256 * h + l - mean * mean) for mean, h, l in zip(means, high, low)]
+
+
+def image_ssim(reference, candidate, window=16):
+    """
+    Berechnet die mittlere SSIM der Helligkeit zweier gleich großer Bilder
+
+    Das Bild wird in Fenster von window x window Pixeln geteilt; Mittelwerte und
+    Varianzen pro Fenster kommen aus _window_moments, die Kovarianz aus der
+    Varianz des halben Differenzbildes.
+    """
+    reference = reference.convert('L')
+    candidate = candidate.convert('L')
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+
+    # Var((a - b) / 2) = (var_a + var_b - 2 * cov) / 4
+    half_diff = ImageChops.subtract(reference, candidate, scale=2.0, offset=128)
+
+    values = []
+    for (mean_a, var_a), (mean_b, var_b), (_, var_d) in zip(
+            _window_moments(reference, window), _window_moments(candidate, window),
+            _window_moments(half_diff, window)):
+        covariance = (var_a + var_b) / 2 - 2 * var_d
+        values.append(
+            ((2 * mean_a * mean_b + c1) * (2 * covariance + c2)) /
+            ((mean_a ** 2 + mean_b ** 2 + c1) * (var_a + var_b + c2))
+        )
+
+    return sum(values) / len(values) if values else 1.0
+
+
+def _make_probe(img):
+    """
+    Erzeugt eine verkleinerte Probe aus gleichmäßig verteilten Ausschnitten
+
+    Die Ausschnitte behalten die Originalauflösung, damit Detaildichte und damit
+    Dateigröße und Kodierzeit pro Pixel dem Original entsprechen.
+
+    Returns:
+        Tupel (probe, Pixelverhältnis Original / Probe)
+    """
+    width, height = img.size
+    pixels = max(width * height, 1)
+    if pixels <= AUTO_PROBE_PIXELS:
+        probe = img.copy()
+        probe.load()
+        return probe, 1.0
+
+    grid = AUTO_PROBE_GRID
+    tile = int(math.sqrt(AUTO_PROBE_PIXELS)) // grid
+    tile_w = min(tile, max(1, width // grid))
+    tile_h = min(tile, max(1, height // grid))
+
+    probe = Image.new(img.mode, (tile_w * grid, tile_h * grid))
+    for row in range(grid):
+        top = (height - tile_h) * (2 * row + 1) // (2 * grid)
+        for col in range(grid):
+            left = (width - tile_w) * (2 * col + 1) // (2 * grid)
+            probe.paste(img.crop((left, top, left + tile_w, top + tile_h)), (col * tile_w, row * tile_h))
+
+    return probe, pixels / (probe.size[0] * probe.size[1])
+
+
+def _encode_probe(probe, quality, lossless, method):
+    """Kodiert die Probe im Speicher und gibt Größe, Dauer und dekodiertes Bild zurück"""
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    if lossless:
+        probe.save(buffer, format='WEBP', lossless=True, method=method)
+    else:
+        probe.save(buffer, format='WEBP', quality=quality, method=method)
+    duration = time.perf_counter() - start
+
+    buffer.seek(0)
+    decoded = Image.open(buffer)
+    decoded.load()
+    return buffer.getbuffer().nbytes, duration, decoded
+
+
+def auto_encode_settings(img, quality, lossless, target):
+    """
+    Wählt Encoder-Aufwand (method) und Qualität für ein Bild anhand eines Ziels
+
+    Alle Kandidaten werden auf einer verkleinerten Probe (siehe _make_probe)
+    getestet; Größe und Dauer werden über das Pixelverhältnis auf das
+    Originalbild hochgerechnet. Die Suche beginnt bei method=4; method=6 wird
+    nur mit einem Zeitbudget geprüft, das sie voraussichtlich erlaubt.
+
+    Args:
+        img: Das geöffnete Quellbild
+        quality: Qualität aus den Einstellungen (Obergrenze bei reinem Größenziel)
+        lossless: Verlustfreie Kompression (dann wird nur die Methode gewählt)
+        target: Dictionary mit optional 'max_bytes', 'min_ssim', 'min_psnr', 'max_seconds'
+
+    Returns:
+        Tupel (quality, method, info)
+    """
+    search_start = time.perf_counter()
+
+    probe, scale = _make_probe(img)
+
+    encodes = {}
+
+    def encode(q, m):
+        if (q, m) not in encodes:
+            encodes[(q, m)] = _encode_probe(probe, q, lossless, m)
+        return encodes[(q, m)]
+
+    metrics = {}
+
+    def measure(q):
+        # SSIM/PSNR sind teurer als die Kodierung der Probe und werden nur einmal pro Qualität berechnet
+        if q not in metrics:
+            _, _, decoded = encode(q, method)
+            metrics[q] = (
+                image_ssim(probe, decoded) if target.get('min_ssim') is not None else None,
+                image_psnr(probe, decoded) if target.get('min_psnr') is not None else None
+            )
+        return metrics[q]
+
+    # 1. Methode: Start bei method=4, der ersten, die ins Zeitbudget passt. method=6 wird
+    #    nur geprüft, wenn das Budget ihre geschätzte Dauer zulässt, und nur genommen,
+    #    wenn sie messbar kleiner ist.
+    max_seconds = target.get('max_seconds')
+    method = AUTO_METHODS[-1]
+    for candidate in AUTO_METHODS:
+        if max_seconds is None or encode(quality, candidate)[1] * scale <= max_seconds:
+            method = candidate
+            break
+
+    if method == 4 and max_seconds is not None:
+        size_4, duration_4, _ = encode(quality, 4)
+        if duration_4 * scale * AUTO_METHOD_6_COST <= max_seconds:
+            size_6, duration_6, _ = encode(quality, 6)
+            if duration_6 * scale <= max_seconds and size_6 <= size_4 * (1 - AUTO_MIN_METHOD_GAIN):
+                method = 6
+
+    # 2. Qualität: kleinste, die das Qualitätsziel erfüllt, höchstens so groß wie das Größenziel erlaubt
+    target_met = True
+    if not lossless:
+        min_ssim = target.get('min_ssim')
+        min_psnr = target.get('min_psnr')
+        max_bytes = target.get('max_bytes')
+        low, high = AUTO_QUALITY_RANGE
+
+        def quality_margin(q):
+            # Abstand zum Ziel in dB (SSIM als -10 * log10(1 - SSIM)), steigt mit der Qualität
+            ssim, psnr = measure(q)
+            margins = []
+            if min_ssim is not None:
+                margins.append(_ssim_db(ssim) - _ssim_db(min_ssim))
+            if min_psnr is not None:
+                margins.append(min(psnr, 100.0) - min_psnr)
+            return min(margins)
+
+        def size_margin(q):
+            # Logarithmischer Abstand zur Größengrenze, fällt mit der Qualität
+            return math.log(max_bytes) - math.log(max(encode(q, method)[0] * scale, 1))
+
+        if min_ssim is not None or min_psnr is not None:
+            quality = _search_quality(low, high, quality_margin, smallest=True)
+            if quality is None:
+                quality = high
+                target_met = False
+
+        if max_bytes is not None:
+            size_limit = _search_quality(low, quality, size_margin, smallest=False)
+            if size_limit is None:
+                quality = low
+                target_met = False
+            elif size_limit < quality:
+                quality = size_limit
+                if min_ssim is not None or min_psnr is not None:
+                    target_met = False
+
+    size = encode(quality, method)[0]
+    info = {
+        'quality': quality,
+        'method': method,
+        'estimated_bytes': int(size * scale),
+        'target_met': target_met
+    }
+    if not lossless and (target.get('min_ssim') is not None or target.get('min_psnr') is not None):
+        ssim, psnr = measure(quality)
+        if ssim is not None:
+            info['ssim'] = ssim
+        if psnr is not None:
+            info['psnr'] = psnr
+    info['probe_encodes'] = len(encodes)
+    info['metric_evaluations'] = len(metrics)
+    info['search_seconds'] = time.perf_counter() - search_start
+
+    return quality, method, info
+
+
+def _ssim_db(value):
+    """Rechnet eine SSIM in dB um (-10 * log10(1 - SSIM)), annähernd linear zur Qualität"""
+    return -10 * math.log10(max(1 - value, 1e-10))
+
+
+def _search_quality(low, high, margin, smallest):
+    """
+    Sucht im Qualitätsbereich [low, high] die Grenze, an der margin das Vorzeichen wechselt
+
+    smallest=True sucht die kleinste Qualität mit margin >= 0 (margin steigt mit der
+    Qualität), smallest=False die größte (margin fällt). Statt zu halbieren wird
+    zwischen den Messwerten der Intervallgrenzen linear interpoliert (Regula falsi,
+    Illinois-Variante); die Suche endet, sobald das Intervall höchstens
+    AUTO_QUALITY_TOLERANCE breit ist, und liefert die Grenze, die das Ziel sicher
+    erfüllt. Gibt None zurück, wenn keine Qualität passt.
+    """
+    good, bad = (high, low) if smallest else (low, high)
+    good_margin = margin(good)
+    if good_margin < 0:
+        return None
+    bad_margin = margin(bad)
+    if bad_margin >= 0:
+        return bad
+
+    last_side = None
+    while abs(good - bad) > AUTO_QUALITY_TOLERANCE:
+        # Nullstelle der Geraden durch beide Messpunkte, echt innerhalb des Intervalls
+        fraction = bad_margin / (bad_margin - good_margin)
+        candidate = bad + round((good - bad) * fraction)
+        candidate = min(max(candidate, min(good, bad) + 1), max(good, bad) - 1)
+
+        value = margin(candidate)
+        if value >= 0:
+            good, good_margin = candidate, value
+            if last_side == 'good':
+                bad_margin /= 2
+            last_side = 'good'
+        else:
+            bad, bad_margin = candidate, value
+            if last_side == 'bad':
+                good_margin /= 2
+            last_side = 'bad'
+
+    return good
+
+
+def _reset_peak_rss():
+    """Setzt den Spitzenwert des Speicherverbrauchs zurück (nur Linux)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _peak_rss():
+    """
+    Gibt den maximalen Speicherverbrauch (RSS) des Prozesses in Bytes zurück
+
+    Unter Linux ist das der Wert seit dem letzten _reset_peak_rss(), sonst der
+    Spitzenwert seit Prozessstart. None, wenn nicht ermittelbar.
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS meldet Bytes, Linux/BSD Kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _draft_size(size, max_dimension):
+    """Zielgröße für eine begrenzte Kantenlänge oder None, wenn keine Verkleinerung nötig ist"""
+    width, height = size
+    if not max_dimension or max(width, height) <= max_dimension:
+        return None
+    scale = max_dimension / max(width, height)
+    return max(1, math.ceil(width * scale)), max(1, math.ceil(height * scale))
+
+
+def estimate_decode_memory(input_path, max_dimension=None):
+    """
+    Schätzt den Speicherbedarf für Dekodieren und Kodieren einer Datei
+
+    Liest nur den Dateikopf. Bei JPEG wird die Verkleinerung durch draft()
+    (Faktor 1/2, 1/4 oder 1/8 beim Dekodieren) berücksichtigt.
+    """
+    with Image.open(input_path) as img:
+        width, height = img.size
+        bands = len(img.getbands())
+        target = _draft_size(img.size, max_dimension)
+        if target and img.format == 'JPEG':
+            reduction = 1
+            while reduction < 8 and width // (reduction * 2) >= target[0] and height // (reduction * 2) >= target[1]:
+                reduction *= 2
+            width, height = width // reduction, height // reduction
+
+    return width * height * max(bands, 3) * MEMORY_OVERHEAD_FACTOR
+
+
+def _estimate_or_zero(input_path, max_dimension=None):
+    """Wie estimate_decode_memory; unlesbare Dateien scheitern erst im Worker"""
+    try:
+        return estimate_decode_memory(input_path, max_dimension)
+    except Exception:
+        return 0
+
+
+class MemoryBudget:
+    """
+    Gemeinsames RAM-Budget für gleichzeitig laufende Dekodierungen
+
+    Eine Datei darf starten, wenn ihr geschätzter Bedarf noch ins Budget passt.
+    Eine einzelne Datei, die größer als das ganze Budget ist, läuft allein.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def try_acquire(self, amount):
+        """Reserviert Speicher, falls er ins Budget passt"""
+        with self._condition:
+            if self.used and self.used + amount > self.limit:
+                return False
+            self.used += amount
+            return True
+
+    def acquire(self, amount):
+        """Wartet, bis der Speicher ins Budget passt, und reserviert ihn"""
+        with self._condition:
+            while self.used and self.used + amount > self.limit:
+                self._condition.wait()
+            self.used += amount
+
+    def release(self, amount):
+        """Gibt reservierten Speicher wieder frei"""
+        with self._condition:
+            self.used -= amount
+            self._condition.notify_all()
+
+
+def avif_available():
+    """Prüft, ob Pillow AVIF schreiben kann (ab Pillow 11.2 oder mit pillow-avif-plugin)"""
+    if not PIL_AVAILABLE:
+        return False
+    Image.init()
+    if 'AVIF' in Image.SAVE:
+        return True
+    try:
+        import pillow_avif  # noqa: F401 - registriert das Plugin
+    except ImportError:
+        return False
+    return 'AVIF' in Image.SAVE
+
+
+def encode_settings_key(quality, lossless, method, auto=None, max_dimension=None, variants=None):
+    """Einstellungen, unter denen ein Ergebnis im Cache abgelegt wird"""
+    settings = {'quality': quality, 'lossless': lossless, 'method': method}
+    if auto is not None:
+        settings['auto'] = auto
+    if max_dimension:
+        settings['max_dimension'] = max_dimension
+    if variants:
+        settings['variants'] = variants
+    return settings
+
+
+def _encode_image(img, fmt, quality, lossless, method):
+    """Kodiert ein Bild im Speicher als WebP oder AVIF und liefert die Bytes"""
+    buffer = io.BytesIO()
+    if fmt == 'avif':
+        img.save(buffer, format='AVIF', quality=100 if lossless else quality, speed=AVIF_SPEED)
+    elif lossless:
+        img.save(buffer, format='WEBP', lossless=True, method=method)
+    else:
+        # method 0-6, 6 ist die höchste Kompression (langsamer)
+        img.save(buffer, format='WEBP', quality=quality, method=method)
+    return buffer.getvalue()
+
+
+def _write_output(path, data):
+    """
+    Schreibt kodierte Bytes atomar (temporäre Datei + Umbenennen) und liefert die Dateigröße
+
+    Eine halb geschriebene Datei trägt nie den endgültigen Namen und kann nach
+    einem Absturz nicht für fertig gehalten werden.
+    """
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(data)
+
+
+def _save_variants(img, output_dir, filename, widths, formats, quality, lossless, method, timings):
+    """
+    Speichert ein dekodiertes Bild in mehreren Breiten und Formaten
+
+    Alle Varianten entstehen aus demselben Bild im Speicher; die Breiten
+    müssen absteigend sortiert sein. Die Zeiten der Phasen werden in
+    timings aufsummiert.
+
+    Returns:
+        Liste der Varianten mit Breite, Höhe, Format, Pfad und Größe
+    """
+    outputs = []
+    for width in widths:
+        start = time.perf_counter()
+        if width == img.width:
+            variant = img
+        else:
+            height = max(1, round(img.height * width / img.width))
+            variant = img.resize((width, height), Image.LANCZOS, reducing_gap=2.0)
+        timings['convert'] += time.perf_counter() - start
+
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{filename}-{width}w.{fmt}")
+
+            start = time.perf_counter()
+            data = _encode_image(variant, fmt, quality, lossless, method)
+            timings['encode'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            size = _write_output(path, data)
+            timings['write'] += time.perf_counter() - start
+
+            outputs.append({
+                'width': variant.width,
+                'height': variant.height,
+                'format': fmt,
+                'path': path,
+                'size': size
+            })
+
+    return outputs
+
+
+def write_srcset_manifest(stats, output_dir):
+    """
+    Schreibt bzw. ergänzt das srcset-Manifest (JSON) im Ausgabeordner
+
+    Pro Quelldatei enthält es die Varianten und je Format einen fertigen
+    srcset-String, z.B. "bild-320w.webp 320w, bild-640w.webp 640w".
+    """
+    path = os.path.join(output_dir, SRCSET_MANIFEST)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    # Welcher Eintrag welche Variantendatei beschreibt
+    owners = {
+        variant['src']: key
+        for key, entry in manifest.items()
+        for variant in entry.get('variants', [])
+    }
+
+    for stat in stats:
+        if 'variants' not in stat:
+            continue
+
+        variants = [
+            {
+                'src': os.path.basename(variant['path']),
+                'width': variant['width'],
+                'height': variant['height'],
+                'format': variant['format'],
+                'size': variant['size']
+            }
+            for variant in stat['variants']
+        ]
+
+        srcset = {}
+        for fmt in sorted({variant['format'] for variant in variants}):
+            entries = sorted((v for v in variants if v['format'] == fmt), key=lambda v: v['width'])
+            srcset[fmt] = ", ".join(f"{v['src']} {v['width']}w" for v in entries)
+
+        largest_webp = max((v for v in variants if v['format'] == 'webp'),
+                           key=lambda v: v['width'], default=variants[0])
+        # Einträge früherer Läufe, deren Dateien gerade überschrieben wurden, sind überholt
+        for variant in variants:
+            previous = owners.get(variant['src'])
+            if previous is not None and previous != stat['filename']:
+                manifest.pop(previous, None)
+            owners[variant['src']] = stat['filename']
+
+        manifest[stat['filename']] = {
+            'fallback': largest_webp['src'],
+            'srcset': srcset,
+            'variants': variants
+        }
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def output_stem(input_path):
+    """Name der Ausgabe ohne Endung (Varianten hängen Breite und Format an)"""
+    return os.path.splitext(os.path.basename(input_path))[0]
+
+
+class OutputNames:
+    """
+    Vergibt die Ausgabenamen eines Laufs und erkennt Kollisionen
+
+    Die Ausgabe heißt wie die Quelle ohne Endung, daher würden sich bild.jpg und
+    bild.png oder gleichnamige Dateien aus Unterordnern gegenseitig überschreiben.
+    Die erste Datei in Scan-Reihenfolge erhält den Namen, weitere werden
+    abgewiesen. Groß-/Kleinschreibung zählt wie unter Windows nicht.
+    """
+
+    def __init__(self):
+        self._owners = {}
+
+    def claim(self, input_path):
+        """
+        Reserviert den Ausgabenamen für eine Quelldatei
+
+        Raises:
+            ValueError: Der Name gehört bereits einer anderen Datei
+        """
+        stem = output_stem(input_path)
+        input_path = os.path.abspath(input_path)
+        owner = self._owners.setdefault(stem.casefold(), input_path)
+        if owner != input_path:
+            raise ValueError(
+                f"Ausgabename '{stem}' von {input_path} ist bereits durch {owner} belegt - "
+                f"Datei umbenennen oder getrennt konvertieren"
+            )
+
+
+def convert_file(input_path, output_dir, quality=90, lossless=False, method=6, auto=None,
+                 max_dimension=None, variants=None):
+    """
+    Konvertiert eine einzelne Datei nach WebP.
+
+    Läuft in einem Worker-Prozess des ProcessPoolExecutor und muss daher
+    auf Modulebene liegen und ohne Zugriff auf die GUI auskommen.
+
+    Mit auto (Ziel-Dictionary, siehe auto_encode_settings) werden Methode und
+    Qualität pro Bild gewählt. Mit max_dimension wird die längste Kante begrenzt;
+    JPEG-Dateien werden dann bereits verkleinert dekodiert (draft).
+
+    Mit variants ({'widths': [...], 'formats': ['webp', 'avif']}) wird das Bild
+    einmal dekodiert und in allen Breiten und Formaten gespeichert. Breiten über
+    der Originalbreite werden auf diese begrenzt (kein Hochskalieren).
+
+    Die Dauer der Phasen (siehe TIMING_STAGES) wird in Sekunden unter 'timings'
+    zurückgegeben; die Suche des Auto-Modus zählt zum Kodieren.
+
+    Returns:
+        Dictionary mit Dateiname, Pfaden, Größen, Speicherbedarf, Phasenzeiten und Cache-Schlüssel
+    """
+    _reset_peak_rss()
+    timings = dict.fromkeys(TIMING_STAGES, 0.0)
+    start = time.perf_counter()
+
+    # Quelldatei vor dem Lesen erfassen, damit der Cache-Eintrag zum Inhalt passt
+    source_stat = os.stat(input_path)
+    settings = encode_settings_key(quality, lossless, method, auto, max_dimension, variants)
+    source_hash = file_hash(input_path)
+
+    # Bild öffnen
+    img = Image.open(input_path)
+    original_width, original_height = img.size
+
+    # Verkleinert dekodieren, statt das volle Bild in den Speicher zu laden
+    target = _draft_size(img.size, max_dimension)
+    draft_target = target
+    if variants:
+        # Nur so groß dekodieren, wie die größte Variante es erfordert
+        base_width = target[0] if target else original_width
+        widths = sorted({min(width, base_width) for width in variants['widths']}, reverse=True)
+        draft_target = (widths[0], max(1, math.ceil(original_height * widths[0] / original_width)))
+    if draft_target:
+        img.draft(None, draft_target)
+    img.load()
+    timings['decode'] = time.perf_counter() - start
+
+    # WebP und AVIF kodieren RGB/RGBA; andere Modi vorab umwandeln, damit die
+    # Zeit nicht unbemerkt im Encoder anfällt (und Paletten nicht grob skaliert werden)
+    start = time.perf_counter()
+    if img.mode not in ('RGB', 'RGBA'):
+        has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+    if target:
+        img.thumbnail((max_dimension, max_dimension))
+    timings['convert'] = time.perf_counter() - start
+
+    auto_info = None
+    if auto is not None:
+        start = time.perf_counter()
+        quality, method, auto_info = auto_encode_settings(img, quality, lossless, auto)
+        timings['encode'] += time.perf_counter() - start
+
+    # Ausgabepfad bestimmen
+    filename = output_stem(input_path)
+
+    variant_outputs = None
+    if variants:
+        variant_outputs = _save_variants(
+            img, output_dir, filename, widths, variants['formats'], quality, lossless, method, timings
+        )
+        output_path = variant_outputs[0]['path']
+        webp_size = sum(variant['size'] for variant in variant_outputs)
+    else:
+        output_path = os.path.join(output_dir, f"{filename}.webp")
+
+        # Im Speicher kodieren und getrennt schreiben, um beide Phasen zu messen
+        start = time.perf_counter()
+        data = _encode_image(img, 'webp', quality, lossless, method)
+        timings['encode'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        webp_size = _write_output(output_path, data)
+        timings['write'] = time.perf_counter() - start
+
+    # Größenvergleich
+    original_size = source_stat.st_size
+
+    # Prozentuale Einsparung berechnen
+    if original_size > 0:
+        savings_percent = ((original_size - webp_size) / original_size) * 100
+    else:
+        savings_percent = 0
+
+    stat = {
+        'filename': os.path.basename(input_path),
+        'input_path': input_path,
+        'output_path': output_path,
+        'original_size': original_size,
+        'webp_size': webp_size,
+        'savings_percent': savings_percent,
+        'mtime_ns': source_stat.st_mtime_ns,
+        'source_hash': source_hash,
+        'settings': settings,
+        'peak_rss': _peak_rss(),
+        'timings': timings
+    }
+    if auto_info:
+        stat['auto'] = auto_info
+    if variant_outputs:
+        stat['variants'] = variant_outputs
+
+    return stat
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """Berechnet einen Inhalts-Hash der Datei für den Cache"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _recorded_output_size(entry):
+    """Aktuelle Gesamtgröße der Ausgabedateien eines gespeicherten Ergebnisses (OSError, wenn eine fehlt)"""
+    if 'variants' in entry:
+        return sum(os.path.getsize(variant['path']) for variant in entry['variants'])
+    return os.path.getsize(entry['output_path'])
+
+
+class ConversionCache:
+    """
+    Persistentes Manifest der bereits konvertierten Dateien im Ausgabeordner
+
+    Ein Eintrag gilt als aktuell, wenn Quellgröße, Änderungszeit und
+    Encoder-Einstellungen übereinstimmen und die WebP-Datei noch existiert.
+    Bei geänderter Änderungszeit entscheidet der Inhalts-Hash.
+    """
+
+    def __init__(self, output_dir):
+        self.path = os.path.join(output_dir, CACHE_MANIFEST)
+        self.entries = {}
+        self.hits = 0
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Lädt das Manifest, ein fehlendes oder defektes Manifest ergibt einen leeren Cache"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Schreibt das Manifest atomar (temporäre Datei + Umbenennen)"""
+        if not self._dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def lookup(self, input_path, quality, lossless, method=6, auto=None, max_dimension=None,
+               variants=None):
+        """
+        Gibt das gespeicherte Ergebnis zurück, wenn die WebP-Datei aktuell ist
+
+        Returns:
+            Ergebnis-Dictionary mit 'cached': True oder None
+        """
+        key = os.path.abspath(input_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.get('settings') != encode_settings_key(quality, lossless, method, auto, max_dimension,
+                                                        variants):
+            return None
+
+        try:
+            source_stat = os.stat(input_path)
+            output_size = _recorded_output_size(entry)
+        except OSError:
+            return None
+
+        if source_stat.st_size != entry['original_size'] or output_size != entry['webp_size']:
+            return None
+
+        if source_stat.st_mtime_ns != entry['mtime_ns']:
+            # Datei wurde berührt - nur der Inhalt entscheidet
+            if file_hash(input_path) != entry['source_hash']:
+                return None
+            entry['mtime_ns'] = source_stat.st_mtime_ns
+            self._dirty = True
+
+        self.hits += 1
+        stat = dict(entry)
+        stat['input_path'] = input_path
+        stat['cached'] = True
+        return stat
+
+    def update(self, stat):
+        """Übernimmt ein frisches Konvertierungsergebnis in das Manifest"""
+        entry = {k: v for k, v in stat.items() if k not in ('input_path', 'cached', 'resumed')}
+        self.entries[os.path.abspath(stat['input_path'])] = entry
+        self._dirty = True
+
+
+def job_id_for(inputs, output_dir, settings):
+    """
+    Bildet die Auftrags-ID aus Eingaben, Ausgabeordner und Einstellungen
+
+    Derselbe Aufruf ergibt dieselbe ID und setzt damit einen unterbrochenen
+    Auftrag fort.
+    """
+    data = json.dumps({
+        'inputs': [os.path.abspath(path) for path in inputs],
+        'output_dir': os.path.abspath(output_dir),
+        'settings': settings
+    }, sort_keys=True)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=6).hexdigest()
+
+
+class JobCheckpoint:
+    """
+    Append-only Log der in einem Auftrag fertig konvertierten Dateien
+
+    Jede fertige Datei wird sofort als JSON-Zeile angehängt. Nach einem Abbruch
+    oder Absturz werden die dort verzeichneten Dateien übersprungen; eine beim
+    Absturz abgeschnittene letzte Zeile wird ignoriert. Nach erfolgreichem
+    Abschluss wird das Log gelöscht, ein dann leerer Auftragsordner ebenso.
+    """
+
+    def __init__(self, output_dir, job_id):
+        self.job_id = job_id
+        self.path = os.path.join(output_dir, JOB_DIR, f"{job_id}.log")
+        self.entries = {}
+        self.resumed = 0
+        self._file = None
+
+    def exists(self):
+        """Gibt an, ob ein unterbrochener Auftrag mit dieser ID vorliegt"""
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Liest das Log und liefert die Anzahl bereits erledigter Dateien"""
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        stat = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.entries[os.path.abspath(stat['input_path'])] = stat
+        except OSError:
+            pass
+        return len(self.entries)
+
+    def discard(self):
+        """Verwirft das Log, der Auftrag beginnt von vorn"""
+        self.close()
+        self.entries = {}
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        try:
+            # Nur leer entfernbar - Logs anderer offener Aufträge bleiben erhalten
+            os.rmdir(os.path.dirname(self.path))
+        except OSError:
+            pass
+
+    def lookup(self, input_path):
+        """
+        Gibt das Ergebnis zurück, wenn die Datei im Auftrag schon fertig ist
+
+        Returns:
+            Ergebnis-Dictionary mit 'resumed': True oder None
+        """
+        entry = self.entries.get(os.path.abspath(input_path))
+        if entry is None:
+            return None
+
+        # Ausgabe muss noch so existieren, wie sie geschrieben wurde
+        try:
+            if _recorded_output_size(entry) != entry['webp_size']:
+                return None
+        except OSError:
+            return None
+
+        self.resumed += 1
+        stat = dict(entry)
+        stat['resumed'] = True
+        return stat
+
+    def record(self, stat):
+        """Hängt ein fertiges Ergebnis an das Log an"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        entry = {k: v for k, v in stat.items() if k not in ('cached', 'resumed')}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Schließt das Log, es bleibt für die Fortsetzung erhalten"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """Auftrag abgeschlossen - Log löschen"""
+        self.discard()
+
+
+def record_result(stat, cache=None, checkpoint=None):
+    """
+    Trägt ein Ergebnis in Manifest und Checkpoint ein
+
+    Gemeinsame Buchführung für convert_batch() und die GUI: neue und aus dem
+    Auftrag übernommene Ergebnisse kommen ins Manifest, ins Checkpoint-Log nur
+    neue - Übernommene stehen dort schon.
+    """
+    if cache and not stat.get('cached'):
+        cache.update(stat)
+    if checkpoint and not stat.get('cached') and not stat.get('resumed'):
+        checkpoint.record(stat)
+
+
+def _init_worker():
+    """Worker ignorieren Strg+C, der Abbruch wird im Hauptprozess gesteuert"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def scan_image_files(folder, extensions=IMAGE_EXTENSIONS):
+    """
+    Durchsucht einen Ordner rekursiv mit os.scandir und liefert Bilddateien einzeln
+
+    Die Endungsfilterung erfolgt direkt beim Scannen, sodass nie die gesamte
+    Dateiliste im Speicher gehalten wird, nur die des aktuellen Ordners. Dateien
+    kommen alphabetisch, damit gleichnamige Ausgaben (siehe OutputNames) immer
+    derselben Datei zufallen. Nicht lesbare Ordner werden übersprungen.
+    """
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(extensions) and entry.is_file():
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        yield from sorted(files)
+
+        # Unterordner in alphabetischer Reihenfolge abarbeiten
+        stack.extend(sorted(subdirs, reverse=True))
+
+
+def iter_input_files(patterns):
+    """
+    Expandiert Dateipfade, Ordner und Glob-Muster zu Bilddateien (als Generator)
+
+    Ordner werden rekursiv nach unterstützten Bildformaten durchsucht.
+    """
+    # Duplikate können nur bei mehreren Mustern entstehen
+    seen = set() if len(patterns) > 1 else None
+
+    for pattern in patterns:
+        matches = glob.iglob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+
+        for match in matches:
+            if os.path.isdir(match):
+                candidates = scan_image_files(match)
+            elif os.path.isfile(match) and match.lower().endswith(IMAGE_EXTENSIONS):
+                candidates = [match]
+            else:
+                continue
+
+            for path in candidates:
+                if seen is not None:
+                    if path in seen:
+                        continue
+                    seen.add(path)
+                yield path
+
+
+def collect_input_files(patterns):
+    """Wie iter_input_files, aber als Liste"""
+    return list(iter_input_files(patterns))
+
+
+def convert_batch(inputs, output_dir, jpg_quality=90, png_quality=95, png_lossless=True,
+                  lossless=False, workers=None, method=6, on_result=None, use_cache=True, auto=None,
+                  max_dimension=None, memory_budget=None, variants=None, job_id=None, cancel_event=None):
+    """
+    Konvertiert mehrere Bilder parallel nach WebP (ohne GUI)
+
+    Args:
+        inputs: Dateipfade, Ordner oder Glob-Muster
+        output_dir: Zielordner für die WebP-Dateien
+        jpg_quality: Qualität für JPG-Dateien
+        png_quality: Qualität für PNG-Dateien (wenn nicht verlustfrei)
+        png_lossless: PNG-Dateien verlustfrei komprimieren
+        lossless: Alle Dateien verlustfrei komprimieren
+        workers: Anzahl paralleler Prozesse (Standard: Anzahl CPUs)
+        method: WebP-Encoder-Aufwand 0-6
+        on_result: Optionaler Callback, der mit jedem Ergebnis aufgerufen wird
+        use_cache: Unveränderte Bilder anhand des Manifests im Ausgabeordner überspringen
+        auto: Ziel für den Auto-Modus (siehe auto_encode_settings) oder None
+        max_dimension: Maximale Kantenlänge der Ausgabe in Pixeln oder None
+        memory_budget: Gemeinsames RAM-Budget aller Prozesse in Bytes oder None
+        variants: Breiten und Formate für responsive Varianten (siehe convert_file) oder None;
+            schreibt zusätzlich das srcset-Manifest in den Ausgabeordner
+        job_id: Auftrags-ID (siehe job_id_for) oder None; fertige Dateien werden im
+            Checkpoint-Log festgehalten und beim nächsten Lauf mit derselben ID übersprungen
+        cancel_event: threading.Event; wenn gesetzt, werden keine neuen Dateien mehr
+            gestartet und wartende Aufträge verworfen
+
+    Returns:
+        Liste der Ergebnisse; fehlgeschlagene Dateien enthalten den Schlüssel 'error',
+        übersprungene Dateien den Schlüssel 'cached' bzw. 'resumed'. Dateien, deren
+        Ausgabename schon vergeben ist (siehe OutputNames), gelten als fehlgeschlagen.
+    """
+    workers = workers or DEFAULT_WORKERS
+    os.makedirs(output_dir, exist_ok=True)
+    cache = ConversionCache(output_dir) if use_cache else None
+    budget = MemoryBudget(memory_budget) if memory_budget else None
+    checkpoint = None
+    if job_id:
+        checkpoint = JobCheckpoint(output_dir, job_id)
+        checkpoint.load()
+
+    results = []
+    cancelled = False
+
+    def collect(done):
+        for future in done:
+            file_path, reserved = futures.pop(future)
+            if budget:
+                budget.release(reserved)
+            if future.cancelled():
+                continue
+            try:
+                stat = future.result()
+                record_result(stat, cache, checkpoint)
+            except Exception as e:
+                stat = {
+                    'filename': os.path.basename(file_path),
+                    'input_path': file_path,
+                    'error': str(e)
+                }
+
+            results.append(stat)
+            if on_result:
+                on_result(stat)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {}
+        names = OutputNames()
+        for file_path in iter_input_files(inputs):
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
+
+            # Gleichnamige Ausgaben würden sich überschreiben
+            try:
+                names.claim(file_path)
+            except ValueError as e:
+                stat = {
+                    'filename': os.path.basename(file_path),
+                    'input_path': file_path,
+                    'error': str(e)
+                }
+                results.append(stat)
+                if on_result:
+                    on_result(stat)
+                continue
+
+            # Im unterbrochenen Auftrag bereits fertig
+            stat = checkpoint.lookup(file_path) if checkpoint else None
+            if stat:
+                record_result(stat, cache, checkpoint)
+                results.append(stat)
+                if on_result:
+                    on_result(stat)
+                continue
+
+            quality, file_lossless = get_encode_settings(
+                file_path, jpg_quality, png_quality, png_lossless, lossless
+            )
+            if cache:
+                stat = cache.lookup(file_path, quality, file_lossless, method, auto, max_dimension, variants)
+                if stat:
+                    results.append(stat)
+                    if on_result:
+                        on_result(stat)
+                    continue
+
+            # Begrenzte Warteschlange: erst neue Aufträge, wenn genug erledigt sind
+            if len(futures) >= workers * PENDING_PER_WORKER:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            # RAM-Budget: warten, bis genug laufende Dateien fertig sind
+            reserved = 0
+            if budget:
+                reserved = _estimate_or_zero(file_path, max_dimension)
+                while not budget.try_acquire(reserved):
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            future = executor.submit(convert_file, file_path, output_dir, quality, file_lossless, method, auto,
+                                     max_dimension, variants)
+            futures[future] = (file_path, reserved)
+
+        while futures:
+            if cancel_event is not None and cancel_event.is_set():
+                # Wartende Aufträge verwerfen, laufende noch abschließen
+                cancelled = True
+                for future in futures:
+                    future.cancel()
+            done, _ = wait(futures, timeout=0.5, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    if cache:
+        cache.save()
+    if variants:
+        write_srcset_manifest(results, output_dir)
+    if checkpoint:
+        if cancelled:
+            checkpoint.close()
+        else:
+            checkpoint.finish()
+
+    return results
+
+
+def _percentile(sorted_values, fraction):
+    """Perzentil nach dem Nearest-Rank-Verfahren aus einer sortierten Liste"""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def stage_timings(stats):
+    """
+    Verteilt die Phasenzeiten aller frisch konvertierten Dateien
+
+    Returns:
+        Pro Phase Anzahl, Summe, p50, p95 und Maximum in Sekunden;
+        leer, wenn keine Zeiten vorliegen
+    """
+    measured = [stat['timings'] for stat in stats
+                if 'timings' in stat and 'error' not in stat and not stat.get('cached')]
+    if not measured:
+        return {}
+
+    histograms = {}
+    for stage in TIMING_STAGES:
+        values = sorted(timings.get(stage, 0.0) for timings in measured)
+        histograms[stage] = {
+            'count': len(values),
+            'total': sum(values),
+            'p50': _percentile(values, 0.50),
+            'p95': _percentile(values, 0.95),
+            'max': values[-1]
+        }
+    return histograms
+
+
+def format_stage_timings(histograms):
+    """Formatiert die Phasenzeiten als Textzeilen für CLI und GUI"""
+    lines = []
+    for stage, label in TIMING_STAGES.items():
+        if stage in histograms:
+            h = histograms[stage]
+            lines.append(
+                f"{label}: p50 {h['p50'] * 1000:.1f} ms, p95 {h['p95'] * 1000:.1f} ms, "
+                f"max {h['max'] * 1000:.1f} ms (gesamt {h['total']:.1f} s)"
+            )
+    return lines
+
+
+def summarize_stats(stats, duration=None):
+    """Fasst eine Liste von Konvertierungsergebnissen zusammen"""
+    converted = [stat for stat in stats if 'error' not in stat]
+    total_original = sum(stat['original_size'] for stat in converted)
+    total_webp = sum(stat['webp_size'] for stat in converted)
+
+    peaks = [stat['peak_rss'] for stat in converted if stat.get('peak_rss') and not stat.get('cached')]
+
+    summary = {
+        'converted': len(converted),
+        'cache_hits': sum(1 for stat in converted if stat.get('cached')),
+        'resumed': sum(1 for stat in converted if stat.get('resumed')),
+        'failed': len(stats) - len(converted),
+        'total_original_size': total_original,
+        'total_webp_size': total_webp,
+        'savings_percent': ((total_original - total_webp) / total_original) * 100 if total_original else 0,
+        'max_peak_rss': max(peaks) if peaks else None,
+        'stage_timings': stage_timings(stats)
+    }
+    if duration is not None:
+        summary['duration'] = duration
+        summary['images_per_second'] = len(converted) / duration if duration > 0 else 0
+
+    return summary
+
+
+def write_stats(stats, path, summary=None, stats_format=None):
+    """
+    Schreibt die Konvertierungsstatistik als JSON oder CSV
+
+    Das Format wird aus der Dateiendung abgeleitet, falls nicht angegeben.
+    """
+    if stats_format is None:
+        stats_format = 'csv' if path.lower().endswith('.csv') else 'json'
+
+    if stats_format == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=STATS_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for stat in stats:
+                # Phasenzeiten als eigene Spalten
+                row = dict(stat)
+                for stage, seconds in stat.get('timings', {}).items():
+                    row[f'time_{stage}'] = seconds
+                writer.writerow(row)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary or summarize_stats(stats), 'files': stats},
+                      f, indent=2, ensure_ascii=False)
+
+
+def build_arg_parser():
+    """Erstellt den Parser für den Kommandozeilenmodus"""
+    parser = argparse.ArgumentParser(
+        description="Konvertiert JPG- und PNG-Bilder nach WebP. Ohne Argumente startet die GUI."
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="Dateien, Ordner oder Glob-Muster (z.B. 'bilder/**/*.jpg')")
+    parser.add_argument('-o', '--output-dir',
+                        help="Ausgabeordner (Standard: webp_konvertiert neben der ersten Datei)")
+    parser.add_argument('-q', '--quality', type=int, default=90,
+                        help="Qualität für JPG-Dateien (Standard: 90)")
+    parser.add_argument('--png-quality', type=int, default=95,
+                        help="Qualität für PNG-Dateien ohne verlustfreie Kompression (Standard: 95)")
+    parser.add_argument('--no-png-lossless', action='store_true',
+                        help="PNG-Dateien verlustbehaftet komprimieren")
+    parser.add_argument('--lossless', action='store_true',
+                        help="Alle Dateien verlustfrei komprimieren")
+    parser.add_argument('-m', '--method', type=int, default=6, choices=range(7), metavar='0-6',
+                        help="WebP-Encoder-Aufwand 0-6 (Standard: 6)")
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Anzahl paralleler Prozesse (Standard: {DEFAULT_WORKERS})")
+    parser.add_argument('--auto', action='store_true',
+                        help="Encoder-Aufwand und Qualität pro Bild automatisch wählen")
+    parser.add_argument('--max-bytes', type=int,
+                        help="Auto-Modus: maximale Dateigröße pro Bild in Bytes")
+    parser.add_argument('--min-ssim', type=float,
+                        help="Auto-Modus: minimale SSIM (z.B. 0.98)")
+    parser.add_argument('--min-psnr', type=float,
+                        help="Auto-Modus: minimaler PSNR in dB (z.B. 40)")
+    parser.add_argument('--time-budget', type=float,
+                        help="Auto-Modus: maximale Kodierzeit pro Bild in Sekunden")
+    parser.add_argument('--max-dimension', type=int,
+                        help="Längste Kante der Ausgabe in Pixeln begrenzen (JPEG wird verkleinert dekodiert)")
+    parser.add_argument('--memory-budget', type=int,
+                        help="Gemeinsames RAM-Budget aller Prozesse in MB")
+    parser.add_argument('--widths',
+                        help="Responsive Varianten in diesen Breiten erzeugen, z.B. '320,640,1280,2560'")
+    parser.add_argument('--avif', action='store_true',
+                        help="Varianten zusätzlich als AVIF speichern (erfordert --widths)")
+    parser.add_argument('--job-id',
+                        help="Auftrags-ID für Checkpoint und Fortsetzung (Standard: aus Eingaben und Einstellungen)")
+    parser.add_argument('--restart', action='store_true',
+                        help="Unterbrochenen Auftrag nicht fortsetzen, sondern neu beginnen")
+    parser.add_argument('--force', action='store_true',
+                        help="Alle Dateien neu konvertieren, auch wenn die WebP-Datei aktuell ist")
+    parser.add_argument('--stats',
+                        help="Statistik in diese Datei schreiben (.json oder .csv)")
+    parser.add_argument('--stats-format', choices=['json', 'csv'],
+                        help="Format der Statistikdatei (Standard: aus Dateiendung)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Keine Ausgabe pro Datei")
+    return parser
+
+
+def main(argv=None):
+    """Kommandozeilenmodus ohne GUI"""
+    args = build_arg_parser().parse_args(argv)
+
+    if not PIL_AVAILABLE:
+        print("FEHLER: Die Pillow-Bibliothek (PIL) ist nicht installiert. pip install Pillow",
+              file=sys.stderr)
+        return 2
+
+    # Ein angegebenes Ziel aktiviert den Auto-Modus
+    auto = {
+        key: value for key, value in (
+            ('max_bytes', args.max_bytes),
+            ('min_ssim', args.min_ssim),
+            ('min_psnr', args.min_psnr),
+            ('max_seconds', args.time_budget)
+        ) if value is not None
+    }
+    if not auto and not args.auto:
+        auto = None
+
+    variants = None
+    if args.widths:
+        try:
+            widths = sorted({int(width) for width in args.widths.split(',') if width.strip()})
+        except ValueError:
+            print("FEHLER: --widths erwartet ganze Zahlen, z.B. 320,640,1280", file=sys.stderr)
+            return 2
+        if not widths or widths[0] <= 0:
+            print("FEHLER: --widths erwartet positive Breiten", file=sys.stderr)
+            return 2
+        variants = {'widths': widths, 'formats': ['webp', 'avif'] if args.avif else ['webp']}
+    elif args.avif:
+        print("FEHLER: --avif erfordert --widths", file=sys.stderr)
+        return 2
+
+    if args.avif and not avif_available():
+        print("FEHLER: Pillow kann kein AVIF schreiben. Pillow >= 11.2 oder pillow-avif-plugin installieren",
+              file=sys.stderr)
+        return 2
+
+    # Dateien werden gestreamt; nur für den Standard-Ausgabeordner wird die erste vorab gesucht
+    output_dir = args.output_dir
+    if not output_dir:
+        first_file = next(iter_input_files(args.inputs), None)
+        if first_file is None:
+            print("Keine Bilder gefunden.", file=sys.stderr)
+            return 1
+        output_dir = os.path.join(os.path.dirname(first_file), "webp_konvertiert")
+
+    # Auftrag: derselbe Aufruf setzt einen abgebrochenen Lauf fort
+    job_settings = {
+        'jpg_quality': args.quality,
+        'png_quality': args.png_quality,
+        'png_lossless': not args.no_png_lossless,
+        'lossless': args.lossless,
+        'method': args.method,
+        'auto': auto,
+        'max_dimension': args.max_dimension,
+        'variants': variants
+    }
+    job_id = args.job_id or job_id_for(args.inputs, output_dir, job_settings)
+    checkpoint = JobCheckpoint(output_dir, job_id)
+    if args.restart:
+        checkpoint.discard()
+    elif checkpoint.exists():
+        print(f"Auftrag {job_id}: setze fort, {checkpoint.load()} Dateien bereits erledigt")
+
+    # Strg+C bricht geordnet ab: laufende Dateien werden fertig, der Checkpoint bleibt
+    cancel_event = threading.Event()
+
+    def request_cancel(signum, frame):
+        if cancel_event.is_set():
+            raise KeyboardInterrupt
+        print("Abbruch angefordert - laufende Dateien werden abgeschlossen...", file=sys.stderr)
+        cancel_event.set()
+
+    previous_handler = signal.signal(signal.SIGINT, request_cancel)
+
+    def print_result(stat):
+        if args.quiet:
+            return
+        if 'error' in stat:
+            print(f"FEHLER bei {stat['filename']}: {stat['error']}", file=sys.stderr)
+        elif stat.get('cached'):
+            print(f"{stat['filename']}: aktuell, übersprungen")
+        elif stat.get('resumed'):
+            print(f"{stat['filename']}: im Auftrag bereits erledigt")
+        else:
+            auto_note = ""
+            if 'auto' in stat:
+                auto_note = f" [auto: q={stat['auto']['quality']}, m={stat['auto']['method']}]"
+            if 'variants' in stat:
+                auto_note += f" [{len(stat['variants'])} Varianten]"
+            print(f"{stat['filename']}: {stat['original_size']} → {stat['webp_size']} Bytes "
+                  f"({stat['savings_percent']:.1f}%){auto_note}")
+
+    start_time = time.time()
+    try:
+        stats = convert_batch(
+            args.inputs,
+            output_dir,
+            jpg_quality=args.quality,
+            png_quality=args.png_quality,
+            png_lossless=not args.no_png_lossless,
+            lossless=args.lossless,
+            workers=args.workers,
+            method=args.method,
+            on_result=print_result,
+            use_cache=not args.force,
+            auto=auto,
+            max_dimension=args.max_dimension,
+            memory_budget=args.memory_budget * 1024 * 1024 if args.memory_budget else None,
+            variants=variants,
+            job_id=job_id,
+            cancel_event=cancel_event
+        )
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+    if cancel_event.is_set():
+        print(f"Abgebrochen nach {len(stats)} Dateien. Fortsetzen mit demselben Aufruf "
+              f"(Auftrag {job_id}).", file=sys.stderr)
+        if args.stats:
+            write_stats(stats, args.stats, summarize_stats(stats, time.time() - start_time), args.stats_format)
+        return 130
+
+    if not stats:
+        print("Keine Bilder gefunden.", file=sys.stderr)
+        return 1
+
+    summary = summarize_stats(stats, time.time() - start_time)
+
+    print(f"Erfolgreich konvertiert: {summary['converted']} Dateien "
+          f"(davon {summary['cache_hits']} aktuell aus Cache, {summary['resumed']} aus dem Checkpoint), "
+          f"fehlgeschlagen: {summary['failed']}, "
+          f"Ersparnis: {summary['savings_percent']:.1f}%, "
+          f"Dauer: {summary['duration']:.1f} Sekunden")
+    if summary['max_peak_rss']:
+        print(f"Max. Speicherbedarf pro Prozess: {summary['max_peak_rss'] / (1024 * 1024):.1f} MB")
+    for line in format_stage_timings(summary['stage_timings']):
+        print(line)
+
+    if args.stats:
+        write_stats(stats, args.stats, summary, args.stats_format)
+
+    return 1 if summary['failed'] else 0
+
+
+def _import_tkinter():
+    """Lädt tkinter in die Modul-Namen tk, ttk, filedialog und messagebox"""
+    global tk, ttk, filedialog, messagebox
+    import tkinter as tk
+    from tkinter import ttk, filedialog, messagebox
+
+
+def run_gui():
+    """Startet die grafische Oberfläche"""
+    _import_tkinter()
+
+    # Wenn Pillow nicht installiert ist, zeige klare Fehlermeldung
+    if not PIL_AVAILABLE:
+        print("\nFEHLER: Die Pillow-Bibliothek (PIL) ist nicht installiert.")
+        print("Dieses Programm benötigt Pillow zur Bildkonvertierung.")
+        print("\nBitte installiere Pillow mit dem folgenden Befehl:")
+        print("pip install Pillow\n")
+
+        # Falls GUI nicht funktioniert, zeige Konsolenmeldung
+        try:
+            root = tk.Tk()
+            app = WebPConverter(root)
+            root.mainloop()
+        except Exception:
+            sys.exit(1)
+    else:
+        # Normale Ausführung
+        root = tk.Tk()
+        app = WebPConverter(root)
+        root.mainloop()
+
 
 class WebPConverter:
     def __init__(self, root):
+        _import_tkinter()
         self.root = root
         self.root.title("WebP Konverter")
         self.root.geometry("700x550")
@@ -23,10 +1579,31 @@ class WebPConverter:
         self.jpg_quality = tk.IntVar(value=90)
         self.png_quality = tk.IntVar(value=95)
         self.use_lossless_for_png = tk.BooleanVar(value=True)
+        self.worker_count = tk.IntVar(value=DEFAULT_WORKERS)
+        self.skip_unchanged = tk.BooleanVar(value=True)
+        self.auto_mode = tk.BooleanVar(value=False)
+        self.auto_target = tk.StringVar(value="Min. SSIM")
+        self.auto_value = tk.StringVar(value="0.98")
+        self.max_dimension = tk.IntVar(value=0)
+        self.memory_budget_mb = tk.IntVar(value=0)
+        self.create_variants = tk.BooleanVar(value=False)
+        self.variant_widths = tk.StringVar(value=", ".join(str(width) for width in DEFAULT_VARIANT_WIDTHS))
+        self.variant_avif = tk.BooleanVar(value=False)
         self.selected_files = []
+        self.selected_folder = None
         self.output_dir = None
         self.conversion_stats = []
 
+        # Zustand der laufenden Konvertierung
+        self._executor = None
+        self._result_queue = queue.Queue()
+        self._cache = None
+        self._variants = None
+        self._checkpoint = None
+        self._cancel_event = threading.Event()
+        self._pending_futures = set()
+        self._pending_lock = threading.Lock()
+
         # Wenn PIL nicht verfügbar ist, zeige Installationshinweis
         if not PIL_AVAILABLE:
             self._show_pil_missing()
@@ -153,6 +1730,110 @@ class WebPConverter:
             variable=self.use_lossless_for_png
         ).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=5)
 
+        # Anzahl paralleler Prozesse
+        ttk.Label(
+            options_frame,
+            text="Parallele Prozesse:"
+        ).grid(row=3, column=0, sticky=tk.W, pady=5)
+
+        ttk.Spinbox(
+            options_frame,
+            from_=1,
+            to=max(DEFAULT_WORKERS * 2, 1),
+            textvariable=self.worker_count,
+            width=5
+        ).grid(row=3, column=1, sticky=tk.W, pady=5)
+
+        # Inkrementelle Konvertierung
+        ttk.Checkbutton(
+            options_frame,
+            text="Unveränderte Bilder überspringen (WebP bereits aktuell)",
+            variable=self.skip_unchanged
+        ).grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=5)
+
+        # Auto-Modus: Encoder-Aufwand und Qualität pro Bild gegen ein Ziel wählen
+        ttk.Checkbutton(
+            options_frame,
+            text="Auto-Modus, Ziel:",
+            variable=self.auto_mode
+        ).grid(row=5, column=0, sticky=tk.W, pady=5)
+
+        auto_frame = ttk.Frame(options_frame)
+        auto_frame.grid(row=5, column=1, columnspan=2, sticky=tk.W, pady=5)
+
+        ttk.Combobox(
+            auto_frame,
+            textvariable=self.auto_target,
+            values=list(AUTO_TARGETS),
+            state="readonly",
+            width=18
+        ).pack(side=tk.LEFT)
+
+        ttk.Entry(
+            auto_frame,
+            textvariable=self.auto_value,
+            width=10
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Speicherbegrenzung: maximale Kantenlänge und gemeinsames RAM-Budget
+        ttk.Label(
+            options_frame,
+            text="Max. Kantenlänge (px):"
+        ).grid(row=6, column=0, sticky=tk.W, pady=5)
+
+        memory_frame = ttk.Frame(options_frame)
+        memory_frame.grid(row=6, column=1, columnspan=2, sticky=tk.W, pady=5)
+
+        ttk.Spinbox(
+            memory_frame,
+            from_=0,
+            to=20000,
+            increment=160,
+            textvariable=self.max_dimension,
+            width=7
+        ).pack(side=tk.LEFT)
+
+        ttk.Label(
+            memory_frame,
+            text="RAM-Budget (MB):"
+        ).pack(side=tk.LEFT, padx=(15, 5))
+
+        ttk.Spinbox(
+            memory_frame,
+            from_=0,
+            to=262144,
+            increment=256,
+            textvariable=self.memory_budget_mb,
+            width=7
+        ).pack(side=tk.LEFT)
+
+        ttk.Label(
+            memory_frame,
+            text="(0 = unbegrenzt)"
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Responsive Varianten: mehrere Breiten (und AVIF) aus einer Dekodierung
+        ttk.Checkbutton(
+            options_frame,
+            text="Varianten, Breiten:",
+            variable=self.create_variants
+        ).grid(row=7, column=0, sticky=tk.W, pady=5)
+
+        variants_frame = ttk.Frame(options_frame)
+        variants_frame.grid(row=7, column=1, columnspan=2, sticky=tk.W, pady=5)
+
+        ttk.Entry(
+            variants_frame,
+            textvariable=self.variant_widths,
+            width=22
+        ).pack(side=tk.LEFT)
+
+        ttk.Checkbutton(
+            variants_frame,
+            text="zusätzlich AVIF",
+            variable=self.variant_avif
+        ).pack(side=tk.LEFT, padx=10)
+
         # Info-Text
         info_text = (
             "Empfohlene Einstellungen für minimalen Qualitätsverlust:\n"
@@ -165,15 +1846,26 @@ class WebPConverter:
             text=info_text,
             wraplength=600,
             justify=tk.LEFT
-        ).grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=10)
+        ).grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=10)
+
+        # Konvertierungs- und Abbruchbutton
+        action_frame = ttk.Frame(main_frame)
+        action_frame.pack(pady=10)
 
-        # Konvertierungsbutton
         self.convert_btn = ttk.Button(
-            main_frame,
+            action_frame,
             text="Konvertieren starten",
             command=self.start_conversion
         )
-        self.convert_btn.pack(pady=10)
+        self.convert_btn.pack(side=tk.LEFT, padx=5)
+
+        self.cancel_btn = ttk.Button(
+            action_frame,
+            text="Abbrechen",
+            command=self.cancel_conversion,
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
 
         # Fortschrittsanzeige
         self.progress_var = tk.DoubleVar()
@@ -215,6 +1907,7 @@ class WebPConverter:
 
         if files:
             self.selected_files = list(files)
+            self.selected_folder = None
             if len(self.selected_files) > 1:
                 self.file_info_label.config(text=f"{len(self.selected_files)} Bilder ausgewählt")
             else:
@@ -225,19 +1918,12 @@ class WebPConverter:
     def select_folder(self):
         folder = filedialog.askdirectory(title="Ordner mit Bildern auswählen")
         if folder:
-            # Dateien im Ordner und Unterordnern suchen
-            image_files = []
-            for root, _, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                        image_files.append(os.path.join(root, file))
-
-            self.selected_files = image_files
-
-            if self.selected_files:
-                self.file_info_label.config(text=f"{len(self.selected_files)} Bilder in Ordner gefunden")
-            else:
-                self.file_info_label.config(text="Keine Bilder im ausgewählten Ordner gefunden")
+            # Der Ordner wird erst beim Start gescannt, die Konvertierung beginnt mit den ersten Funden
+            self.selected_folder = folder
+            self.selected_files = []
+            self.file_info_label.config(
+                text=f"Ordner ausgewählt: {folder} (Bilder werden beim Start gesucht)"
+            )
 
     def set_output_dir(self):
         folder = filedialog.askdirectory(title="Ausgabeordner auswählen")
@@ -246,13 +1932,53 @@ class WebPConverter:
             self.output_dir_label.config(text=f"Ausgabeordner: {folder}")
 
     def start_conversion(self):
-        if not self.selected_files:
+        if not self.selected_files and not self.selected_folder:
             messagebox.showwarning("Keine Dateien", "Bitte wähle zuerst Bilder aus.")
             return
 
+        auto = None
+        if self.auto_mode.get():
+            key, factor = AUTO_TARGETS[self.auto_target.get()]
+            try:
+                value = float(self.auto_value.get().replace(',', '.')) * factor
+            except ValueError:
+                messagebox.showwarning("Ungültiges Ziel", "Bitte gib für den Auto-Modus eine Zahl ein.")
+                return
+            auto = {key: int(value) if key == 'max_bytes' else value}
+
+        try:
+            max_dimension = max(0, int(self.max_dimension.get())) or None
+            memory_budget = max(0, int(self.memory_budget_mb.get())) * 1024 * 1024 or None
+        except (tk.TclError, ValueError):
+            messagebox.showwarning("Ungültige Eingabe", "Kantenlänge und RAM-Budget müssen ganze Zahlen sein.")
+            return
+
+        variants = None
+        if self.create_variants.get():
+            try:
+                widths = sorted({int(width) for width in self.variant_widths.get().split(',') if width.strip()})
+            except ValueError:
+                widths = []
+            if not widths or widths[0] <= 0:
+                messagebox.showwarning("Ungültige Breiten",
+                                       "Bitte gib die Breiten als positive Zahlen an, z.B. 320, 640, 1280.")
+                return
+            formats = ['webp']
+            if self.variant_avif.get():
+                if not avif_available():
+                    messagebox.showwarning("AVIF nicht verfügbar",
+                                           "Pillow kann kein AVIF schreiben.\n"
+                                           "Bitte Pillow >= 11.2 oder pillow-avif-plugin installieren.")
+                    return
+                formats.append('avif')
+            variants = {'widths': widths, 'formats': formats}
+
         # Wenn kein Ausgabeordner festgelegt, automatisch einen im Ordner der ersten Datei erstellen
         if not self.output_dir:
-            first_file_dir = os.path.dirname(self.selected_files[0])
+            if self.selected_folder:
+                first_file_dir = self.selected_folder
+            else:
+                first_file_dir = os.path.dirname(self.selected_files[0])
             self.output_dir = os.path.join(first_file_dir, "webp_konvertiert")
             self.output_dir_label.config(text=f"Ausgabeordner: {self.output_dir}")
 
@@ -264,59 +1990,279 @@ class WebPConverter:
         self.conversion_stats = []
         self.progress_var.set(0)
 
+        # Auftrag: gleiche Auswahl und Einstellungen setzen einen abgebrochenen Lauf fort
+        job_settings = {
+            'jpg_quality': self.jpg_quality.get(),
+            'png_quality': self.png_quality.get(),
+            'png_lossless': self.use_lossless_for_png.get(),
+            'auto': auto,
+            'max_dimension': max_dimension,
+            'variants': variants
+        }
+        job_inputs = [self.selected_folder] if self.selected_folder else self.selected_files
+        self._checkpoint = JobCheckpoint(self.output_dir, job_id_for(job_inputs, self.output_dir, job_settings))
+        if self._checkpoint.exists():
+            done_count = self._checkpoint.load()
+            resume = messagebox.askyesno(
+                "Auftrag fortsetzen",
+                f"Ein abgebrochener Auftrag mit diesen Einstellungen wurde gefunden "
+                f"({done_count} Dateien bereits erledigt).\n\n"
+                f"Fortsetzen? Bei 'Nein' wird von vorn begonnen."
+            )
+            if not resume:
+                self._checkpoint.discard()
+
         # Konvertierung starten
         self.convert_btn.config(state=tk.DISABLED)
-        self.status_label.config(text="Konvertierung läuft...")
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status_label.config(text=f"Konvertierung läuft... (Auftrag {self._checkpoint.job_id})")
+        self._cancel_event = threading.Event()
+        self._pending_futures = set()
+
+        self._found_files = 0
+        self._done_files = 0
+        self._processed = 0
+        self._failed = 0
+        self._cancelled_files = 0
+        self._scan_done = False
+        self._start_time = time.time()
 
-        total_files = len(self.selected_files)
-        processed = 0
-        failed = 0
-
-        start_time = time.time()
+        try:
+            workers = max(1, int(self.worker_count.get()))
+        except (tk.TclError, ValueError):
+            workers = DEFAULT_WORKERS
 
-        for idx, file_path in enumerate(self.selected_files):
-            try:
-                file_name = os.path.basename(file_path)
-                file_ext = os.path.splitext(file_name)[1].lower()
+        self._cache = ConversionCache(self.output_dir) if self.skip_unchanged.get() else None
 
-                # Status Update
-                self.status_label.config(text=f"Konvertiere {file_name}...")
-                self.root.update()  # UI aktualisieren
+        if self.selected_folder:
+            source = scan_image_files(self.selected_folder)
+        else:
+            source = iter(self.selected_files)
 
-                # Qualität und Kompressionseinstellungen basierend auf Dateityp
-                lossless = False
-                quality = self.jpg_quality.get()
+        settings = (
+            self.jpg_quality.get(),
+            self.png_quality.get(),
+            self.use_lossless_for_png.get()
+        )
 
-                if file_ext in ('.png', '.PNG'):
-                    if self.use_lossless_for_png.get():
-                        lossless = True
+        options = {'auto': auto, 'max_dimension': max_dimension, 'variants': variants}
+        self._variants = variants
+        budget = MemoryBudget(memory_budget) if memory_budget else None
+
+        # Scannen und Verteilen laufen in einem Hintergrund-Thread, damit die GUI reagiert
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        threading.Thread(
+            target=self._feed_conversion,
+            args=(source, settings, options, budget, workers * PENDING_PER_WORKER),
+            daemon=True
+        ).start()
+
+        self.root.after(50, self._poll_results)
+
+    def _feed_conversion(self, source, settings, options, budget, max_pending):
+        """
+        Verteilt gefundene Dateien an den Prozesspool (läuft im Hintergrund-Thread)
+
+        Ein Semaphor begrenzt die Zahl offener Aufträge, sodass der Scanner nur so
+        weit vorausläuft, wie die Prozesse Arbeit abnehmen. Mit RAM-Budget wartet
+        jede Datei zusätzlich, bis ihr geschätzter Speicherbedarf frei ist.
+        """
+        slots = threading.BoundedSemaphore(max_pending)
+        names = OutputNames()
+        try:
+            for file_path in source:
+                if self._cancel_event.is_set():
+                    break
+                self._found_files += 1
+
+                # Gleichnamige Ausgaben würden sich überschreiben
+                try:
+                    names.claim(file_path)
+                except ValueError as e:
+                    future = Future()
+                    future.set_exception(e)
+                    self._result_queue.put((file_path, future))
+                    continue
+
+                # Im abgebrochenen Auftrag bereits fertig
+                resumed = self._checkpoint.lookup(file_path)
+                if resumed:
+                    future = Future()
+                    future.set_result(resumed)
+                    self._result_queue.put((file_path, future))
+                    continue
+
+                quality, lossless = get_encode_settings(file_path, *settings)
+
+                # Aktuelle Ergebnisse aus dem Cache direkt als erledigt einreihen
+                cached = self._cache.lookup(file_path, quality, lossless, **options) if self._cache else None
+                if cached:
+                    future = Future()
+                    future.set_result(cached)
+                    self._result_queue.put((file_path, future))
+                    continue
+
+                slots.acquire()
+                reserved = 0
+                if budget:
+                    reserved = _estimate_or_zero(file_path, options['max_dimension'])
+                    budget.acquire(reserved)
+
+                if self._cancel_event.is_set():
+                    slots.release()
+                    if budget:
+                        budget.release(reserved)
+                    future = Future()
+                    future.cancel()
+                    self._result_queue.put((file_path, future))
+                    break
+
+                try:
+                    future = self._executor.submit(
+                        convert_file,
+                        file_path,
+                        self.output_dir,
+                        quality,
+                        lossless,
+                        **options
+                    )
+                except Exception as e:
+                    # Pool nicht mehr nutzbar (oder abgebrochen) - Datei entsprechend melden
+                    slots.release()
+                    if budget:
+                        budget.release(reserved)
+                    future = Future()
+                    if self._cancel_event.is_set():
+                        future.cancel()
                     else:
-                        quality = self.png_quality.get()
-
-                # Datei konvertieren
-                result = self._convert_to_webp(
-                    file_path,
-                    quality=quality,
-                    lossless=lossless
+                        future.set_exception(e)
+                    self._result_queue.put((file_path, future))
+                    continue
+                with self._pending_lock:
+                    self._pending_futures.add(future)
+                future.add_done_callback(
+                    lambda f, path=file_path, amount=reserved: self._on_future_done(
+                        path, f, slots, budget, amount
+                    )
                 )
+        finally:
+            self._scan_done = True
+
+    def _on_future_done(self, file_path, future, slots, budget=None, reserved=0):
+        """Reicht ein fertiges Ergebnis an die GUI weiter und gibt Platz und Speicher frei"""
+        with self._pending_lock:
+            self._pending_futures.discard(future)
+        if budget:
+            budget.release(reserved)
+        self._result_queue.put((file_path, future))
+        slots.release()
+
+    def _poll_results(self):
+        """Übernimmt fertige Ergebnisse aus dem Prozesspool in die GUI"""
+        while True:
+            try:
+                file_path, future = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            file_name = os.path.basename(file_path)
+            if future.cancelled():
+                # Durch Abbruch verworfen - wird beim Fortsetzen konvertiert
+                self._cancelled_files += 1
+                self._done_files += 1
+                continue
 
-                # In GUI anzeigen
-                if result:
-                    self._append_result(result)
-                    processed += 1
-                else:
-                    failed += 1
+            try:
+                stat = future.result()
+                record_result(stat, self._cache, self._checkpoint)
+                self.conversion_stats.append(stat)
+                self._append_result(self._format_result(stat))
+                self._processed += 1
             except Exception as e:
                 self._append_result(f"FEHLER bei {file_name}: {str(e)}")
-                failed += 1
+                self._failed += 1
+
+            self._done_files += 1
+
+        # Fortschritt aktualisieren
+        # Erst den Scan-Status lesen, dann den Zähler - so ist der Zähler nach Scanende final
+        scan_done = self._scan_done
+        found = self._found_files
+        if found:
+            self.progress_var.set((self._done_files / found) * 100)
+
+        scan_state = "" if scan_done else " (Suche läuft...)"
+        if self._cancel_event.is_set():
+            scan_state += " - wird abgebrochen..."
+        self.status_label.config(
+            text=f"Gefunden: {found}{scan_state} / Konvertiert: {self._done_files}"
+        )
+
+        if scan_done and self._done_files >= found:
+            self._finish_conversion()
+        else:
+            self.root.after(50, self._poll_results)
+
+    def cancel_conversion(self):
+        """
+        Bricht die laufende Konvertierung ab
+
+        Wartende Dateien werden verworfen, laufende noch fertig konvertiert.
+        Das Checkpoint-Log bleibt erhalten, sodass der Auftrag beim nächsten
+        Start mit derselben Auswahl fortgesetzt werden kann.
+        """
+        if self._executor is None:
+            return
+        self._cancel_event.set()
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Wird abgebrochen - laufende Dateien werden abgeschlossen...")
+        # Wartende Aufträge selbst verwerfen - shutdown(cancel_futures=True) gibt es erst ab Python 3.9
+        with self._pending_lock:
+            pending = list(self._pending_futures)
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _finish_conversion(self):
+        """Beendet den Prozesspool und zeigt die Zusammenfassung an"""
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        self.cancel_btn.config(state=tk.DISABLED)
+
+        cancelled = self._cancel_event.is_set()
+        job_id = self._checkpoint.job_id
+        resumed = self._checkpoint.resumed
+        try:
+            if cancelled:
+                self._checkpoint.close()
+            else:
+                self._checkpoint.finish()
+        except OSError as e:
+            self._append_result(f"FEHLER beim Abschließen des Checkpoints: {str(e)}")
+        self._checkpoint = None
+
+        cache_hits = 0
+        if self._cache:
+            cache_hits = self._cache.hits
+            try:
+                self._cache.save()
+            except OSError as e:
+                self._append_result(f"FEHLER beim Speichern des Manifests: {str(e)}")
+            self._cache = None
+
+        if self._variants:
+            try:
+                manifest_path = write_srcset_manifest(self.conversion_stats, self.output_dir)
+                self._append_result(f"srcset-Manifest: {manifest_path}")
+            except OSError as e:
+                self._append_result(f"FEHLER beim Schreiben des srcset-Manifests: {str(e)}")
 
-            # Fortschritt aktualisieren
-            progress = ((idx + 1) / total_files) * 100
-            self.progress_var.set(progress)
-            self.root.update()  # UI aktualisieren
+        processed = self._processed
+        failed = self._failed
+        total_files = self._found_files
 
         # Abschluss
-        duration = time.time() - start_time
+        duration = time.time() - self._start_time
 
         # Zusammenfassung berechnen
         if self.conversion_stats:
@@ -330,6 +2276,8 @@ class WebPConverter:
                 summary = (
                     f"\n--- ZUSAMMENFASSUNG ---\n"
                     f"Erfolgreich konvertiert: {processed} Dateien\n"
+                    f"Davon unverändert übersprungen: {cache_hits} Dateien\n"
+                    f"Davon aus abgebrochenem Auftrag übernommen: {resumed} Dateien\n"
                     f"Fehlgeschlagen: {failed} Dateien\n"
                     f"Ursprüngliche Größe gesamt: {self._format_size(total_original)}\n"
                     f"WebP Größe gesamt: {self._format_size(total_webp)}\n"
@@ -337,11 +2285,33 @@ class WebPConverter:
                     f"Dauer: {duration:.1f} Sekunden"
                 )
 
+                peaks = [stat['peak_rss'] for stat in self.conversion_stats
+                         if stat.get('peak_rss') and not stat.get('cached')]
+                if peaks:
+                    summary += f"\nMax. Speicherbedarf pro Prozess: {self._format_size(max(peaks))}"
+
+                timing_lines = format_stage_timings(stage_timings(self.conversion_stats))
+                if timing_lines:
+                    summary += "\n\nZeit pro Datei und Phase:\n" + "\n".join(timing_lines)
+
                 self._append_result(summary)
 
-        self.status_label.config(text=f"Fertig! {processed} Bilder konvertiert, {failed} fehlgeschlagen.")
         self.convert_btn.config(state=tk.NORMAL)
 
+        if cancelled:
+            self.status_label.config(
+                text=f"Abgebrochen: {processed} Bilder konvertiert, {failed} fehlgeschlagen."
+            )
+            messagebox.showinfo(
+                "Konvertierung abgebrochen",
+                f"{processed} Bilder wurden konvertiert, {self._cancelled_files} verworfen.\n"
+                f"Ein erneuter Start mit derselben Auswahl und denselben Einstellungen "
+                f"setzt den Auftrag {job_id} fort."
+            )
+            return
+
+        self.status_label.config(text=f"Fertig! {processed} Bilder konvertiert, {failed} fehlgeschlagen.")
+
         # Erfolgsbenachrichtigung
         messagebox.showinfo(
             "Konvertierung abgeschlossen",
@@ -349,66 +2319,36 @@ class WebPConverter:
             f"Ergebnisse wurden im Ordner gespeichert:\n{self.output_dir}"
         )
 
-    def _convert_to_webp(self, input_path, quality=90, lossless=False):
-        try:
-            # Bild öffnen
-            img = Image.open(input_path)
-
-            # Ausgabepfad bestimmen
-            filename = os.path.splitext(os.path.basename(input_path))[0]
-            output_path = os.path.join(self.output_dir, f"{filename}.webp")
-
-            # Optimierte Speicheroptionen
-            save_options = {
-                'format': 'WEBP',
-                'method': 6,  # 0-6, 6 ist die höchste Kompression (langsamer)
-            }
+    def _format_result(self, stat):
+        """Formatiert das Ergebnis einer Konvertierung als Textzeile"""
+        if stat.get('cached'):
+            return f"{stat['filename']}: aktuell, übersprungen"
+        if stat.get('resumed'):
+            return f"{stat['filename']}: im Auftrag bereits erledigt"
 
-            # Lossless oder Qualität je nach Einstellung
-            if lossless:
-                save_options['lossless'] = True
-            else:
-                save_options['quality'] = quality
+        original_size = stat['original_size']
+        webp_size = stat['webp_size']
+        savings_percent = stat['savings_percent']
 
-            # Speichern
-            img.save(output_path, **save_options)
-
-            # Größenvergleich
-            original_size = os.path.getsize(input_path)
-            webp_size = os.path.getsize(output_path)
-
-            # Prozentuale Einsparung berechnen
-            if original_size > 0:
-                savings_percent = ((original_size - webp_size) / original_size) * 100
-            else:
-                savings_percent = 0
-
-            # Größensparung für positive oder negative Werte
-            if webp_size < original_size:
-                size_change = f"Ersparnis: {self._format_size(original_size - webp_size)} ({savings_percent:.1f}%)"
-            else:
-                size_change = f"Zunahme: {self._format_size(webp_size - original_size)} ({-savings_percent:.1f}%)"
-
-            # Statistik speichern
-            stat = {
-                'filename': os.path.basename(input_path),
-                'original_size': original_size,
-                'webp_size': webp_size,
-                'savings_percent': savings_percent
-            }
-            self.conversion_stats.append(stat)
-
-            # Ergebnistext formatieren
-            result = (
-                f"{os.path.basename(input_path)}: "
-                f"{self._format_size(original_size)} → {self._format_size(webp_size)} "
-                f"({size_change})"
-            )
-
-            return result
-
-        except Exception as e:
-            return None
+        # Größensparung für positive oder negative Werte
+        if webp_size < original_size:
+            size_change = f"Ersparnis: {self._format_size(original_size - webp_size)} ({savings_percent:.1f}%)"
+        else:
+            size_change = f"Zunahme: {self._format_size(webp_size - original_size)} ({-savings_percent:.1f}%)"
+
+        # Vom Auto-Modus gewählte Einstellungen
+        auto_note = ""
+        if 'auto' in stat:
+            auto_note = f" [auto: Qualität {stat['auto']['quality']}, Methode {stat['auto']['method']}]"
+        if 'variants' in stat:
+            auto_note += f" [{len(stat['variants'])} Varianten]"
+
+        # Ergebnistext formatieren
+        return (
+            f"{stat['filename']}: "
+            f"{self._format_size(original_size)} → {self._format_size(webp_size)} "
+            f"({size_change}){auto_note}"
+        )
 
     def _format_size(self, size_bytes):
         """Formatiert Bytes in lesbare Größe (KB, MB)"""
@@ -427,22 +2367,9 @@ class WebPConverter:
 
 
 if __name__ == "__main__":
-    # Wenn Pillow nicht installiert ist, zeige klare Fehlermeldung
-    if not PIL_AVAILABLE:
-        print("\nFEHLER: Die Pillow-Bibliothek (PIL) ist nicht installiert.")
-        print("Dieses Programm benötigt Pillow zur Bildkonvertierung.")
-        print("\nBitte installiere Pillow mit dem folgenden Befehl:")
-        print("pip install Pillow\n")
+    # Mit Argumenten: Kommandozeilenmodus ohne GUI
+    if len(sys.argv) > 1:
+        sys.exit(main())
 
-        # Falls GUI nicht funktioniert, zeige Konsolenmeldung
-        try:
-            root = tk.Tk()
-            app = WebPConverter(root)
-            root.mainloop()
-        except Exception:
-            sys.exit(1)
-    else:
-        # Normale Ausführung
-        root = tk.Tk()
-        app = WebPConverter(root)
-        root.mainloop()
\ No newline at end of file
+    # Ohne Argumente: grafische Oberfläche
+    run_gui()
\ No newline at end of file
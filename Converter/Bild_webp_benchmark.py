@@ -0,0 +1,352 @@
+"""
+Benchmark für den WebP-Konverter (Bild_webp.py)
+
+Erzeugt einen reproduzierbaren synthetischen Bildbestand (JPG/PNG, verschiedene
+Größen, mit und ohne Transparenz, foto- und grafikartige Inhalte) und misst die
+Konvertierung über mehrere Prozesszahlen und Encoder-Einstellungen.
+
+Beispiele:
+    python Bild_webp_benchmark.py --workers 1,2,4 --output ergebnis.json
+    python Bild_webp_benchmark.py --baseline baseline.json
+    python Bild_webp_benchmark.py --save-baseline baseline.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from Bild_webp import DEFAULT_WORKERS, PIL_AVAILABLE, convert_batch, summarize_stats
+
+if PIL_AVAILABLE:
+    import PIL
+    from PIL import Image, ImageDraw, ImageFilter
+
+# Version des Bildbestands - bei Änderungen am Generator erhöhen
+CORPUS_VERSION = 1
+
+# Bildgrößen des Bestands (Breite, Höhe) vor Skalierung mit --scale
+CORPUS_SIZES = [(320, 240), (800, 600), (1280, 720), (1920, 1080), (2400, 1600), (600, 900)]
+
+# Encoder-Einstellungen, die gemessen werden können
+BENCH_PROFILES = {
+    'default': {'jpg_quality': 90, 'png_quality': 95, 'png_lossless': True, 'method': 6},
+    'fast': {'jpg_quality': 90, 'png_quality': 95, 'png_lossless': True, 'method': 2},
+    'lossy': {'jpg_quality': 80, 'png_quality': 80, 'png_lossless': False, 'method': 4},
+    'lossless': {'jpg_quality': 90, 'png_quality': 95, 'png_lossless': True, 'method': 6, 'lossless': True},
+    'auto': {'jpg_quality': 90, 'png_quality': 95, 'png_lossless': True, 'method': 6,
+             'auto': {'min_ssim': 0.98}}
+}
+
+# Kennzahlen für den Vergleich mit einer Baseline: True = höher ist besser
+BENCH_METRICS = {
+    'images_per_second': True,
+    'mb_per_second': True,
+    'peak_rss': False,
+    'compression_ratio': False
+}
+
+
+def _random_bytes(rng, count):
+    """Reproduzierbare Zufallsbytes (wie Random.randbytes, das es erst ab Python 3.9 gibt)"""
+    return rng.getrandbits(count * 8).to_bytes(count, 'little')
+
+
+def _photo_image(rng, size):
+    """Fotoähnliches Bild: weiche Farbverläufe mit Rauschen"""
+    width, height = size
+    # Grobes Zufallsraster hochskaliert ergibt weiche Flächen
+    coarse = Image.frombytes('RGB', (8, 6), _random_bytes(rng, 8 * 6 * 3))
+    img = coarse.resize(size, Image.BICUBIC)
+
+    noise = Image.frombytes('L', size, _random_bytes(rng, width * height))
+    noise = noise.filter(ImageFilter.GaussianBlur(1))
+    return Image.blend(img, Image.merge('RGB', (noise, noise, noise)), 0.25)
+
+
+def _graphic_image(rng, size):
+    """Grafikähnliches Bild: einfarbige Flächen, Linien und Formen"""
+    width, height = size
+    img = Image.new('RGB', size, tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        box = sorted(rng.randrange(width) for _ in range(2)), sorted(rng.randrange(height) for _ in range(2))
+        shape = [box[0][0], box[1][0], box[0][1], box[1][1]]
+        color = tuple(rng.randrange(256) for _ in range(3))
+        kind = rng.randrange(3)
+        if kind == 0:
+            draw.rectangle(shape, fill=color)
+        elif kind == 1:
+            draw.ellipse(shape, fill=color)
+        else:
+            draw.line(shape, fill=color, width=rng.randrange(1, 8))
+    return img
+
+
+def _alpha_mask(rng, size):
+    """Transparenzmaske mit Verlauf und ausgeschnittenen Formen"""
+    width, height = size
+    mask = Image.linear_gradient('L').resize(size)
+    draw = ImageDraw.Draw(mask)
+    for _ in range(10):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randrange(10, max(11, min(size) // 4))
+        draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=0)
+    return mask
+
+
+def generate_corpus(folder, count=24, seed=0, scale=1.0):
+    """
+    Erzeugt einen reproduzierbaren Bildbestand im angegebenen Ordner
+
+    Gleiche Parameter ergeben auf derselben Pillow-Version dieselben Dateien.
+
+    Args:
+        folder: Zielordner (wird angelegt)
+        count: Anzahl der Bilder
+        seed: Startwert des Zufallsgenerators
+        scale: Faktor für die Bildgrößen
+
+    Returns:
+        Beschreibung des Bestands (Parameter, Dateianzahl, Gesamtgröße, Prüfsumme)
+    """
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(seed)
+    digest = hashlib.blake2b(digest_size=16)
+    total_size = 0
+
+    for index in range(count):
+        width, height = CORPUS_SIZES[index % len(CORPUS_SIZES)]
+        size = (max(16, int(width * scale)), max(16, int(height * scale)))
+
+        # Reihum: Foto als JPG, Grafik als PNG, Foto mit Transparenz als PNG
+        kind = index % 3
+        if kind == 0:
+            path = os.path.join(folder, f"foto_{index:03d}.jpg")
+            _photo_image(rng, size).save(path, format='JPEG', quality=92)
+        elif kind == 1:
+            path = os.path.join(folder, f"grafik_{index:03d}.png")
+            _graphic_image(rng, size).save(path, format='PNG')
+        else:
+            path = os.path.join(folder, f"alpha_{index:03d}.png")
+            img = _photo_image(rng, size)
+            img.putalpha(_alpha_mask(rng, size))
+            img.save(path, format='PNG')
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest.update(os.path.basename(path).encode('utf-8'))
+        digest.update(data)
+        total_size += len(data)
+
+    return {
+        'version': CORPUS_VERSION,
+        'count': count,
+        'seed': seed,
+        'scale': scale,
+        'total_size': total_size,
+        'hash': digest.hexdigest()
+    }
+
+
+def run_benchmark(corpus_dir, corpus_size, workers, profile, repeat=1):
+    """
+    Misst eine Kombination aus Prozesszahl und Encoder-Einstellung
+
+    Bei mehreren Wiederholungen zählt der schnellste Durchlauf.
+
+    Returns:
+        Kennzahlen der Messung
+    """
+    settings = BENCH_PROFILES[profile]
+    best = None
+
+    for _ in range(repeat):
+        output_dir = tempfile.mkdtemp(prefix="webp_bench_")
+        try:
+            start_time = time.perf_counter()
+            stats = convert_batch([corpus_dir], output_dir, workers=workers, use_cache=False, **settings)
+            duration = time.perf_counter() - start_time
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        if best is None or duration < best[0]:
+            best = (duration, stats)
+
+    duration, stats = best
+    summary = summarize_stats(stats, duration)
+    if summary['failed']:
+        errors = [stat['error'] for stat in stats if 'error' in stat]
+        raise RuntimeError(f"{summary['failed']} Dateien fehlgeschlagen, z.B.: {errors[0]}")
+
+    return {
+        'name': f"{profile}-w{workers}",
+        'profile': profile,
+        'workers': workers,
+        'images': summary['converted'],
+        'duration': duration,
+        'images_per_second': summary['images_per_second'],
+        'mb_per_second': corpus_size / (1024 * 1024) / duration if duration > 0 else 0,
+        'peak_rss': summary['max_peak_rss'],
+        'compression_ratio': (summary['total_webp_size'] / summary['total_original_size']
+                              if summary['total_original_size'] else None),
+        'stage_timings': summary['stage_timings']
+    }
+
+
+def compare_with_baseline(report, baseline, tolerance=5.0):
+    """
+    Vergleicht die Ergebnisse mit einer gespeicherten Baseline
+
+    Args:
+        report: Aktueller Bericht
+        baseline: Bericht der Baseline
+        tolerance: Erlaubte Verschlechterung in Prozent
+
+    Returns:
+        Liste der Vergleiche; 'regression' ist True, wenn eine Kennzahl schlechter
+        als die Toleranz ist
+    """
+    previous = {result['name']: result for result in baseline.get('results', [])}
+    comparisons = []
+
+    for result in report['results']:
+        old = previous.get(result['name'])
+        if old is None:
+            continue
+
+        for metric, higher_is_better in BENCH_METRICS.items():
+            new_value, old_value = result.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+
+            change = (new_value - old_value) / old_value * 100
+            worse = -change if higher_is_better else change
+            comparisons.append({
+                'name': result['name'],
+                'metric': metric,
+                'baseline': old_value,
+                'current': new_value,
+                'change_percent': change,
+                'regression': worse > tolerance
+            })
+
+    return comparisons
+
+
+def build_arg_parser():
+    """Erstellt den Parser für die Kommandozeile"""
+    parser = argparse.ArgumentParser(
+        description="Misst die WebP-Konvertierung auf einem reproduzierbaren synthetischen Bildbestand."
+    )
+    parser.add_argument('--workers', default=f"1,{DEFAULT_WORKERS}",
+                        help=f"Prozesszahlen, kommagetrennt (Standard: 1,{DEFAULT_WORKERS})")
+    parser.add_argument('--profiles', default="default,fast",
+                        help=f"Encoder-Einstellungen, kommagetrennt: {', '.join(BENCH_PROFILES)} "
+                             "(Standard: default,fast)")
+    parser.add_argument('--count', type=int, default=24,
+                        help="Anzahl der Bilder im Bestand (Standard: 24)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Startwert für den Bildgenerator (Standard: 0)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Faktor für die Bildgrößen (Standard: 1.0)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Wiederholungen pro Messung, der schnellste Lauf zählt (Standard: 3)")
+    parser.add_argument('--corpus-dir',
+                        help="Bestand in diesem Ordner erzeugen und behalten (Standard: temporär)")
+    parser.add_argument('--output',
+                        help="Bericht als JSON in diese Datei schreiben (Standard: stdout)")
+    parser.add_argument('--baseline',
+                        help="Mit diesem gespeicherten Bericht vergleichen")
+    parser.add_argument('--save-baseline',
+                        help="Bericht zusätzlich als Baseline in diese Datei schreiben")
+    parser.add_argument('--tolerance', type=float, default=5.0,
+                        help="Erlaubte Verschlechterung gegenüber der Baseline in Prozent (Standard: 5)")
+    return parser
+
+
+def main(argv=None):
+    """Führt den Benchmark aus; Rückgabewert 1 bei Verschlechterung gegenüber der Baseline"""
+    args = build_arg_parser().parse_args(argv)
+
+    if not PIL_AVAILABLE:
+        print("FEHLER: Die Pillow-Bibliothek (PIL) ist nicht installiert. pip install Pillow",
+              file=sys.stderr)
+        return 2
+
+    try:
+        worker_counts = sorted({int(value) for value in args.workers.split(',') if value.strip()})
+    except ValueError:
+        print("FEHLER: --workers erwartet ganze Zahlen, z.B. 1,2,4", file=sys.stderr)
+        return 2
+    profiles = [value.strip() for value in args.profiles.split(',') if value.strip()]
+    unknown = [profile for profile in profiles if profile not in BENCH_PROFILES]
+    if unknown:
+        print(f"FEHLER: Unbekannte Einstellungen: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    corpus_dir = args.corpus_dir or tempfile.mkdtemp(prefix="webp_corpus_")
+    try:
+        corpus = generate_corpus(corpus_dir, args.count, args.seed, args.scale)
+
+        results = []
+        for profile in profiles:
+            for workers in worker_counts:
+                result = run_benchmark(corpus_dir, corpus['total_size'], workers, profile, args.repeat)
+                results.append(result)
+                print(f"{result['name']}: {result['images_per_second']:.1f} Bilder/s, "
+                      f"{result['mb_per_second']:.2f} MB/s, "
+                      f"Kompression {result['compression_ratio']:.3f}", file=sys.stderr)
+    finally:
+        if not args.corpus_dir:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'pillow': PIL.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'corpus': corpus,
+        'repeat': args.repeat,
+        'results': results
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        # Nur Messungen auf demselben Bestand sind vergleichbar
+        if baseline.get('corpus', {}).get('hash') != corpus['hash']:
+            print("WARNUNG: Die Baseline wurde mit einem anderen Bildbestand erstellt.", file=sys.stderr)
+
+        report['comparison'] = compare_with_baseline(report, baseline, args.tolerance)
+        regressions = [entry for entry in report['comparison'] if entry['regression']]
+        for entry in regressions:
+            print(f"VERSCHLECHTERUNG {entry['name']} {entry['metric']}: "
+                  f"{entry['baseline']:.4g} → {entry['current']:.4g} ({entry['change_percent']:+.1f}%)",
+                  file=sys.stderr)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(output)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
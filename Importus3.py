@@ -1,19 +1,172 @@
+import time
+
+# Startzeitpunkt für --profile-startup (vor allen weiteren Importen)
+_MODULE_LOAD_START = time.perf_counter()
+
 import importlib
+import importlib.util
 import subprocess
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import bisect
 import json
 import os
 from typing import List, Dict, Any, Set, Optional
-import pkg_resources
 import platform
 import webbrowser
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+def _load_importus_core():
+    """
+    Lädt das mit der Web-App geteilte Modul importus_core über seinen Dateipfad
+
+    Importus_web kommt bewusst nicht auf sys.path: app.py, Import_test.py usw.
+    würden sonst echte Top-Level-Module verdecken und die find_spec-Prüfungen
+    verfälschen.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Importus_web", "importus_core.py")
+    module = sys.modules.get("importus_core")
+    if module is not None and os.path.abspath(getattr(module, "__file__", "")) == path:
+        return module
+    spec = importlib.util.spec_from_file_location("importus_core", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["importus_core"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Katalog, Suche, Distributionsindex und PyPI-Client teilt sich die Desktop-App mit der Web-App
+_core = _load_importus_core()
+CATALOG_FILE = _core.CATALOG_FILE
+IMPORT_CHECK_TIMEOUT = _core.IMPORT_CHECK_TIMEOUT
+IMPORT_CHECK_WORKERS = _core.IMPORT_CHECK_WORKERS
+PyPIError = _core.PyPIError
+SearchHit = _core.SearchHit
+SearchIndex = _core.SearchIndex
+distribution_index = _core.distribution_index
+load_catalog = _core.load_catalog
+normalize_distribution_name = _core.normalize_distribution_name
+pypi_client = _core.pypi_client
+
+# Anzahl der langsamsten Importe, die pro Modul aus -X importtime übernommen werden
+IMPORT_PROFILE_TOP = 15
+
+
+# Verzögert geladene Module mit ihrer Ladezeit in Sekunden
+_lazy_modules = {}
+_lazy_load_times = {}
+
+
+def lazy_import(module_name: str):
+    """
+    Importiert ein Modul erst beim ersten Aufruf
+
+    Schwere Bibliotheken wie matplotlib werden so nicht schon beim Programmstart
+    geladen, sondern erst, wenn sie gebraucht werden. Die Ladezeit wird für
+    --profile-startup festgehalten.
+
+    Args:
+        module_name: Vollständiger Modulname (z.B. "matplotlib.pyplot")
+
+    Returns:
+        Das importierte Modul
+    """
+    module = _lazy_modules.get(module_name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        _lazy_load_times[module_name] = time.perf_counter() - start
+        _lazy_modules[module_name] = module
+    return module
+
+
+class StartupProfile:
+    """
+    Misst die Phasen des Programmstarts bis zum ersten sichtbaren Fenster (--profile-startup)
+    """
+
+    def __init__(self, start: float):
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, phase: str) -> None:
+        """
+        Schließt eine Phase ab
+
+        Args:
+            phase: Beschriftung der Phase
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self) -> str:
+        """
+        Erstellt den Bericht mit allen Phasen und den bis dahin verzögert geladenen Modulen
+
+        Returns:
+            Mehrzeiliger Text
+        """
+        lines = ["Startzeit-Profil:"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<28} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'Gesamt bis erstes Fenster':<28} {(self.last - self.start) * 1000:8.1f} ms")
+
+        deferred = ["matplotlib.pyplot", "matplotlib.backends.backend_tkagg"]
+        not_loaded = [name for name in deferred if name not in _lazy_modules]
+        if not_loaded:
+            lines.append(f"  Noch nicht geladen (verzögert): {', '.join(not_loaded)}")
+        for name, seconds in _lazy_load_times.items():
+            lines.append(f"  Verzögert geladen: {name} ({seconds * 1000:.1f} ms)")
+        return "\n".join(lines)
+
+
+# Wartezeit nach dem letzten Tastendruck und Trefferzahl der Live-Suche
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_UI_LIMIT = 10000
+
+
+class IncrementalSearch:
+    """
+    Live-Suche, die eine verlängerte Anfrage nur auf den vorherigen Treffern ausführt
+
+    Nicht threadsicher: alle Aufrufe müssen aus demselben Thread kommen.
+    """
+
+    def __init__(self, index: SearchIndex):
+        self.index = index
+        self._text = None
+        self._doc_ids = None
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Sucht und merkt sich die vollständige Treffermenge für den nächsten Tastendruck
+
+        Args:
+            query: Suchanfrage
+            limit: Höchstzahl an Treffern (None: alle)
+
+        Returns:
+            Nach Relevanz sortierte Treffer
+        """
+        text = query.strip().lower()
+        candidates = None
+        if self._text and text.startswith(self._text):
+            candidates = self._doc_ids
+
+        scores, complete = self.index.match(text, candidates)
+        if complete:
+            # Das Punkte-Dictionary dient direkt als Kandidatenmenge
+            self._text, self._doc_ids = text, scores
+        else:
+            self._text, self._doc_ids = None, None
+        return self.index.top_hits(scores, limit)
 
 
 class ModuleData:
@@ -21,426 +174,17 @@ class ModuleData:
     Klasse zur Verwaltung der Modul-Datenbank
     """
 
-    def __init__(self):
+    def __init__(self, catalog_path: str = CATALOG_FILE):
+        catalog = load_catalog(catalog_path)
+        # Inhalts-Hash des Katalogs
+        self.version = catalog["version"]
         # Dictionary mit Modulinformationen, kategorisiert
-        self.modules_by_category = {
-            "Frontend": [
-                {"name": "Tkinter", "description": "Builtin GUI Toolkit",
-                 "doc_url": "https://docs.python.org/3/library/tkinter.html"},
-                {"name": "PyQt5", "description": "Python-Bindings für Qt5",
-                 "doc_url": "https://www.riverbankcomputing.com/static/Docs/PyQt5/"},
-                {"name": "PySide2", "description": "Offizielle Qt-Bindings",
-                 "doc_url": "https://doc.qt.io/qtforpython/"},
-                {"name": "Kivy", "description": "Framework für Multi-Touch UIs",
-                 "doc_url": "https://kivy.org/doc/stable/"},
-                {"name": "wxPython", "description": "Native GUI (Wrapper für wxWidgets)",
-                 "doc_url": "https://wxpython.org/Phoenix/docs/html/"},
-                {"name": "PySimpleGUI", "description": "Einfacher GUI Wrapper",
-                 "doc_url": "https://pysimplegui.readthedocs.io/"},
-                {"name": "DearPyGui", "description": "GPU-beschleunigte GUI",
-                 "doc_url": "https://dearpygui.readthedocs.io/en/latest/"},
-                {"name": "Toga", "description": "Native GUI für BeeWare",
-                 "doc_url": "https://toga.readthedocs.io/en/latest/"},
-                {"name": "PyGame", "description": "Game- und Multimedia-Framework",
-                 "doc_url": "https://www.pygame.org/docs/"},
-                {"name": "CustomTkinter", "description": "Modern UI elements for tkinter",
-                 "doc_url": "https://github.com/TomSchimansky/CustomTkinter"},
-                {"name": "ttkbootstrap", "description": "Themed tkinter widgets",
-                 "doc_url": "https://ttkbootstrap.readthedocs.io/"},
-                {"name": "Flexx", "description": "Pure Python UI toolkit", "doc_url": "https://flexx.readthedocs.io/"},
-                {"name": "PySide6", "description": "Qt for Python (official)",
-                 "doc_url": "https://doc.qt.io/qtforpython/"},
-                {"name": "PyGObject", "description": "GTK+ 3 bindings for Python",
-                 "doc_url": "https://pygobject.readthedocs.io/"},
-                {"name": "Eel", "description": "HTML/JS GUI für Python", "doc_url": "https://github.com/ChrisKnott/Eel"}
-            ],
-            "Backend": [
-                {"name": "Django", "description": "High-Level Webframework",
-                 "doc_url": "https://docs.djangoproject.com/en/stable/"},
-                {"name": "Flask", "description": "Lightweight web framework",
-                 "doc_url": "https://flask.palletsprojects.com/"},
-                {"name": "FastAPI", "description": "Modern, fast web framework",
-                 "doc_url": "https://fastapi.tiangolo.com/"},
-                {"name": "Tornado", "description": "Asynchronous networking library",
-                 "doc_url": "https://www.tornadoweb.org/"},
-                {"name": "Pyramid", "description": "Flexible web framework", "doc_url": "https://trypyramid.com/"},
-                {"name": "Sanic", "description": "Async web framework", "doc_url": "https://sanic.readthedocs.io/"},
-                {"name": "Falcon", "description": "API framework for building microservices",
-                 "doc_url": "https://falconframework.org/"},
-                {"name": "aiohttp", "description": "Async HTTP client/server", "doc_url": "https://docs.aiohttp.org/"},
-                {"name": "Bottle", "description": "Simple WSGI web framework", "doc_url": "https://bottlepy.org/"},
-                {"name": "CherryPy", "description": "Object-oriented web framework",
-                 "doc_url": "https://cherrypy.org/"},
-                {"name": "Quart", "description": "Asynchrones Flask", "doc_url": "https://pgjones.gitlab.io/quart/"},
-                {"name": "Starlette", "description": "Lightweight ASGI framework",
-                 "doc_url": "https://www.starlette.io/"},
-                {"name": "Responder", "description": "Familiar HTTP Service Framework",
-                 "doc_url": "https://github.com/taoufik07/responder"},
-                {"name": "Masonite", "description": "Developer-centric Python web framework",
-                 "doc_url": "https://docs.masoniteproject.com/"},
-                {"name": "TurboGears", "description": "Web framework with best library approach",
-                 "doc_url": "https://turbogears.org/"}
-            ],
-            "Web": [
-                {"name": "requests", "description": "HTTP library", "doc_url": "https://requests.readthedocs.io/"},
-                {"name": "Beautiful Soup", "description": "HTML/XML parser",
-                 "doc_url": "https://www.crummy.com/software/BeautifulSoup/"},
-                {"name": "Selenium", "description": "Browser automation",
-                 "doc_url": "https://selenium-python.readthedocs.io/"},
-                {"name": "httpx", "description": "Next-gen HTTP client", "doc_url": "https://www.python-httpx.org/"},
-                {"name": "Scrapy", "description": "Web crawling framework", "doc_url": "https://scrapy.org/"},
-                {"name": "lxml", "description": "XML and HTML processing", "doc_url": "https://lxml.de/"},
-                {"name": "urllib3", "description": "HTTP client", "doc_url": "https://urllib3.readthedocs.io/"},
-                {"name": "html5lib", "description": "Standards-compliant HTML parser",
-                 "doc_url": "https://html5lib.readthedocs.io/"},
-                {"name": "MechanicalSoup", "description": "Automate interaction with websites",
-                 "doc_url": "https://mechanicalsoup.readthedocs.io/"},
-                {"name": "pyppeteer", "description": "Puppeteer Python port",
-                 "doc_url": "https://pyppeteer.github.io/pyppeteer/"},
-                {"name": "playwright", "description": "Browser automation",
-                 "doc_url": "https://playwright.dev/python/"},
-                {"name": "parsel", "description": "HTML/XML data extraction library",
-                 "doc_url": "https://parsel.readthedocs.io/"},
-                {"name": "Werkzeug", "description": "WSGI web application library",
-                 "doc_url": "https://werkzeug.palletsprojects.com/"},
-                {"name": "uvicorn", "description": "ASGI web server", "doc_url": "https://www.uvicorn.org/"},
-                {"name": "gunicorn", "description": "WSGI HTTP Server", "doc_url": "https://gunicorn.org/"}
-            ],
-            "Tooling": [
-                {"name": "pytest", "description": "Testing framework", "doc_url": "https://docs.pytest.org/"},
-                {"name": "tox", "description": "Automate testing", "doc_url": "https://tox.readthedocs.io/"},
-                {"name": "black", "description": "Code formatter", "doc_url": "https://black.readthedocs.io/"},
-                {"name": "flake8", "description": "Linting tool", "doc_url": "https://flake8.pycqa.org/"},
-                {"name": "mypy", "description": "Static type checker", "doc_url": "https://mypy.readthedocs.io/"},
-                {"name": "pipenv", "description": "Dependency management", "doc_url": "https://pipenv.pypa.io/"},
-                {"name": "poetry", "description": "Dependency management", "doc_url": "https://python-poetry.org/"},
-                {"name": "isort", "description": "Import sorter", "doc_url": "https://pycqa.github.io/isort/"},
-                {"name": "bandit", "description": "Security linter", "doc_url": "https://bandit.readthedocs.io/"},
-                {"name": "pre-commit", "description": "Git hooks framework", "doc_url": "https://pre-commit.com/"},
-                {"name": "pylint", "description": "Code analysis for bug detection",
-                 "doc_url": "https://pylint.pycqa.org/"},
-                {"name": "virtualenv", "description": "Virtual environment creation",
-                 "doc_url": "https://virtualenv.pypa.io/"},
-                {"name": "pyright", "description": "Static type checker by Microsoft",
-                 "doc_url": "https://github.com/microsoft/pyright"},
-                {"name": "ruff", "description": "Fast Python linter",
-                 "doc_url": "https://github.com/charliermarsh/ruff"},
-                {"name": "pydantic", "description": "Data validation using type annotations",
-                 "doc_url": "https://pydantic-docs.helpmanual.io/"}
-            ],
-            "Database": [
-                {"name": "SQLAlchemy", "description": "SQL toolkit and ORM", "doc_url": "https://www.sqlalchemy.org/"},
-                {"name": "peewee", "description": "Small ORM", "doc_url": "http://docs.peewee-orm.com/"},
-                {"name": "pymongo", "description": "MongoDB driver", "doc_url": "https://pymongo.readthedocs.io/"},
-                {"name": "psycopg2", "description": "PostgreSQL adapter", "doc_url": "https://www.psycopg.org/"},
-                {"name": "mysql-connector-python", "description": "MySQL driver",
-                 "doc_url": "https://dev.mysql.com/doc/connector-python/en/"},
-                {"name": "redis-py", "description": "Redis client", "doc_url": "https://redis-py.readthedocs.io/"},
-                {"name": "tortoise-orm", "description": "Async ORM", "doc_url": "https://tortoise-orm.readthedocs.io/"},
-                {"name": "dataset", "description": "Database for lazy people",
-                 "doc_url": "https://dataset.readthedocs.io/"},
-                {"name": "mongoengine", "description": "MongoDB ODM",
-                 "doc_url": "https://mongoengine-odm.readthedocs.io/"},
-                {"name": "pony", "description": "ORM with query syntax", "doc_url": "https://ponyorm.org/"},
-                {"name": "sqlite3", "description": "SQLite database interface",
-                 "doc_url": "https://docs.python.org/3/library/sqlite3.html"},
-                {"name": "aiomysql", "description": "Asyncio MySQL driver",
-                 "doc_url": "https://aiomysql.readthedocs.io/"},
-                {"name": "asyncpg", "description": "Asyncio PostgreSQL driver",
-                 "doc_url": "https://magicstack.github.io/asyncpg/"},
-                {"name": "aiosqlite", "description": "Asyncio SQLite driver",
-                 "doc_url": "https://github.com/omnilib/aiosqlite"},
-                {"name": "sqlmodel", "description": "SQLAlchemy + Pydantic",
-                 "doc_url": "https://sqlmodel.tiangolo.com/"}
-            ],
-            "Big Data": [
-                {"name": "pandas", "description": "Data analysis and manipulation",
-                 "doc_url": "https://pandas.pydata.org/"},
-                {"name": "numpy", "description": "Numerical computing", "doc_url": "https://numpy.org/"},
-                {"name": "pyspark", "description": "Apache Spark interface",
-                 "doc_url": "https://spark.apache.org/docs/latest/api/python/"},
-                {"name": "dask", "description": "Parallel computing", "doc_url": "https://dask.org/"},
-                {"name": "vaex", "description": "Out-of-memory dataframes", "doc_url": "https://vaex.io/"},
-                {"name": "polars", "description": "Fast DataFrame library", "doc_url": "https://pola.rs/"},
-                {"name": "modin", "description": "Accelerated pandas", "doc_url": "https://modin.readthedocs.io/"},
-                {"name": "koalas", "description": "Pandas API on Apache Spark",
-                 "doc_url": "https://koalas.readthedocs.io/"},
-                {"name": "petastorm", "description": "Parquet datasets with ML frameworks",
-                 "doc_url": "https://petastorm.readthedocs.io/"},
-                {"name": "ray", "description": "Distributed computing", "doc_url": "https://ray.io/"},
-                {"name": "xarray", "description": "N-D labeled arrays and datasets",
-                 "doc_url": "https://xarray.pydata.org/"},
-                {"name": "pyarrow", "description": "Apache Arrow and Parquet",
-                 "doc_url": "https://arrow.apache.org/docs/python/"},
-                {"name": "cudf", "description": "GPU DataFrame library",
-                 "doc_url": "https://docs.rapids.ai/api/cudf/stable/"},
-                {"name": "h5py", "description": "Interface to HDF5 format", "doc_url": "https://www.h5py.org/"},
-                {"name": "datatable", "description": "Data table processing library",
-                 "doc_url": "https://datatable.readthedocs.io/"}
-            ],
-            "IoT": [
-                {"name": "paho-mqtt", "description": "MQTT client", "doc_url": "https://pypi.org/project/paho-mqtt/"},
-                {"name": "micropython", "description": "Python for microcontrollers",
-                 "doc_url": "https://micropython.org/"},
-                {"name": "adafruit-circuitpython", "description": "CircuitPython libraries",
-                 "doc_url": "https://circuitpython.org/"},
-                {"name": "gpiozero", "description": "Simple Raspberry Pi GPIO",
-                 "doc_url": "https://gpiozero.readthedocs.io/"},
-                {"name": "RPi.GPIO", "description": "Raspberry Pi GPIO module",
-                 "doc_url": "https://pypi.org/project/RPi.GPIO/"},
-                {"name": "pyserial", "description": "Serial port access",
-                 "doc_url": "https://pyserial.readthedocs.io/"},
-                {"name": "bleak", "description": "Bluetooth Low Energy", "doc_url": "https://bleak.readthedocs.io/"},
-                {"name": "esptool", "description": "ESP8266/ESP32 tool",
-                 "doc_url": "https://github.com/espressif/esptool"},
-                {"name": "pymodbus", "description": "Modbus protocol implementation",
-                 "doc_url": "https://pymodbus.readthedocs.io/"},
-                {"name": "pybluez", "description": "Bluetooth Python extension",
-                 "doc_url": "https://pybluez.github.io/"},
-                {"name": "pigpio", "description": "Raspberry Pi GPIO control",
-                 "doc_url": "http://abyz.me.uk/rpi/pigpio/python.html"},
-                {"name": "python-periphery", "description": "Linux peripheral I/O",
-                 "doc_url": "https://python-periphery.readthedocs.io/"},
-                {"name": "Pillow", "description": "Image processing library", "doc_url": "https://python-pillow.org/"},
-                {"name": "smbus2", "description": "SMBus protocol",
-                 "doc_url": "https://github.com/kplindegaard/smbus2"},
-                {"name": "rpi-gpio-nfc", "description": "NFC on Raspberry Pi",
-                 "doc_url": "https://github.com/StrayFeral/rpi-gpio-nfc"}
-            ],
-            "DevOps": [
-                {"name": "ansible", "description": "Automation platform", "doc_url": "https://www.ansible.com/"},
-                {"name": "docker", "description": "Docker API client", "doc_url": "https://docker-py.readthedocs.io/"},
-                {"name": "fabric", "description": "SSH deployment tool", "doc_url": "https://www.fabfile.org/"},
-                {"name": "paramiko", "description": "SSH implementation", "doc_url": "https://www.paramiko.org/"},
-                {"name": "kubernetes", "description": "Kubernetes API client",
-                 "doc_url": "https://github.com/kubernetes-client/python"},
-                {"name": "boto3", "description": "AWS SDK",
-                 "doc_url": "https://boto3.amazonaws.com/v1/documentation/api/latest/index.html"},
-                {"name": "terraform-python", "description": "Terraform wrapper",
-                 "doc_url": "https://github.com/beelit94/terraform-python"},
-                {"name": "pulumi", "description": "Infrastructure as Code", "doc_url": "https://www.pulumi.com/"},
-                {"name": "python-jenkins", "description": "Jenkins API client",
-                 "doc_url": "https://python-jenkins.readthedocs.io/"},
-                {"name": "salt", "description": "Remote execution framework",
-                 "doc_url": "https://docs.saltproject.io/"},
-                {"name": "azure-cli", "description": "Azure command-line interface",
-                 "doc_url": "https://docs.microsoft.com/cli/azure/"},
-                {"name": "google-cloud-python", "description": "Google Cloud client",
-                 "doc_url": "https://googleapis.dev/python/google-api-core/latest/index.html"},
-                {"name": "python-digitalocean", "description": "DigitalOcean API",
-                 "doc_url": "https://github.com/koalalorenzo/python-digitalocean"},
-                {"name": "openstack", "description": "OpenStack SDK",
-                 "doc_url": "https://docs.openstack.org/openstacksdk/latest/"},
-                {"name": "jenkinsapi", "description": "Jenkins API",
-                 "doc_url": "https://github.com/pycontribs/jenkinsapi"}
-            ],
-            "Media": [
-                {"name": "Pillow", "description": "Image processing", "doc_url": "https://pillow.readthedocs.io/"},
-                {"name": "moviepy", "description": "Video editing", "doc_url": "https://zulko.github.io/moviepy/"},
-                {"name": "pygame", "description": "Game development", "doc_url": "https://www.pygame.org/"},
-                {"name": "opencv-python", "description": "Computer vision", "doc_url": "https://opencv.org/"},
-                {"name": "pydub", "description": "Audio processing", "doc_url": "https://github.com/jiaaro/pydub"},
-                {"name": "pyglet", "description": "Windowing and multimedia", "doc_url": "https://pyglet.org/"},
-                {"name": "librosa", "description": "Audio analysis", "doc_url": "https://librosa.org/"},
-                {"name": "mutagen", "description": "Audio metadata handling",
-                 "doc_url": "https://mutagen.readthedocs.io/"},
-                {"name": "ffmpeg-python", "description": "FFmpeg wrapper",
-                 "doc_url": "https://github.com/kkroening/ffmpeg-python"},
-                {"name": "pyaudio", "description": "Audio I/O",
-                 "doc_url": "https://people.csail.mit.edu/hubert/pyaudio/"},
-                {"name": "imageio", "description": "Image I/O", "doc_url": "https://imageio.github.io/"},
-                {"name": "scikit-image", "description": "Image processing", "doc_url": "https://scikit-image.org/"},
-                {"name": "manim", "description": "Mathematical animations", "doc_url": "https://docs.manim.community/"},
-                {"name": "wand", "description": "ImageMagick binding", "doc_url": "https://docs.wand-py.org/"},
-                {"name": "python-vlc", "description": "VLC media player binding",
-                 "doc_url": "https://github.com/oaubert/python-vlc"}
-            ],
-            "Parse": [
-                {"name": "pyyaml", "description": "YAML parser and emitter", "doc_url": "https://pyyaml.org/"},
-                {"name": "json", "description": "JSON encoder and decoder",
-                 "doc_url": "https://docs.python.org/3/library/json.html"},
-                {"name": "csv", "description": "CSV file reading and writing",
-                 "doc_url": "https://docs.python.org/3/library/csv.html"},
-                {"name": "xml.etree.ElementTree", "description": "XML processing",
-                 "doc_url": "https://docs.python.org/3/library/xml.etree.elementtree.html"},
-                {"name": "configparser", "description": "INI file parser",
-                 "doc_url": "https://docs.python.org/3/library/configparser.html"},
-                {"name": "toml", "description": "TOML parser", "doc_url": "https://github.com/toml-lang/toml"},
-                {"name": "ujson", "description": "Ultra fast JSON encoder and decoder",
-                 "doc_url": "https://github.com/ultrajson/ultrajson"},
-                {"name": "python-dateutil", "description": "Date parsing and manipulation",
-                 "doc_url": "https://dateutil.readthedocs.io/"},
-                {"name": "xmltodict", "description": "XML to dict converter",
-                 "doc_url": "https://github.com/martinblech/xmltodict"},
-                {"name": "arrow", "description": "Better dates and times", "doc_url": "https://arrow.readthedocs.io/"},
-                {"name": "parse", "description": "Parse strings using format strings",
-                 "doc_url": "https://github.com/r1chardj0n3s/parse"},
-                {"name": "beautifulsoup4", "description": "HTML/XML parser",
-                 "doc_url": "https://www.crummy.com/software/BeautifulSoup/"},
-                {"name": "pyparsing", "description": "Parser generator",
-                 "doc_url": "https://pyparsing-docs.readthedocs.io/"},
-                {"name": "marshmallow", "description": "Object serialization/deserialization",
-                 "doc_url": "https://marshmallow.readthedocs.io/"},
-                {"name": "tomli", "description": "TOML parser (Python 3.6+)",
-                 "doc_url": "https://github.com/hukkin/tomli"}
-            ],
-            "Security": [
-                {"name": "cryptography", "description": "Cryptographic recipes", "doc_url": "https://cryptography.io/"},
-                {"name": "passlib", "description": "Password hashing", "doc_url": "https://passlib.readthedocs.io/"},
-                {"name": "pyOpenSSL", "description": "OpenSSL wrapper", "doc_url": "https://pyopenssl.org/"},
-                {"name": "jwt", "description": "JSON Web Token", "doc_url": "https://pyjwt.readthedocs.io/"},
-                {"name": "oauthlib", "description": "OAuth implementation",
-                 "doc_url": "https://oauthlib.readthedocs.io/"},
-                {"name": "bcrypt", "description": "Modern password hashing",
-                 "doc_url": "https://github.com/pyca/bcrypt/"},
-                {"name": "paramiko", "description": "SSHv2 protocol", "doc_url": "https://www.paramiko.org/"},
-                {"name": "pyotp", "description": "One-time password library",
-                 "doc_url": "https://github.com/pyauth/pyotp"},
-                {"name": "authlib", "description": "Authentication library", "doc_url": "https://docs.authlib.org/"},
-                {"name": "google-auth", "description": "Google Authentication",
-                 "doc_url": "https://google-auth.readthedocs.io/"},
-                {"name": "pynacl", "description": "Networking and cryptography library",
-                 "doc_url": "https://pynacl.readthedocs.io/"},
-                {"name": "python-gnupg", "description": "GnuPG interface", "doc_url": "https://gnupg.readthedocs.io/"},
-                {"name": "py-argon2", "description": "Argon2 password hashing",
-                 "doc_url": "https://argon2-cffi.readthedocs.io/"},
-                {"name": "itsdangerous", "description": "Cryptographically sign data",
-                 "doc_url": "https://itsdangerous.palletsprojects.com/"},
-                {"name": "pyca", "description": "Python Cryptographic Authority", "doc_url": "https://github.com/pyca"}
-            ],
-            "APIs": [
-                {"name": "requests-oauthlib", "description": "OAuth for Requests",
-                 "doc_url": "https://requests-oauthlib.readthedocs.io/"},
-                {"name": "python-twitter", "description": "Twitter API",
-                 "doc_url": "https://github.com/bear/python-twitter"},
-                {"name": "tweepy", "description": "Twitter API client", "doc_url": "https://www.tweepy.org/"},
-                {"name": "google-api-python-client", "description": "Google APIs client",
-                 "doc_url": "https://github.com/googleapis/google-api-python-client"},
-                {"name": "facebook-sdk", "description": "Facebook SDK",
-                 "doc_url": "https://facebook-sdk.readthedocs.io/"},
-                {"name": "instagram-private-api", "description": "Instagram Private API",
-                 "doc_url": "https://github.com/ping/instagram_private_api"},
-                {"name": "praw", "description": "Reddit API wrapper", "doc_url": "https://praw.readthedocs.io/"},
-                {"name": "stripe", "description": "Stripe API", "doc_url": "https://stripe.com/docs/api?lang=python"},
-                {"name": "twilio", "description": "Twilio API client",
-                 "doc_url": "https://www.twilio.com/docs/libraries/python"},
-                {"name": "github3.py", "description": "GitHub API client",
-                 "doc_url": "https://github3py.readthedocs.io/"},
-                {"name": "pyTelegramBotAPI", "description": "Telegram Bot API",
-                 "doc_url": "https://github.com/eternnoir/pyTelegramBotAPI"},
-                {"name": "python-gitlab", "description": "GitLab API client",
-                 "doc_url": "https://python-gitlab.readthedocs.io/"},
-                {"name": "discord.py", "description": "Discord API client",
-                 "doc_url": "https://discordpy.readthedocs.io/"},
-                {"name": "slackclient", "description": "Slack API client",
-                 "doc_url": "https://slack.dev/python-slackclient/"},
-                {"name": "pyOpenWeatherMap", "description": "OpenWeatherMap API",
-                 "doc_url": "https://github.com/csparpa/pyowm"}
-            ],
-            "Kompression": [
-                {"name": "zipfile", "description": "ZIP archive handling",
-                 "doc_url": "https://docs.python.org/3/library/zipfile.html"},
-                {"name": "tarfile", "description": "TAR archive handling",
-                 "doc_url": "https://docs.python.org/3/library/tarfile.html"},
-                {"name": "gzip", "description": "Gzip support",
-                 "doc_url": "https://docs.python.org/3/library/gzip.html"},
-                {"name": "bz2", "description": "Bzip2 compression",
-                 "doc_url": "https://docs.python.org/3/library/bz2.html"},
-                {"name": "lzma", "description": "LZMA compression",
-                 "doc_url": "https://docs.python.org/3/library/lzma.html"},
-                {"name": "zlib", "description": "Zlib compression",
-                 "doc_url": "https://docs.python.org/3/library/zlib.html"},
-                {"name": "py7zr", "description": "7zip archive handling", "doc_url": "https://py7zr.readthedocs.io/"},
-                {"name": "pyzipper", "description": "Extended zipfile with encryption",
-                 "doc_url": "https://github.com/danifus/pyzipper"},
-                {"name": "compress-pickle", "description": "Compressed pickle serialization",
-                 "doc_url": "https://github.com/lucianopaz/compress_pickle"},
-                {"name": "unrar", "description": "RAR archive handling",
-                 "doc_url": "https://github.com/matiasb/python-unrar"},
-                {"name": "zstandard", "description": "Zstandard compression",
-                 "doc_url": "https://python-zstandard.readthedocs.io/"},
-                {"name": "lz4", "description": "LZ4 compression", "doc_url": "https://python-lz4.readthedocs.io/"},
-                {"name": "brotli", "description": "Brotli compression", "doc_url": "https://github.com/google/brotli"},
-                {"name": "snappy", "description": "Snappy compression",
-                 "doc_url": "https://github.com/andrix/python-snappy"},
-                {"name": "blosc", "description": "Blosc compression",
-                 "doc_url": "https://github.com/Blosc/python-blosc"}
-            ],
-            "Machine Learning": [
-                {"name": "scikit-learn", "description": "Machine learning algorithms",
-                 "doc_url": "https://scikit-learn.org/"},
-                {"name": "tensorflow", "description": "Deep learning framework",
-                 "doc_url": "https://www.tensorflow.org/"},
-                {"name": "pytorch", "description": "Deep learning framework", "doc_url": "https://pytorch.org/"},
-                {"name": "keras", "description": "High-level neural networks API", "doc_url": "https://keras.io/"},
-                {"name": "xgboost", "description": "Gradient boosting framework",
-                 "doc_url": "https://xgboost.readthedocs.io/"},
-                {"name": "lightgbm", "description": "Gradient boosting framework",
-                 "doc_url": "https://lightgbm.readthedocs.io/"},
-                {"name": "catboost", "description": "Gradient boosting framework", "doc_url": "https://catboost.ai/"},
-                {"name": "spacy", "description": "Natural language processing", "doc_url": "https://spacy.io/"},
-                {"name": "nltk", "description": "Natural language toolkit", "doc_url": "https://www.nltk.org/"},
-                {"name": "gensim", "description": "Topic modeling and document similarity",
-                 "doc_url": "https://radimrehurek.com/gensim/"},
-                {"name": "transformers", "description": "Hugging Face Transformers",
-                 "doc_url": "https://huggingface.co/transformers/"},
-                {"name": "fastai", "description": "Deep learning library", "doc_url": "https://docs.fast.ai/"},
-                {"name": "scikit-image", "description": "Image processing", "doc_url": "https://scikit-image.org/"},
-                {"name": "statsmodels", "description": "Statistical models", "doc_url": "https://www.statsmodels.org/"},
-                {"name": "opencv-python", "description": "Computer vision", "doc_url": "https://opencv.org/"}
-            ],
-            "Visualization": [
-                {"name": "matplotlib", "description": "Plotting library", "doc_url": "https://matplotlib.org/"},
-                {"name": "seaborn", "description": "Statistical data visualization",
-                 "doc_url": "https://seaborn.pydata.org/"},
-                {"name": "plotly", "description": "Interactive plots", "doc_url": "https://plotly.com/python/"},
-                {"name": "bokeh", "description": "Interactive web plots", "doc_url": "https://bokeh.org/"},
-                {"name": "altair", "description": "Declarative statistical visualization",
-                 "doc_url": "https://altair-viz.github.io/"},
-                {"name": "holoviews", "description": "Data visualization library", "doc_url": "https://holoviews.org/"},
-                {"name": "dash", "description": "Interactive web apps for visualization",
-                 "doc_url": "https://dash.plotly.com/"},
-                {"name": "pygal", "description": "SVG charts creator", "doc_url": "http://pygal.org/"},
-                {"name": "folium", "description": "Leaflet.js maps",
-                 "doc_url": "https://python-visualization.github.io/folium/"},
-                {"name": "ggplot", "description": "ggplot2 port to Python", "doc_url": "https://github.com/yhat/ggpy"},
-                {"name": "plotnine", "description": "Grammar of graphics",
-                 "doc_url": "https://plotnine.readthedocs.io/"},
-                {"name": "networkx", "description": "Network graphs", "doc_url": "https://networkx.org/"},
-                {"name": "pydot", "description": "Graphviz interface", "doc_url": "https://github.com/pydot/pydot"},
-                {"name": "graphviz", "description": "Graphviz interface",
-                 "doc_url": "https://graphviz.readthedocs.io/"},
-                {"name": "datashader", "description": "Big data visualization", "doc_url": "https://datashader.org/"}
-            ],
-            "Testing": [
-                {"name": "pytest", "description": "Testing framework", "doc_url": "https://docs.pytest.org/"},
-                {"name": "unittest", "description": "Unit testing framework",
-                 "doc_url": "https://docs.python.org/3/library/unittest.html"},
-                {"name": "nose2", "description": "Test runner", "doc_url": "https://docs.nose2.io/"},
-                {"name": "mock", "description": "Mocking and testing library",
-                 "doc_url": "https://docs.python.org/3/library/unittest.mock.html"},
-                {"name": "pytest-cov", "description": "Code coverage plugin for pytest",
-                 "doc_url": "https://pytest-cov.readthedocs.io/"},
-                {"name": "selenium", "description": "Browser automation",
-                 "doc_url": "https://selenium-python.readthedocs.io/"},
-                {"name": "behave", "description": "BDD testing", "doc_url": "https://behave.readthedocs.io/"},
-                {"name": "hypothesis", "description": "Property-based testing",
-                 "doc_url": "https://hypothesis.readthedocs.io/"},
-                {"name": "robotframework", "description": "Generic test automation",
-                 "doc_url": "https://robotframework.org/"},
-                {"name": "playwright", "description": "Browser automation",
-                 "doc_url": "https://playwright.dev/python/"},
-                {"name": "pytest-mock", "description": "Thin wrapper around mock",
-                 "doc_url": "https://github.com/pytest-dev/pytest-mock/"},
-                {"name": "pytest-xdist", "description": "Test parallelization",
-                 "doc_url": "https://github.com/pytest-dev/pytest-xdist"},
-                {"name": "pytest-django", "description": "Django testing with pytest",
-                 "doc_url": "https://pytest-django.readthedocs.io/"},
-                {"name": "pytest-asyncio", "description": "Asyncio testing with pytest",
-                 "doc_url": "https://github.com/pytest-dev/pytest-asyncio"},
-                {"name": "faker", "description": "Fake data generator", "doc_url": "https://faker.readthedocs.io/"}
-            ]
-        }
+        self.modules_by_category = catalog["modules_by_category"]
+        self.module_names = catalog["module_names"]
+        # Kleingeschriebener Modulname -> Liste von (Kategorie, Position)
+        self.name_index = catalog["name_index"]
+        self.search_index = SearchIndex(catalog["search_index"])
+
 
     def get_categories(self) -> List[str]:
         """
@@ -460,42 +204,59 @@ class ModuleData:
         """
         Gibt eine Liste aller Modulnamen zurück
         """
-        all_modules = []
-        for category_modules in self.modules_by_category.values():
-            all_modules.extend([module["name"] for module in category_modules])
-        return all_modules
+        return list(self.module_names)
 
-    def search_modules(self, query: str) -> List[Dict[str, Any]]:
+    def get_module(self, name: str) -> Optional[Dict[str, Any]]:
         """
-        Sucht nach Modulen, die der Suchanfrage entsprechen
+        Sucht ein Modul über den vorberechneten Namensindex
+
+        Args:
+            name: Modulname (Groß-/Kleinschreibung egal)
+
+        Returns:
+            Moduldaten mit Kategoriefeld oder None
+        """
+        locations = self.name_index.get(name.lower())
+        if not locations:
+            return None
+        category, position = locations[0]
+        module = dict(self.modules_by_category[category][position])
+        module["category"] = category
+        return module
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Sucht über den invertierten Index und liefert nur Verweise auf die Treffer
 
         Args:
             query: Die Suchanfrage
+            limit: Höchstzahl an Treffern (None: alle)
 
         Returns:
-            Liste der gefundenen Module mit zusätzlichem Kategoriefeld
-        """
-        if not query:
-            return []
-
-        query = query.lower()
-        results = []
-
-        for category, modules in self.modules_by_category.items():
-            for module in modules:
-                # Suche im Namen
-                if query in module["name"].lower():
-                    # Füge Kategorie zum Modul hinzu
-                    module_with_category = module.copy()
-                    module_with_category["category"] = category
-                    results.append(module_with_category)
-                # Suche in der Beschreibung
-                elif query in module["description"].lower():
-                    module_with_category = module.copy()
-                    module_with_category["category"] = category
-                    results.append(module_with_category)
+            Nach Relevanz sortierte Treffer (siehe resolve)
+        """
+        return self.search_index.search(query, limit)
 
-        return results
+    def resolve(self, hit: SearchHit) -> Dict[str, Any]:
+        """
+        Macht aus einem Suchtreffer die Moduldaten mit zusätzlichem Kategoriefeld
+        """
+        module = dict(self.modules_by_category[hit.category][hit.position])
+        module["category"] = hit.category
+        return module
+
+    def search_modules(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Sucht nach Modulen, die der Suchanfrage entsprechen
+
+        Args:
+            query: Die Suchanfrage
+            limit: Höchstzahl an Treffern (None: alle)
+
+        Returns:
+            Liste der gefundenen Module mit zusätzlichem Kategoriefeld, nach Relevanz sortiert
+        """
+        return [self.resolve(hit) for hit in self.search(query, limit)]
 
     def get_module_popularity(self, category: str) -> Dict[str, int]:
         """
@@ -515,66 +276,242 @@ class ModuleData:
 class ModuleChecker:
     """
     Klasse zur Überprüfung von Modulimporten
+
+    Standardmäßig wird nur geprüft, ob ein Modul gefunden wird (find_spec und
+    Distributionsindex), ohne es auszuführen. Echte Importe finden nur in der
+    Tiefenprüfung (deep=True) in isolierten Prozessen statt.
     """
 
     @staticmethod
-    def check_importable(module_names: List[str]) -> Dict[str, bool]:
+    def check_importable(module_names: List[str], deep: bool = False) -> Dict[str, bool]:
         """
         Überprüft, ob die angegebenen Module importiert werden können.
 
+        Ohne deep wird nur nach dem Modul gesucht (siehe find_modules). Mit deep
+        werden die Module isoliert in eigenen Prozessen importiert (siehe
+        check_imports_isolated), der eigene Prozess lädt dabei keine Module.
+
         Args:
             module_names: Liste der zu überprüfenden Modulnamen
+            deep: Module tatsächlich importieren
 
         Returns:
             Dictionary mit Modulnamen als Schlüssel und
             Boolean-Werten, die angeben, ob der Import erfolgreich war
         """
+        if deep:
+            results = ModuleChecker.check_imports_isolated(module_names)
+        else:
+            results = ModuleChecker.find_modules(module_names)
+        return {name: result['success'] for name, result in results.items()}
+
+    # Namensauflösung und isolierte Importe teilt sich die Desktop-App mit der Web-App (importus_core)
+    find_import_name = staticmethod(_core.find_import_name)
+    probe_import = staticmethod(_core.probe_import)
+    check_imports_isolated = staticmethod(_core.check_imports_isolated)
+
+    @staticmethod
+    def is_installed(module_name: str) -> bool:
+        """
+        Prüft ohne Import, ob ein Modul gefunden wird
+
+        Args:
+            module_name: Name des Moduls oder Pakets
+
+        Returns:
+            True, wenn find_spec das Modul findet
+        """
+        return ModuleChecker.find_import_name(module_name) is not None
+
+    @staticmethod
+    def find_modules(module_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Schnelle Prüfung ohne Import (find_spec und Distributionsindex)
+
+        Args:
+            module_names: Liste der zu überprüfenden Modulnamen
+
+        Returns:
+            Dictionary mit Modulnamen als Schlüssel und Ergebnissen im Format
+            von probe_import ('seconds' ist hier die Dauer der Suche)
+        """
         results = {}
-        for module_name in module_names:
-            try:
-                # Normalisiere den Modulnamen für den Import
-                import_name = module_name.lower().replace('-', '_')
-                # Versuche, das Modul zu importieren
-                importlib.import_module(import_name)
-                results[module_name] = True
-            except (ImportError, ModuleNotFoundError):
-                results[module_name] = False
+        for name in dict.fromkeys(module_names):
+            start = time.perf_counter()
+            found = ModuleChecker.is_installed(name)
+            results[name] = {
+                'success': found,
+                'error': None if found else "Modul nicht gefunden",
+                'seconds': time.perf_counter() - start,
+                'timed_out': False
+            }
         return results
 
     @staticmethod
-    def get_module_version(module_name: str) -> str:
+    def parse_importtime(output: str) -> List[Dict[str, Any]]:
         """
-        Versucht, die Version eines Moduls zu ermitteln
+        Wandelt die Ausgabe von python -X importtime in einen Baum um
+
+        Die Zeilen erscheinen in Post-Order (Untermodule vor ihrem Paket), die
+        Einrückung des Namens gibt die Tiefe an.
+
+        Args:
+            output: stderr des Prozesses
+
+        Returns:
+            Liste der Wurzelknoten mit 'name', 'self_us', 'cumulative_us' und 'children'
+        """
+        pending = {}
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            parts = line[len("import time:"):].split("|")
+            if len(parts) != 3:
+                continue
+            try:
+                self_us, cumulative_us = int(parts[0]), int(parts[1])
+            except ValueError:
+                # Kopfzeile "self [us] | cumulative | imported package"
+                continue
+
+            raw_name = parts[2].rstrip()
+            level = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+            node = {
+                'name': raw_name.strip(),
+                'self_us': self_us,
+                'cumulative_us': cumulative_us,
+                'children': pending.pop(level + 1, [])
+            }
+            pending.setdefault(level, []).append(node)
+
+        return pending.get(0, [])
+
+    @staticmethod
+    def _flatten_import_tree(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Alle Knoten eines Importbaums als flache Liste (ohne Kinder)"""
+        nodes = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            nodes.append({'name': current['name'], 'self_us': current['self_us'],
+                          'cumulative_us': current['cumulative_us']})
+            stack.extend(current['children'])
+        return nodes
+
+    @staticmethod
+    def profile_import(module_name: str, timeout: float = IMPORT_CHECK_TIMEOUT) -> Dict[str, Any]:
+        """
+        Misst die Importzeiten eines Moduls mit python -X importtime
 
         Args:
             module_name: Name des Moduls
+            timeout: Zeitlimit in Sekunden, danach wird der Prozess beendet
 
         Returns:
-            Versionsnummer als String oder "N/A" wenn nicht verfügbar
+            Ergebnis im Format von probe_import, zusätzlich 'tree' (Importbaum des
+            Moduls oder None, wenn es schon beim Interpreterstart geladen ist) und
+            'top' (langsamste Importe nach eigener Zeit)
         """
+        # Importname wie bei der schnellen Prüfung auflösen ("Pillow" -> "PIL")
+        import_name = ModuleChecker.find_import_name(module_name) or module_name
+        start = time.perf_counter()
+
+        # Nur die import-Anweisung wird von -X importtime vollständig erfasst
+        # (importlib.import_module meldet das Paket selbst nicht), daher den
+        # Namen prüfen, bevor er in den Code eingesetzt wird
+        if not all(part.isidentifier() for part in import_name.split('.')):
+            return {'success': False, 'error': "Ungültiger Modulname",
+                    'seconds': 0.0, 'timed_out': False, 'tree': None, 'top': []}
+
         try:
-            # Normalisiere den Modulnamen für den Import
-            import_name = module_name.lower().replace('-', '_')
-            # Versuche, das Modul zu importieren
-            module = importlib.import_module(import_name)
-
-            # Versuche, verschiedene Attribute für die Version zu finden
-            if hasattr(module, "__version__"):
-                return module.__version__
-            if hasattr(module, "VERSION"):
-                return str(module.VERSION)
-            if hasattr(module, "version"):
-                return str(module.version)
-
-            # Wenn kein direktes Attribut gefunden wird, versuche pkg_resources
-            try:
-                return pkg_resources.get_distribution(module_name).version
-            except (pkg_resources.DistributionNotFound, AttributeError):
-                pass
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {import_name}"],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+            )
+        except subprocess.TimeoutExpired:
+            return {'success': False, 'error': f"Zeitüberschreitung nach {timeout:g} s",
+                    'seconds': time.perf_counter() - start, 'timed_out': True, 'tree': None, 'top': []}
+        except OSError as e:
+            return {'success': False, 'error': f"Prüfprozess nicht startbar: {e}",
+                    'seconds': 0.0, 'timed_out': False, 'tree': None, 'top': []}
+
+        roots = ModuleChecker.parse_importtime(completed.stderr)
+        tree = next((node for node in reversed(roots) if node['name'] == import_name), None)
+        top = []
+        if tree:
+            top = sorted(ModuleChecker._flatten_import_tree(tree),
+                         key=lambda node: node['self_us'], reverse=True)[:IMPORT_PROFILE_TOP]
+
+        error = None
+        if completed.returncode != 0:
+            # Letzte Zeile des Tracebacks, ohne die importtime-Zeilen
+            error_lines = [line for line in completed.stderr.strip().splitlines()
+                           if not line.startswith("import time:")]
+            error = error_lines[-1] if error_lines else f"Prozess beendet mit Code {completed.returncode}"
+
+        return {
+            'success': completed.returncode == 0,
+            'error': error,
+            'seconds': tree['cumulative_us'] / 1e6 if tree else 0.0,
+            'timed_out': False,
+            'tree': tree,
+            'top': top
+        }
+
+    @staticmethod
+    def profile_imports(module_names: List[str], timeout: float = IMPORT_CHECK_TIMEOUT,
+                        max_workers: int = IMPORT_CHECK_WORKERS) -> Dict[str, Dict[str, Any]]:
+        """
+        Misst die Importzeiten mehrerer Module parallel in isolierten Prozessen
+
+        Args:
+            module_names: Liste der zu messenden Modulnamen
+            timeout: Zeitlimit pro Modul in Sekunden
+            max_workers: Maximale Anzahl gleichzeitiger Prozesse
+
+        Returns:
+            Dictionary mit Modulnamen als Schlüssel und dem Ergebnis von profile_import
+        """
+        names = list(dict.fromkeys(module_names))
+        if not names:
+            return {}
 
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+            results = executor.map(lambda name: ModuleChecker.profile_import(name, timeout), names)
+            return dict(zip(names, results))
+
+    @staticmethod
+    def get_module_version(module_name: str, deep: bool = False,
+                           timeout: float = IMPORT_CHECK_TIMEOUT) -> str:
+        """
+        Versucht, die Version eines Moduls zu ermitteln
+
+        Die Version kommt aus dem Distributionsindex. Nur mit deep wird das
+        Modul importiert, um Versionsattribute wie __version__ auszulesen -
+        in einem eigenen Prozess (siehe probe_import), nie im eigenen.
+
+        Args:
+            module_name: Name des Moduls
+            deep: Modul importieren, wenn der Index keine Version kennt
+            timeout: Zeitlimit in Sekunden für den Import mit deep
+
+        Returns:
+            Versionsnummer als String oder "N/A" wenn nicht verfügbar
+        """
+        version = distribution_index.version(module_name)
+        if version:
+            return version
+        if not deep:
             return "N/A"
-        except (ImportError, ModuleNotFoundError):
+
+        try:
+            result = ModuleChecker.probe_import(module_name, timeout)
+        except Exception:
             return "N/A"
+        return result.get('version') or "N/A"
 
     @staticmethod
     def get_module_install_command(module_name: str, platform_name: str = None) -> str:
@@ -741,6 +678,285 @@ class ConfigManager:
         self.save_config()
 
 
+class SelectionModel:
+    """
+    Menge der ausgewählten Module, die Änderungen an Beobachter meldet
+
+    Beobachter erhalten nur die tatsächlich hinzugekommenen und entfernten
+    Namen. Innerhalb von batch() werden alle Änderungen zu einem einzigen
+    Ereignis zusammengefasst. Eine sortierte Liste wird laufend mitgeführt,
+    damit die Anzeige nicht bei jeder Änderung neu sortieren muss.
+    """
+
+    def __init__(self, names=()):
+        self._names = set(names)
+        self._sorted = sorted(self._names)
+        self._observers = []
+        self._batch_depth = 0
+        self._pending_added = set()
+        self._pending_removed = set()
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+    def __iter__(self):
+        return iter(list(self._sorted))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def sorted(self) -> List[str]:
+        """
+        Gibt die ausgewählten Module alphabetisch sortiert zurück
+        """
+        return list(self._sorted)
+
+    def subscribe(self, observer) -> None:
+        """
+        Registriert einen Beobachter, der mit (hinzugefügt, entfernt) aufgerufen wird
+        """
+        self._observers.append(observer)
+
+    def add(self, name: str) -> None:
+        """
+        Wählt ein Modul aus
+        """
+        self.update([name])
+
+    def remove(self, name: str) -> None:
+        """
+        Wählt ein Modul ab
+        """
+        self.difference_update([name])
+
+    def toggle(self, name: str) -> bool:
+        """
+        Wählt ein Modul aus bzw. ab
+
+        Returns:
+            True, wenn das Modul danach ausgewählt ist
+        """
+        if name in self._names:
+            self.remove(name)
+            return False
+        self.add(name)
+        return True
+
+    def update(self, names) -> None:
+        """
+        Wählt mehrere Module aus
+        """
+        added = {name for name in names if name not in self._names}
+        if added:
+            self._names |= added
+            self._changed(added, set())
+
+    def difference_update(self, names) -> None:
+        """
+        Wählt mehrere Module ab
+        """
+        removed = {name for name in names if name in self._names}
+        if removed:
+            self._names -= removed
+            self._changed(set(), removed)
+
+    def clear(self) -> None:
+        """
+        Wählt alle Module ab
+        """
+        self.difference_update(list(self._names))
+
+    @contextmanager
+    def batch(self):
+        """
+        Fasst alle Änderungen innerhalb des with-Blocks zu einem Ereignis zusammen
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                added, removed = self._pending_added, self._pending_removed
+                self._pending_added, self._pending_removed = set(), set()
+                if added or removed:
+                    self._notify(added, removed)
+
+    def _changed(self, added: Set[str], removed: Set[str]) -> None:
+        # Sortierte Liste nachführen; bei großen Änderungen neu sortieren
+        if len(added) + len(removed) > 32:
+            self._sorted = sorted(self._names)
+        else:
+            for name in added:
+                bisect.insort(self._sorted, name)
+            for name in removed:
+                del self._sorted[bisect.bisect_left(self._sorted, name)]
+
+        if self._batch_depth:
+            # Innerhalb eines Batches heben sich Hinzufügen und Entfernen auf
+            for name in added:
+                if name in self._pending_removed:
+                    self._pending_removed.discard(name)
+                else:
+                    self._pending_added.add(name)
+            for name in removed:
+                if name in self._pending_added:
+                    self._pending_added.discard(name)
+                else:
+                    self._pending_removed.add(name)
+        else:
+            self._notify(added, removed)
+
+    def _notify(self, added: Set[str], removed: Set[str]) -> None:
+        for observer in self._observers:
+            observer(added, removed)
+
+
+class VirtualTable:
+    """
+    Treeview, der nur die sichtbaren Zeilen einer beliebig langen Liste darstellt
+
+    Der Treeview enthält höchstens so viele Einträge, wie Zeilen sichtbar sind.
+    Beim Scrollen werden deren Werte aus der Datenliste neu befüllt, statt für
+    jede Zeile ein eigenes Tcl-Item anzulegen. Über einen Schlüssel je Zeile
+    (z.B. den Modulnamen) lassen sich gezielt einzelne Zeilen aktualisieren.
+    """
+
+    def __init__(self, parent, columns: List[tuple], row_values, row_key=None, row_height: int = 30):
+        """
+        Args:
+            parent: Das Elternelement
+            columns: Liste von (Spalten-ID, Überschrift, Breite, Ausrichtung)
+            row_values: Funktion, die aus einem Listenelement die Spaltenwerte bildet
+            row_key: Funktion, die den Schlüssel eines Listenelements liefert (für refresh_keys)
+            row_height: Zeilenhöhe des Treeview-Stils in Pixeln
+        """
+        self.row_values = row_values
+        self.row_key = row_key
+        self.row_height = row_height
+        self.rows = []
+        # Schlüssel -> Indizes der Zeilen mit diesem Schlüssel
+        self.key_rows = {}
+        # Item-IDs der sichtbaren Einträge, von oben nach unten
+        self.items = []
+        self.offset = 0
+        self.visible_rows = 1
+
+        self.frame = ttk.Frame(parent)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree = ttk.Treeview(self.frame, columns=[column[0] for column in columns],
+                                 show="headings", style="Treeview", height=1)
+        for column_id, heading, width, anchor in columns:
+            self.tree.heading(column_id, text=heading)
+            self.tree.column(column_id, width=width, anchor=anchor)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Die Zahl der sichtbaren Zeilen ergibt sich aus der Höhe des Treeviews
+        self.tree.bind("<Configure>", self._on_resize)
+        # Eigene Mausrad-Bindung, damit nicht das Kategorien-Canvas scrollt
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_mousewheel)
+
+    def set_rows(self, rows: list):
+        """
+        Ersetzt die Datenliste und springt an den Anfang
+        """
+        self.rows = rows
+        self.key_rows = {}
+        if self.row_key:
+            for index, row in enumerate(rows):
+                self.key_rows.setdefault(self.row_key(row), []).append(index)
+        self.offset = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Befüllt die sichtbaren Einträge neu, z.B. nach dem Scrollen
+        """
+        count = max(0, min(self.visible_rows, len(self.rows) - self.offset))
+        items = self.items
+        while len(items) < count:
+            items.append(self.tree.insert("", tk.END))
+        if len(items) > count:
+            self.tree.delete(*items[count:])
+            del items[count:]
+
+        for position, item_id in enumerate(items):
+            self._fill(item_id, self.offset + position)
+        self._update_scrollbar()
+
+    def refresh_keys(self, keys) -> int:
+        """
+        Aktualisiert nur die sichtbaren Zeilen mit einem der Schlüssel
+
+        Args:
+            keys: Geänderte Schlüssel (z.B. Modulnamen)
+
+        Returns:
+            Anzahl der neu befüllten Einträge
+        """
+        updated = 0
+        end = self.offset + len(self.items)
+        for key in keys:
+            for index in self.key_rows.get(key, ()):
+                if self.offset <= index < end:
+                    self._fill(self.items[index - self.offset], index)
+                    updated += 1
+        return updated
+
+    def row_index(self, item_id: str) -> Optional[int]:
+        """
+        Gibt den Index in der Datenliste für einen sichtbaren Eintrag zurück
+        """
+        if item_id not in self.items:
+            return None
+        return self.offset + self.items.index(item_id)
+
+    def _fill(self, item_id: str, index: int):
+        self.tree.item(item_id, values=self.row_values(self.rows[index]),
+                       tags=("even" if index % 2 == 0 else "odd",))
+
+    def scroll_to(self, offset: int):
+        """
+        Scrollt so, dass die Zeile mit diesem Index oben steht
+        """
+        offset = max(0, min(offset, len(self.rows) - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def _update_scrollbar(self):
+        total = len(self.rows)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.visible_rows) / total)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.rows)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        return "break"
+
+    def _on_resize(self, event):
+        # Eine Zeile für die Spaltenüberschriften abziehen
+        visible_rows = max(1, event.height // self.row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.offset = max(0, min(self.offset, len(self.rows) - visible_rows))
+            self.refresh()
+
+
 class ModuleExplorerApp:
     """
     Hauptanwendungsklasse für den Python-Modul-Explorer
@@ -801,10 +1017,21 @@ class ModuleExplorerApp:
         self.module_data = ModuleData()
 
         # Set zum Speichern der ausgewählten Module
-        self.selected_modules = set(self.config_manager.get_selected_modules())
+        self.selected_modules = SelectionModel(self.config_manager.get_selected_modules())
+        self.selected_modules.subscribe(self._on_selection_changed)
+        # Ausstehendes Neuzeichnen der Auswahlanzeige (mehrere Änderungen -> ein Neuzeichnen)
+        self._selection_redraw_id = None
 
         # Status für die Echtzeit-Suche
         self.search_after_id = None
+        # Jede Anfrage bekommt eine Nummer; Ergebnisse älterer Anfragen werden verworfen
+        self._search_generation = 0
+        # Ein einziger Such-Thread, damit IncrementalSearch nur aus einem Thread benutzt wird
+        self._search_executor = ThreadPoolExecutor(max_workers=1)
+        self._incremental_search = IncrementalSearch(self.module_data.search_index)
+
+        # Thread-Pool für PyPI-Abfragen
+        self._pypi_executor = ThreadPoolExecutor(max_workers=4)
 
         # Erstelle die UI-Komponenten
         self.create_widgets()
@@ -814,7 +1041,7 @@ class ModuleExplorerApp:
 
         # NEUE FUNKTION: Aktive Module-Fenster und Bäume (für Updates der Auswahl)
         self.active_module_windows = {}
-        self.active_module_trees = {}
+        self.active_module_tables = {}
 
     def _configure_styles(self):
         """
@@ -1009,6 +1236,39 @@ class ModuleExplorerApp:
                                         command=self.add_missing_imports)
         add_imports_button.pack(side=tk.LEFT, padx=5)
 
+        # Frame für die Live-Suche
+        self.search_frame = ttk.Frame(self.main_frame)
+        self.search_frame.pack(fill=tk.X, pady=(0, 10))
+
+        search_label = ttk.Label(self.search_frame, text="Module suchen:")
+        search_label.pack(side=tk.LEFT, padx=5)
+
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var,
+                                      style="Search.TEntry", width=40)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.search_status_label = ttk.Label(self.search_frame, text="")
+        self.search_status_label.pack(side=tk.LEFT, padx=5)
+
+        # Trefferliste; wird erst bei einer Suchanfrage eingeblendet
+        self.search_results_table = VirtualTable(self.main_frame, [
+            ("select", "Auswählen", 80, tk.CENTER),
+            ("name", "Modulname", 150, tk.W),
+            ("description", "Beschreibung", 300, tk.W),
+            ("category", "Kategorie", 120, tk.W),
+            ("doc_url", "Dokumentation", 200, tk.W),
+        ], self._search_row_values, self._search_row_key)
+        self.search_results_tree = self.search_results_table.tree
+        self.search_results_tree.tag_configure('even', background=self.colors['bg_light'])
+        self.search_results_tree.tag_configure('odd', background=self.colors['bg_medium'])
+        self.search_results_tree.bind("<Double-1>", self.on_module_select)
+        self.search_results_tree.bind("<ButtonRelease-1>",
+                                      lambda event: self.on_table_click(event, self.search_results_tree))
+
+        self.search_var.trace_add("write", self._on_search_changed)
+        self.search_entry.bind("<Escape>", lambda event: self.search_var.set(""))
+
         # Container für die ausgewählten Module
         self.selected_frame = ttk.LabelFrame(self.main_frame, text="Ausgewählte Module", padding=15)
         self.selected_frame.pack(fill=tk.X, pady=15)
@@ -1065,6 +1325,82 @@ class ModuleExplorerApp:
         # Binding für Enter-Taste im Import-Eingabefeld
         self.missing_imports_entry.bind("<Return>", lambda event: self.add_missing_imports())
 
+    def _on_search_changed(self, *args):
+        """
+        Startet die Live-Suche erst, wenn eine Weile keine Taste mehr gedrückt wurde
+        """
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._run_live_search)
+
+    def _run_live_search(self):
+        """
+        Gibt die aktuelle Suchanfrage an den Such-Thread weiter
+        """
+        self.search_after_id = None
+        self._search_generation += 1
+        query = self.search_var.get()
+
+        if not query.strip():
+            self.search_results_table.set_rows([])
+            self.search_results_table.frame.pack_forget()
+            self.search_status_label.configure(text="")
+            return
+
+        self.search_status_label.configure(text="Suche...")
+        self._search_executor.submit(self._live_search_worker, self._search_generation, query)
+
+    def _live_search_worker(self, generation, query):
+        """
+        Führt die Suche im Hintergrund-Thread aus
+
+        Args:
+            generation: Nummer der Anfrage
+            query: Die Suchanfrage
+        """
+        # Inzwischen überholte Anfragen gar nicht erst ausführen
+        if generation != self._search_generation:
+            return
+        start = time.perf_counter()
+        hits = self._incremental_search.search(query, SEARCH_UI_LIMIT)
+        elapsed = time.perf_counter() - start
+        self.root.after(0, self._show_search_results, generation, hits, elapsed)
+
+    def _show_search_results(self, generation, hits, elapsed):
+        """
+        Zeigt die Treffer der Live-Suche an (im Tk-Thread)
+
+        Args:
+            generation: Nummer der Anfrage
+            hits: Die Suchtreffer
+            elapsed: Suchdauer in Sekunden
+        """
+        if generation != self._search_generation:
+            return
+
+        self.search_results_table.set_rows(hits)
+        if not self.search_results_table.frame.winfo_manager():
+            self.search_results_table.frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10),
+                                                 after=self.search_frame)
+
+        count = f"{len(hits)}+" if len(hits) >= SEARCH_UI_LIMIT else str(len(hits))
+        self.search_status_label.configure(text=f"{count} Treffer ({elapsed * 1000:.1f} ms)")
+
+    def _search_row_values(self, hit):
+        """
+        Bildet die Spaltenwerte einer Trefferzeile (nur für sichtbare Zeilen aufgerufen)
+        """
+        module = self.module_data.modules_by_category[hit.category][hit.position]
+        select_text = "✅" if module["name"] in self.selected_modules else "☐"
+        return (select_text, module["name"], module["description"], hit.category,
+                module.get("doc_url", "N/A"))
+
+    def _search_row_key(self, hit):
+        """
+        Liefert den Modulnamen eines Suchtreffers (Schlüssel für gezielte Zeilen-Updates)
+        """
+        return self.module_data.modules_by_category[hit.category][hit.position]["name"]
+
     def _create_category_buttons(self):
         """
         Erstellt Buttons für jede Kategorie in einem Raster-Layout
@@ -1322,14 +1658,7 @@ class ModuleExplorerApp:
             return
 
         # Füge die Module zur Auswahlliste hinzu
-        for module in modules_to_add:
-            self.selected_modules.add(module)
-
-        # Aktualisiere die Anzeige der ausgewählten Module
-        self.update_selected_modules_display()
-
-        # Aktualisiere alle Trees
-        self.update_all_trees()
+        self.selected_modules.update(modules_to_add)
 
         # Leere das Eingabefeld
         self.missing_imports_var.set("")
@@ -1396,21 +1725,8 @@ class ModuleExplorerApp:
                 self.show_pypi_info(module_name)
                 return
 
-            # Überprüfe, ob das Modul bereits ausgewählt ist
-            if module_name in self.selected_modules:
-                # Entferne das Modul aus der Auswahlliste
-                self.selected_modules.remove(module_name)
-                tree.set(item_id, "select", "☐")
-            else:
-                # Füge das Modul zur Auswahlliste hinzu
-                self.selected_modules.add(module_name)
-                tree.set(item_id, "select", "✅")
-
-            # Aktualisiere die Anzeige der ausgewählten Module
-            self.update_selected_modules_display()
-
-            # Aktualisiere alle anderen Bäume
-            self.update_all_trees()
+            # Wähle das Modul aus bzw. ab; Tabellen und Anzeige folgen über _on_selection_changed
+            self.selected_modules.toggle(module_name)
 
     def show_pypi_info(self, module_name):
         """
@@ -1472,11 +1788,8 @@ class ModuleExplorerApp:
                                   command=info_window.destroy)
         close_button.pack(side=tk.RIGHT, padx=5)
 
-        # Starte einen Thread, um PyPI-Informationen zu laden
-        thread = threading.Thread(target=self._load_pypi_info,
-                                  args=(module_name, info_text, info_window))
-        thread.daemon = True
-        thread.start()
+        # Lade die PyPI-Informationen im Hintergrund (gemeinsamer Thread-Pool statt Thread je Klick)
+        self._pypi_executor.submit(self._load_pypi_info, module_name, info_text, info_window)
 
     def _load_pypi_info(self, module_name, info_text, window):
         """
@@ -1488,26 +1801,19 @@ class ModuleExplorerApp:
             window: Das Fenster, in dem die Informationen angezeigt werden
         """
         try:
-            # Versuche, pip als Modul zu importieren, um Informationen über das Paket zu erhalten
-            import pip._vendor.requests as requests
-
-            # Mache eine Anfrage an die PyPI JSON API
-            response = requests.get(f"https://pypi.org/pypi/{module_name}/json", timeout=5)
-
-            if response.status_code == 200:
-                # Parse die JSON-Antwort
-                data = response.json()
-
-                # Aktualisiere das Textfeld in der GUI (muss im Hauptthread erfolgen)
-                window.after(0, lambda: self._update_pypi_info(info_text, data))
-            else:
-                # Fehler bei der Anfrage
-                window.after(0, lambda: self._update_pypi_info_error(info_text,
-                                                                     f"Fehler beim Laden der Informationen: Statuscode {response.status_code}"))
+            # Gemeinsamer Client mit Verbindungs-Pool und Festplatten-Cache
+            data = pypi_client.get_project(module_name)
+
+            # Aktualisiere das Textfeld in der GUI (muss im Hauptthread erfolgen)
+            window.after(0, lambda: self._update_pypi_info(info_text, data))
+        except PyPIError as e:
+            reason = f"Statuscode {e.status}" if e.status else str(e)
+            message = f"Fehler beim Laden der Informationen: {reason}"
+            window.after(0, lambda: self._update_pypi_info_error(info_text, message))
         except Exception as e:
             # Allgemeiner Fehler
-            window.after(0, lambda: self._update_pypi_info_error(info_text,
-                                                                 f"Fehler beim Laden der Informationen: {str(e)}"))
+            message = f"Fehler beim Laden der Informationen: {str(e)}"
+            window.after(0, lambda: self._update_pypi_info_error(info_text, message))
 
     def _update_pypi_info(self, info_text, data):
         """
@@ -1602,15 +1908,13 @@ class ModuleExplorerApp:
         Args:
             module_name: Der Name des Moduls
         """
-        # Suche nach dem Modul in allen Kategorien
-        for category, modules in self.module_data.modules_by_category.items():
-            for module in modules:
-                if module["name"].lower() == module_name.lower():
-                    # Öffne die Dokumentations-URL, wenn sie vorhanden ist
-                    doc_url = module.get("doc_url", "")
-                    if doc_url:
-                        webbrowser.open(doc_url)
-                        return
+        # Suche das Modul über den Namensindex des Katalogs
+        module = self.module_data.get_module(module_name)
+        # Öffne die Dokumentations-URL, wenn sie vorhanden ist
+        doc_url = module.get("doc_url", "") if module else ""
+        if doc_url:
+            webbrowser.open(doc_url)
+            return
 
         # Wenn keine URL gefunden wurde, öffne die PyPI-Seite
         webbrowser.open(f"https://pypi.org/project/{module_name}/")
@@ -1652,6 +1956,20 @@ class ModuleExplorerApp:
                                             variable=self.add_missing_var)
         add_missing_check.pack(anchor=tk.W, pady=(0, 15))
 
+        # Tiefenprüfung: Module wirklich importieren statt nur zu suchen
+        self.deep_check_var = tk.BooleanVar(value=False)
+        deep_check = ttk.Checkbutton(frame,
+                                     text="Tiefenprüfung (Module in eigenen Prozessen importieren, langsamer)",
+                                     variable=self.deep_check_var)
+        deep_check.pack(anchor=tk.W, pady=(0, 15))
+
+        # Importzeiten messen: jedes Modul unter python -X importtime importieren
+        self.profile_imports_var = tk.BooleanVar(value=False)
+        profile_check = ttk.Checkbutton(frame,
+                                        text="Importzeiten messen (python -X importtime, langsamste Importe anzeigen)",
+                                        variable=self.profile_imports_var)
+        profile_check.pack(anchor=tk.W, pady=(0, 15))
+
         # Beispieltext
         example = ttk.Label(frame,
                             text="Beispiel: numpy, pandas, matplotlib, requests",
@@ -1737,40 +2055,142 @@ class ModuleExplorerApp:
             return
 
         # Extrahiere die Modulnamen und entferne Leerzeichen
-        module_names = [name.strip() for name in input_text.split(',')]
+        module_names = [name.strip() for name in input_text.split(',') if name.strip()]
+
+        # Doppelte Starts verhindern, solange die Prüfung läuft
+        if getattr(self, '_import_test_running', False):
+            return
+        self._import_test_running = True
+        self.import_dialog.title("Module werden geprüft...")
 
-        # Überprüfe die Module
-        results = ModuleChecker.check_importable(module_names)
+        # Die Prüfung läuft im Hintergrund, damit die Oberfläche reagiert
+        profile = self.profile_imports_var.get()
+        deep = self.deep_check_var.get() or profile
+        thread = threading.Thread(target=self._run_import_test_worker, args=(module_names, deep, profile))
+        thread.daemon = True
+        thread.start()
+
+    def _run_import_test_worker(self, module_names, deep, profile=False):
+        """
+        Prüft die Module (läuft im Hintergrund-Thread)
+
+        Args:
+            module_names: Liste der zu überprüfenden Modulnamen
+            deep: Module in isolierten Prozessen importieren statt nur zu suchen
+            profile: Importzeiten mit python -X importtime messen
+        """
+        if profile:
+            results = ModuleChecker.profile_imports(module_names)
+        elif deep:
+            results = ModuleChecker.check_imports_isolated(module_names)
+        else:
+            results = ModuleChecker.find_modules(module_names)
+        # Ergebnisse im Hauptthread anzeigen
+        self.root.after(0, lambda: self._show_import_test_results(results, deep, profile))
+
+    def _format_import_profile(self, results):
+        """
+        Formatiert die gemessenen Importzeiten für den Ergebnisdialog
+
+        Args:
+            results: Ergebnisse von ModuleChecker.profile_imports
+
+        Returns:
+            Text mit der Gesamtzeit pro Modul und den langsamsten Importen
+        """
+        profiled = {name: result for name, result in results.items() if result['tree']}
+        if not profiled:
+            return "Importzeiten: keine Messwerte (Module schon beim Start geladen oder nicht importierbar)\n\n"
+
+        text = "Importzeiten gesamt (kumuliert):\n"
+        for name, result in sorted(profiled.items(), key=lambda item: item[1]['tree']['cumulative_us'],
+                                   reverse=True):
+            text += f"⏱ {name}: {result['tree']['cumulative_us'] / 1000:.1f} ms\n"
+
+        # Langsamste Einzelimporte über alle Module (nach eigener Zeit)
+        offenders = [(node, name) for name, result in profiled.items() for node in result['top']]
+        offenders.sort(key=lambda item: item[0]['self_us'], reverse=True)
+
+        text += "\nLangsamste Importe (eigene Zeit / kumuliert):\n"
+        for node, name in offenders[:IMPORT_PROFILE_TOP]:
+            text += (f"{node['self_us'] / 1000:8.1f} ms / {node['cumulative_us'] / 1000:8.1f} ms  "
+                     f"{node['name']}  [{name}]\n")
+        return text + "\n"
+
+    def _export_import_profile(self, results):
+        """
+        Speichert die gemessenen Importzeiten als JSON-Datei
+
+        Args:
+            results: Ergebnisse von ModuleChecker.profile_imports
+        """
+        # Verzeichnis für die Messungen erstellen, falls es nicht existiert
+        profile_dir = os.path.join(self.config_manager.config_dir, "importtime")
+        os.makedirs(profile_dir, exist_ok=True)
+
+        # Dateiname mit Zeitstempel
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        filename = os.path.join(profile_dir, f"importtime_{timestamp}.json")
+
+        data = {
+            'python': sys.version,
+            'executable': sys.executable,
+            'created': timestamp,
+            'modules': results
+        }
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Die Importzeiten konnten nicht gespeichert werden:\n{e}")
+            return
+
+        messagebox.showinfo("Importzeiten gespeichert",
+                            f"Die Importzeiten wurden als\n{filename}\ngespeichert.")
+
+    def _show_import_test_results(self, results, deep=False, profile=False):
+        """
+        Zeigt die Ergebnisse des Import-Tests an
+
+        Args:
+            results: Ergebnisse von ModuleChecker.check_imports_isolated, find_modules
+                oder profile_imports
+            deep: Ob die Module tatsächlich importiert wurden
+            profile: Ob Importzeiten gemessen wurden
+        """
+        self._import_test_running = False
 
         # Erstelle die Ergebnismeldung
-        success_modules = [name for name, success in results.items() if success]
-        failed_modules = [name for name, success in results.items() if not success]
+        success_modules = [name for name, result in results.items() if result['success']]
+        failed_modules = [name for name, result in results.items() if not result['success']]
 
         message = "Testergebnisse:\n\n"
 
         if success_modules:
-            message += "Erfolgreich importiert:\n"
-            message += "\n".join(f"✅ {name}" for name in success_modules)
+            if deep:
+                message += "Erfolgreich importiert:\n"
+                message += "\n".join(f"✅ {name} ({results[name]['seconds']:.2f} s)" for name in success_modules)
+            else:
+                message += "Gefunden (ohne Import geprüft):\n"
+                message += "\n".join(f"✅ {name} {ModuleChecker.get_module_version(name)}"
+                                      for name in success_modules)
             message += "\n\n"
 
+        if profile:
+            message += self._format_import_profile(results)
+
         if failed_modules:
             message += "Nicht importierbar:\n"
-            message += "\n".join(f"❌ {name}" for name in failed_modules)
+            message += "\n".join(f"❌ {name}: {results[name]['error']}" for name in failed_modules)
             message += "\n\n"
             message += "Hinweis: Diese Module müssen möglicherweise installiert werden.\n"
             message += "Du kannst sie mit 'pip install [modulname]' installieren."
 
-        # Füge erfolgreiche Module zur Auswahlliste hinzu
-        for module in success_modules:
-            self.selected_modules.add(module)
-
-        # Füge fehlende Module zur Auswahlliste hinzu, wenn die Option aktiviert ist
-        if self.add_missing_var.get():
-            for module in failed_modules:
-                self.selected_modules.add(module)
-
-        # Aktualisiere das Anzeigen der ausgewählten Module
-        self.update_selected_modules_display()
+        # Füge erfolgreiche (und auf Wunsch fehlende) Module in einem Schritt zur Auswahlliste hinzu
+        with self.selected_modules.batch():
+            self.selected_modules.update(success_modules)
+            if self.add_missing_var.get():
+                self.selected_modules.update(failed_modules)
 
         # Zeige die Ergebnisse an
         self.import_dialog.destroy()
@@ -1778,7 +2198,7 @@ class ModuleExplorerApp:
         # Erstelle ein angepasstes Ergebnisfenster
         result_dialog = tk.Toplevel(self.root)
         result_dialog.title("Import-Testergebnisse")
-        result_dialog.geometry("600x400")
+        result_dialog.geometry("800x600" if profile else "600x400")
         result_dialog.configure(background=self.colors['bg_light'])
         result_dialog.transient(self.root)
         result_dialog.grab_set()
@@ -1804,6 +2224,12 @@ class ModuleExplorerApp:
                              font=('Helvetica', 12, 'bold'))
             hint.pack(pady=10)
 
+        # Export der gemessenen Importzeiten
+        if profile:
+            export_button = ttk.Button(frame, text="Importzeiten als JSON exportieren",
+                                       command=lambda: self._export_import_profile(results))
+            export_button.pack(pady=(10, 0))
+
         # OK-Button mit abgerundeten Ecken
         ok_canvas = tk.Canvas(frame, width=120, height=40,
                               bg=self.colors['accent'],
@@ -1872,7 +2298,7 @@ class ModuleExplorerApp:
             # Bringe das Fenster in den Vordergrund
             self.active_module_windows[category].lift()
             # Aktualisiere die Auswahl in der Tabelle
-            self._update_module_tree_selection(self.active_module_trees[category])
+            self.active_module_tables[category].refresh()
             return
 
         # Erstelle ein neues Fenster für die Modulliste
@@ -1905,10 +2331,10 @@ class ModuleExplorerApp:
         instruction.pack(pady=(0, 15))
 
         # Erstelle die Tabelle mit den Moduldetails
-        tree = self._create_module_table(frame, modules)
+        table = self._create_module_table(frame, modules)
 
-        # Speichere den Tree in der Liste der aktiven Trees
-        self.active_module_trees[category] = tree
+        # Speichere die Tabelle in der Liste der aktiven Tabellen
+        self.active_module_tables[category] = table
 
         # Button-Frame mit besserem Styling
         button_frame = ttk.Frame(frame)
@@ -1970,9 +2396,9 @@ class ModuleExplorerApp:
 
         # Binde Klick-Event
         select_all_canvas.tag_bind("select_rect", "<Button-1>",
-                                   lambda event: self.select_all_modules(modules, tree))
+                                   lambda event: self.select_all_modules(modules))
         select_all_canvas.tag_bind("select_text", "<Button-1>",
-                                   lambda event: self.select_all_modules(modules, tree))
+                                   lambda event: self.select_all_modules(modules))
 
     def _on_module_window_close(self, category):
         """
@@ -1986,128 +2412,78 @@ class ModuleExplorerApp:
             self.active_module_windows[category].destroy()
             del self.active_module_windows[category]
 
-        # Entferne den Tree aus der Liste der aktiven Trees
-        if category in self.active_module_trees:
-            del self.active_module_trees[category]
+        # Entferne die Tabelle aus der Liste der aktiven Tabellen
+        if category in self.active_module_tables:
+            del self.active_module_tables[category]
 
-    def _create_module_table(self, parent, modules: List[Dict[str, str]]):
+    def _create_module_table(self, parent, modules: List[Dict[str, str]]) -> VirtualTable:
         """
         Erstellt eine Tabelle mit den Moduldetails
 
+        Die Tabelle ist virtualisiert: nur die sichtbaren Zeilen existieren als
+        Treeview-Einträge, Versionen werden erst beim Anzeigen ermittelt.
+
         Args:
             parent: Das Elternelement für die Tabelle
             modules: Liste der Module mit ihren Details
 
         Returns:
-            Der erstellte Treeview
+            Die erstellte Tabelle
         """
-        # Erstelle ein Frame für den Treeview mit Scrollbar
-        tree_frame = ttk.Frame(parent)
-        tree_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Scrollbar mit angepasstem Styling
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Treeview für die Tabelle
-        columns = ("select", "name", "description", "version", "doc_url")
-
-        tree = ttk.Treeview(tree_frame, columns=columns, show="headings",
-                            yscrollcommand=scrollbar.set,
-                            style="Treeview")
-
-        # Definiere die Spaltenheader
-        tree.heading("select", text="Auswählen")
-        tree.heading("name", text="Modulname")
-        tree.heading("description", text="Beschreibung")
-        tree.heading("version", text="Aktuelle Version")
-        tree.heading("doc_url", text="Dokumentation")
-
-        # Definiere die Spaltenbreiten
-        tree.column("select", width=80, anchor=tk.CENTER)
-        tree.column("name", width=150)
-        tree.column("description", width=300)
-        tree.column("version", width=100)
-        tree.column("doc_url", width=200)
-
-        # Füge die Module zur Tabelle hinzu
-        for i, module in enumerate(modules):
-            # Versuche, die aktuelle Version des Moduls zu ermitteln
-            version = ModuleChecker.get_module_version(module["name"])
-
-            # Überprüfe, ob das Modul bereits ausgewählt ist
-            select_text = "✅" if module["name"] in self.selected_modules else "☐"
-
-            # Hole die URL für die Dokumentation
-            doc_url = module.get("doc_url", "N/A")
-
-            item_id = tree.insert("", tk.END, values=(
-                select_text,
-                module["name"],
-                module["description"],
-                version,
-                doc_url
-            ))
-
-            # Setze den Tag für das Item, um später auf das Modul zugreifen zu können
-            tree.item(item_id, tags=(module["name"],))
+        table = VirtualTable(parent, [
+            ("select", "Auswählen", 80, tk.CENTER),
+            ("name", "Modulname", 150, tk.W),
+            ("description", "Beschreibung", 300, tk.W),
+            ("version", "Aktuelle Version", 100, tk.W),
+            ("doc_url", "Dokumentation", 200, tk.W),
+        ], self._module_row_values, lambda module: module["name"])
+        table.frame.pack(fill=tk.BOTH, expand=True)
 
-            # Alternativ graue und weiße Zeilen für bessere Lesbarkeit
-            if i % 2 == 0:
-                tree.item(item_id, tags=(module["name"], "even"))
-            else:
-                tree.item(item_id, tags=(module["name"], "odd"))
+        tree = table.tree
 
         # Konfiguriere Farbwechsel für Zeilen
         tree.tag_configure('even', background=self.colors['bg_light'])
         tree.tag_configure('odd', background=self.colors['bg_medium'])
 
-        # Packe die Tabelle und verbinde sie mit der Scrollbar
-        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=tree.yview)
-
         # Binde Doppelklick-Event an den Treeview, um ein Modul auszuwählen/abzuwählen
         tree.bind("<Double-1>", self.on_module_select)
 
         # Für Touch-Bedienung: Auch einfacher Klick auf die Auswahl-Spalte
         tree.bind("<ButtonRelease-1>", lambda event: self.on_table_click(event, tree))
 
-        return tree
+        table.set_rows(modules)
+        return table
 
-    def _update_module_tree_selection(self, tree):
+    def _module_row_values(self, module: Dict[str, str]) -> tuple:
         """
-        Aktualisiert die Auswahl in einem Treeview basierend auf den ausgewählten Modulen
-
-        Args:
-            tree: Der zu aktualisierende Treeview
+        Bildet die Spaltenwerte einer Modulzeile (nur für sichtbare Zeilen aufgerufen)
         """
-        if not tree:
-            return
+        # Überprüfe, ob das Modul bereits ausgewählt ist
+        select_text = "✅" if module["name"] in self.selected_modules else "☐"
 
-        # Für jedes Item im Tree
-        for item_id in tree.get_children():
-            # Hole den Modulnamen
-            values = tree.item(item_id, 'values')
-            if not values:
-                continue
-
-            module_name = values[1]  # Index 1 entspricht der Spalte "name"
-
-            # Aktualisiere den Auswahlstatus
-            select_text = "✅" if module_name in self.selected_modules else "☐"
-            tree.set(item_id, "select", select_text)
+        return (select_text,
+                module["name"],
+                module["description"],
+                ModuleChecker.get_module_version(module["name"]),
+                module.get("doc_url", "N/A"))
 
-    def update_all_trees(self):
+    def update_all_trees(self, changed_modules=None):
         """
-        Aktualisiert die Auswahl in allen aktiven Treeviews
+        Aktualisiert die Auswahl in allen aktiven Tabellen
+
+        Args:
+            changed_modules: Namen der Module, deren Auswahl sich geändert hat;
+                ohne Angabe werden alle sichtbaren Zeilen neu befüllt
         """
-        # Aktualisiere die Trees in allen geöffneten Modulfenstern
-        for tree in self.active_module_trees.values():
-            self._update_module_tree_selection(tree)
+        tables = list(self.active_module_tables.values())
+        if hasattr(self, 'search_results_table'):
+            tables.append(self.search_results_table)
 
-        # Aktualisiere auch den Suchergebniss-Tree, falls vorhanden
-        if hasattr(self, 'search_results_tree') and self.search_results_tree.winfo_exists():
-            self._update_module_tree_selection(self.search_results_tree)
+        for table in tables:
+            if changed_modules is None:
+                table.refresh()
+            else:
+                table.refresh_keys(changed_modules)
 
     def on_module_select(self, event):
         """
@@ -2133,21 +2509,8 @@ class ModuleExplorerApp:
             values = tree.item(item_id, 'values')
             module_name = values[1]  # Index 1 entspricht der Spalte "name"
 
-            # Überprüfe, ob das Modul bereits ausgewählt ist
-            if module_name in self.selected_modules:
-                # Entferne das Modul aus der Auswahlliste
-                self.selected_modules.remove(module_name)
-                tree.set(item_id, "select", "☐")
-            else:
-                # Füge das Modul zur Auswahlliste hinzu
-                self.selected_modules.add(module_name)
-                tree.set(item_id, "select", "✅")
-
-            # Aktualisiere die Anzeige der ausgewählten Module
-            self.update_selected_modules_display()
-
-            # Aktualisiere alle anderen Bäume
-            self.update_all_trees()
+            # Wähle das Modul aus bzw. ab; Tabellen und Anzeige folgen über _on_selection_changed
+            self.selected_modules.toggle(module_name)
 
     def on_table_click(self, event, tree):
         """
@@ -2184,21 +2547,29 @@ class ModuleExplorerApp:
         elif column_index == 0:  # Index 0 entspricht der Spalte "select"
             module_name = values[1]  # Index 1 entspricht der Spalte "name"
 
-            # Überprüfe, ob das Modul bereits ausgewählt ist
-            if module_name in self.selected_modules:
-                # Entferne das Modul aus der Auswahlliste
-                self.selected_modules.remove(module_name)
-                tree.set(item_id, "select", "☐")
-            else:
-                # Füge das Modul zur Auswahlliste hinzu
-                self.selected_modules.add(module_name)
-                tree.set(item_id, "select", "✅")
+            # Wähle das Modul aus bzw. ab; Tabellen und Anzeige folgen über _on_selection_changed
+            self.selected_modules.toggle(module_name)
+
+    def _on_selection_changed(self, added: Set[str], removed: Set[str]):
+        """
+        Beobachter des Auswahlmodells: aktualisiert nur die betroffenen Zeilen
+        und zeichnet die Auswahlanzeige einmal gesammelt neu
+
+        Args:
+            added: Neu ausgewählte Module
+            removed: Abgewählte Module
+        """
+        self.update_all_trees(added | removed)
 
-            # Aktualisiere die Anzeige der ausgewählten Module
-            self.update_selected_modules_display()
+        if self._selection_redraw_id is None:
+            self._selection_redraw_id = self.root.after_idle(self._redraw_selected_modules)
 
-            # Aktualisiere alle anderen Bäume
-            self.update_all_trees()
+    def _redraw_selected_modules(self):
+        """
+        Zeichnet die Auswahlanzeige neu, sobald Tk im Leerlauf ist
+        """
+        self._selection_redraw_id = None
+        self.update_selected_modules_display()
 
     def update_selected_modules_display(self):
         """
@@ -2212,7 +2583,7 @@ class ModuleExplorerApp:
 
         # Füge die ausgewählten Module ein
         if self.selected_modules:
-            self.selected_text.insert(tk.END, ", ".join(sorted(self.selected_modules)))
+            self.selected_text.insert(tk.END, ", ".join(self.selected_modules.sorted()))
         else:
             self.selected_text.insert(tk.END, "Keine Module ausgewählt")
 
@@ -2231,34 +2602,16 @@ class ModuleExplorerApp:
                 return
 
         self.selected_modules.clear()
-        self.update_selected_modules_display()
-
-        # Aktualisiere alle Trees
-        self.update_all_trees()
 
-    def select_all_modules(self, modules, tree):
+    def select_all_modules(self, modules):
         """
         Wählt alle Module einer Kategorie aus
 
         Args:
             modules: Liste der Module
-            tree: Der Treeview mit den Modulen
         """
-        # Füge alle Module zur Auswahlliste hinzu
-        for module in modules:
-            self.selected_modules.add(module["name"])
-
-        # Aktualisiere die Anzeige der ausgewählten Module
-        self.update_selected_modules_display()
-
-        # Aktualisiere die Anzeige in der Tabelle
-        for item_id in tree.get_children():
-            values = tree.item(item_id, 'values')
-            if values:
-                tree.set(item_id, "select", "✅")
-
-        # Aktualisiere alle anderen Bäume
-        self.update_all_trees()
+        # Füge alle Module zur Auswahlliste hinzu (ein Ereignis für alle)
+        self.selected_modules.update(module["name"] for module in modules)
 
     def generate_import_code(self):
         """
@@ -2709,6 +3062,10 @@ else:
                            style='Header.TLabel')
         header.pack(pady=(0, 20))
 
+        # matplotlib wird erst für das erste Diagramm geladen
+        plt = lazy_import("matplotlib.pyplot")
+        FigureCanvasTkAgg = lazy_import("matplotlib.backends.backend_tkagg").FigureCanvasTkAgg
+
         # Erstelle die Matplotlib-Figur
         fig, ax = plt.subplots(figsize=(10, 6))
         fig.patch.set_facecolor(self.colors['bg_light'])
@@ -2820,9 +3177,9 @@ def check_python_version():
         True, wenn die Version kompatibel ist, sonst False
     """
     major, minor = sys.version_info[:2]
-    if major < 3 or (major == 3 and minor < 6):
+    if major < 3 or (major == 3 and minor < 8):
         messagebox.showerror("Python-Version nicht unterstützt",
-                             "Diese Anwendung benötigt Python 3.6 oder neuer.\n"
+                             "Diese Anwendung benötigt Python 3.8 oder neuer.\n"
                              f"Du verwendest Python {major}.{minor}.")
         return False
     return True
@@ -2831,13 +3188,22 @@ def check_python_version():
 def main():
     """
     Hauptfunktion zum Starten der Anwendung
+
+    Mit --profile-startup wird die Dauer der Startphasen bis zum ersten
+    sichtbaren Fenster auf der Konsole ausgegeben.
     """
+    profile = StartupProfile(_MODULE_LOAD_START) if "--profile-startup" in sys.argv[1:] else None
+    if profile:
+        profile.mark("Module laden")
+
     # Überprüfe die Python-Version
     if not check_python_version():
         return
 
     root = tk.Tk()
     root.title("Python Module Explorer")
+    if profile:
+        profile.mark("Tk initialisieren")
 
     # Setze ein minimales Fenster
     root.minsize(800, 600)
@@ -2858,6 +3224,17 @@ def main():
     # Erstelle die Anwendung
     app = ModuleExplorerApp(root)
 
+    if profile:
+        profile.mark("Oberfläche aufbauen")
+
+        def report_first_window():
+            # Erst nach dem ersten Zeichnen gilt das Fenster als sichtbar
+            root.update_idletasks()
+            profile.mark("Erstes Fenster zeichnen")
+            print(profile.report(), flush=True)
+
+        root.after_idle(report_first_window)
+
     # Starte die Hauptschleife
     root.mainloop()
 
@@ -1,14 +1,25 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
-import importlib
-import subprocess
-import sys
+import gzip
+import hashlib
 import json
-import os
 import platform
-import requests
-from typing import List, Dict, Any, Set, Optional
-import pkg_resources
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+from importus_core import (CATALOG_FILE, CATALOG_FORMAT, IMPORT_CHECK_TIMEOUT, IMPORT_CHECK_WORKERS,
+                           PYPI_CACHE_MAX_AGE, PyPIError, SearchHit, SearchIndex, check_imports_isolated,
+                           distribution_index, find_import_name, iter_imports_isolated, load_catalog,
+                           normalize_distribution_name, probe_import, pypi_client)
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it catalog responses are offered with gzip only
+    brotli = None
 
 app = Flask(__name__, static_folder='static')
 CORS(app)  # Enable CORS for all routes
@@ -18,25 +29,16 @@ CORS(app)  # Enable CORS for all routes
 class ModuleData:
     """Class to manage the module database"""
 
-    def __init__(self):
+    def __init__(self, catalog_path: str = CATALOG_FILE):
+        catalog = load_catalog(catalog_path)
+        # Content hash of the catalog
+        self.version = catalog["version"]
         # Dictionary with module information, categorized
-        self.modules_by_category = {
-            "Frontend": [
-                {"name": "Tkinter", "description": "Builtin GUI Toolkit",
-                 "doc_url": "https://docs.python.org/3/library/tkinter.html"},
-                {"name": "PyQt5", "description": "Python-Bindings für Qt5",
-                 "doc_url": "https://www.riverbankcomputing.com/static/Docs/PyQt5/"},
-                # ... other modules
-            ],
-            "Backend": [
-                {"name": "Django", "description": "High-Level Webframework",
-                 "doc_url": "https://docs.djangoproject.com/en/stable/"},
-                {"name": "Flask", "description": "Lightweight web framework",
-                 "doc_url": "https://flask.palletsprojects.com/"},
-                # ... other modules
-            ],
-            # ... other categories
-        }
+        self.modules_by_category = catalog["modules_by_category"]
+        self.module_names = catalog["module_names"]
+        # Lower-case module name -> list of (category, position)
+        self.name_index = catalog["name_index"]
+        self.search_index = SearchIndex(catalog["search_index"])
 
     def get_categories(self) -> List[str]:
         """Returns the list of all available categories"""
@@ -50,42 +52,57 @@ class ModuleData:
 
     def get_module_names(self) -> List[str]:
         """Returns a list of all module names"""
-        all_modules = []
-        for category_modules in self.modules_by_category.values():
-            all_modules.extend([module["name"] for module in category_modules])
-        return all_modules
+        return list(self.module_names)
 
-    def search_modules(self, query: str) -> List[Dict[str, Any]]:
+    def get_module(self, name: str) -> Optional[Dict[str, Any]]:
         """
-        Searches for modules that match the query
+        Looks up a module via the precomputed name index
+
+        Args:
+            name: Module name (case-insensitive)
+
+        Returns:
+            Module data with category field, or None
+        """
+        locations = self.name_index.get(name.lower())
+        if not locations:
+            return None
+        category, position = locations[0]
+        module = dict(self.modules_by_category[category][position])
+        module["category"] = category
+        return module
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Searches the inverted index and returns references to the hits only
 
         Args:
             query: The search query
+            limit: Maximum number of hits (None: all hits)
 
         Returns:
-            List of found modules with additional category field
+            Hits sorted by relevance (see resolve)
         """
-        if not query:
-            return []
-
-        query = query.lower()
-        results = []
-
-        for category, modules in self.modules_by_category.items():
-            for module in modules:
-                # Search in name
-                if query in module["name"].lower():
-                    # Add category to module
-                    module_with_category = module.copy()
-                    module_with_category["category"] = category
-                    results.append(module_with_category)
-                # Search in description
-                elif query in module["description"].lower():
-                    module_with_category = module.copy()
-                    module_with_category["category"] = category
-                    results.append(module_with_category)
+        return self.search_index.search(query, limit)
 
-        return results
+    def resolve(self, hit: SearchHit) -> Dict[str, Any]:
+        """Turns a search hit into the module data with an additional category field"""
+        module = dict(self.modules_by_category[hit.category][hit.position])
+        module["category"] = hit.category
+        return module
+
+    def search_modules(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Searches for modules that match the query
+
+        Args:
+            query: The search query
+            limit: Maximum number of hits (None: all hits)
+
+        Returns:
+            List of found modules with additional category field, sorted by relevance
+        """
+        return [self.resolve(hit) for hit in self.search(query, limit)]
 
     def get_module_popularity(self, category: str) -> Dict[str, int]:
         """
@@ -102,69 +119,278 @@ class ModuleData:
         return popularity
 
 
+# In-memory cache of the /api/pypi_info proxy: entry count, freshness and
+# how long an expired entry may still be served while it is refreshed (seconds)
+PYPI_MEMORY_CACHE_SIZE = 128
+PYPI_MEMORY_TTL = PYPI_CACHE_MAX_AGE
+PYPI_MEMORY_STALE = 3600
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into a single execution"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def in_flight(self, key) -> bool:
+        """Returns True while a call for the key is running"""
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key, fn):
+        """
+        Runs fn once for all concurrent callers with the same key
+
+        Args:
+            key: Key identifying the call
+            fn: Function without arguments
+
+        Returns:
+            The result of fn (the exception of fn is raised for every caller)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with time-to-live and stale-while-revalidate
+
+    An entry is fresh for ttl seconds and may then be served as stale for
+    stale more seconds, while the caller refreshes it. clock returns the
+    current time in seconds (replaceable in tests).
+    """
+
+    def __init__(self, maxsize: int, ttl: float, stale: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale = stale
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Tuple[Any, Optional[str]]:
+        """
+        Looks up a key
+
+        Returns:
+            (value, state) with state "fresh", "stale" or None if missing/expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            value, stored = entry
+            age = self.clock() - stored
+            if age >= self.ttl + self.stale:
+                del self._entries[key]
+                return None, None
+            self._entries.move_to_end(key)
+            return value, "fresh" if age < self.ttl else "stale"
+
+    def set(self, key, value) -> None:
+        """Stores a value and evicts the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+pypi_memory_cache = TTLCache(PYPI_MEMORY_CACHE_SIZE, PYPI_MEMORY_TTL, PYPI_MEMORY_STALE)
+pypi_single_flight = SingleFlight()
+# Background refreshes of stale entries
+pypi_refresh_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _load_pypi_project(key: str, project: str) -> Dict[str, Any]:
+    data = pypi_client.get_project(project)
+    pypi_memory_cache.set(key, data)
+    return data
+
+
+def _refresh_pypi_project(key: str, project: str) -> None:
+    try:
+        pypi_single_flight.do(key, lambda: _load_pypi_project(key, project))
+    except Exception:
+        # The stale entry keeps being served until it expires
+        pass
+
+
+def fetch_pypi_project(project: str) -> Dict[str, Any]:
+    """
+    Returns the PyPI document of a project through the in-memory cache
+
+    Fresh entries are returned directly. Stale entries are returned as well,
+    and a single background refresh is started. Misses are fetched once, no
+    matter how many requests ask for the same project concurrently.
+
+    Args:
+        project: Project name
+
+    Returns:
+        The JSON document
+
+    Raises:
+        PyPIError: If the project could not be loaded
+    """
+    key = normalize_distribution_name(project)
+    data, state = pypi_memory_cache.get(key)
+    if state == "fresh":
+        return data
+    if state == "stale":
+        if not pypi_single_flight.in_flight(key):
+            pypi_refresh_executor.submit(_refresh_pypi_project, key, project)
+        return data
+    return pypi_single_flight.do(key, lambda: _load_pypi_project(key, project))
+
+
+def project_fields(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """
+    Keeps only the requested fields of a JSON document
+
+    Args:
+        data: The JSON document
+        fields: Dotted paths such as "info.summary"; missing paths are skipped
+
+    Returns:
+        Nested dictionary with only the requested fields
+    """
+    result = {}
+    for path in fields:
+        parts = path.split(".")
+        value = data
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = result
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return result
+
+
 # Class to check module imports (based on original ModuleChecker class)
 class ModuleChecker:
-    """Class to check module imports"""
+    """
+    Class to check module imports
+
+    By default only checks whether a module can be found (find_spec and the
+    distribution index) without executing it. Real imports only happen in
+    deep mode (deep=True), in isolated processes.
+    """
 
     @staticmethod
-    def check_importable(module_names: List[str]) -> Dict[str, bool]:
+    def check_importable(module_names: List[str], deep: bool = False) -> Dict[str, bool]:
         """
         Checks if the specified modules can be imported.
 
+        Without deep this only looks the modules up (see find_modules). With
+        deep the modules are imported in separate processes (see
+        check_imports_isolated), so the server process does not load them.
+
         Args:
             module_names: List of module names to check
+            deep: Actually import the modules
 
         Returns:
             Dictionary with module names as keys and
             Boolean values indicating whether the import was successful
         """
+        if deep:
+            results = ModuleChecker.check_imports_isolated(module_names)
+        else:
+            results = ModuleChecker.find_modules(module_names)
+        return {name: result['success'] for name, result in results.items()}
+
+    # Name resolution and isolated imports are shared with the desktop app (importus_core)
+    find_import_name = staticmethod(find_import_name)
+    probe_import = staticmethod(probe_import)
+    check_imports_isolated = staticmethod(check_imports_isolated)
+    iter_imports_isolated = staticmethod(iter_imports_isolated)
+
+    @staticmethod
+    def is_installed(module_name: str) -> bool:
+        """Checks without importing whether find_spec can locate a module"""
+        return ModuleChecker.find_import_name(module_name) is not None
+
+    @staticmethod
+    def find_modules(module_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fast check without importing (find_spec and distribution index)
+
+        Args:
+            module_names: List of module names to check
+
+        Returns:
+            Dictionary with module names as keys and results in the
+            probe_import format ('seconds' is the lookup time here)
+        """
         results = {}
-        for module_name in module_names:
-            try:
-                # Normalize the module name for import
-                import_name = module_name.lower().replace('-', '_')
-                # Try to import the module
-                importlib.import_module(import_name)
-                results[module_name] = True
-            except (ImportError, ModuleNotFoundError):
-                results[module_name] = False
+        for name in dict.fromkeys(module_names):
+            start = time.perf_counter()
+            found = ModuleChecker.is_installed(name)
+            results[name] = {
+                'success': found,
+                'error': None if found else "Module not found",
+                'seconds': time.perf_counter() - start,
+                'timed_out': False
+            }
         return results
 
     @staticmethod
-    def get_module_version(module_name: str) -> str:
+    def get_module_version(module_name: str, deep: bool = False,
+                           timeout: float = IMPORT_CHECK_TIMEOUT,
+                           probe: Optional[Dict[str, Any]] = None) -> str:
         """
         Attempts to determine the version of a module
 
+        The version comes from the distribution index. Only with deep is the
+        module imported to read version attributes such as __version__ - in a
+        separate process (see probe_import), never in the server process.
+
         Args:
             module_name: Name of the module
+            deep: Import the module if the index does not know a version
+            timeout: Time limit in seconds for the import with deep
+            probe: Result of an earlier probe_import of the module, used
+                   instead of probing again
 
         Returns:
             Version number as string or "N/A" if not available
         """
-        try:
-            # Normalize the module name for import
-            import_name = module_name.lower().replace('-', '_')
-            # Try to import the module
-            module = importlib.import_module(import_name)
-
-            # Try to find various attributes for the version
-            if hasattr(module, "__version__"):
-                return module.__version__
-            if hasattr(module, "VERSION"):
-                return str(module.VERSION)
-            if hasattr(module, "version"):
-                return str(module.version)
-
-            # If no direct attribute is found, try pkg_resources
-            try:
-                return pkg_resources.get_distribution(module_name).version
-            except (pkg_resources.DistributionNotFound, AttributeError):
-                pass
-
-            return "N/A"
-        except (ImportError, ModuleNotFoundError):
+        version = distribution_index.version(module_name)
+        if version:
+            return version
+        if not deep:
             return "N/A"
 
+        if probe is None:
+            try:
+                probe = ModuleChecker.probe_import(module_name, timeout)
+            except Exception:
+                return "N/A"
+        return probe.get('version') or "N/A"
+
     @staticmethod
     def get_module_install_command(module_name: str, platform_name: str = None) -> str:
         """
@@ -193,51 +419,234 @@ class ModuleChecker:
 # Initialize the module data
 module_data = ModuleData()
 
+# Operations of /api/batch and the largest accepted module list
+BATCH_OPERATIONS = ("version", "install_command", "import_check")
+BATCH_MAX_MODULES = 200
+batch_executor = ThreadPoolExecutor(max_workers=IMPORT_CHECK_WORKERS)
+
+# Responses for a request with ?v=<current catalog version> never change
+CATALOG_IMMUTABLE_MAX_AGE = 31536000
+# Bodies smaller than this are not worth compressing (bytes)
+COMPRESS_MIN_SIZE = 512
+SEARCH_RESPONSE_CACHE_SIZE = 512
+
+
+class PreparedResponse:
+    """
+    A JSON body that is serialised and compressed once
+
+    Every content coding gets its own strong ETag derived from the body, so a
+    client can revalidate whichever variant it holds.
+    """
+
+    def __init__(self, payload, gzip_level: int = 9, brotli_quality: int = 11):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants = {"identity": (body, digest)}
+        if len(body) >= COMPRESS_MIN_SIZE:
+            self.variants["gzip"] = (gzip.compress(body, gzip_level, mtime=0), f"{digest}-gz")
+            if brotli is not None:
+                self.variants["br"] = (brotli.compress(body, quality=brotli_quality), f"{digest}-br")
+
+    def etags(self) -> List[str]:
+        return [etag for _, etag in self.variants.values()]
+
+
+def catalog_cache_control() -> str:
+    """
+    Derives Cache-Control from the catalog version
+
+    Requests that name the current catalog version (?v=...) may be cached for
+    good; everything else has to be revalidated, which costs a 304 at most.
+    """
+    if request.args.get('v') == module_data.version:
+        return f"public, max-age={CATALOG_IMMUTABLE_MAX_AGE}, immutable"
+    return "public, no-cache"
+
+
+def send_prepared(prepared: PreparedResponse):
+    """Sends a prepared response, honouring If-None-Match and Accept-Encoding"""
+    matched = next((etag for etag in prepared.etags() if request.if_none_match.contains_weak(etag)), None)
+    if matched is not None:
+        # Confirm the variant the client holds, which may be a compressed one
+        response = app.response_class(status=304)
+        response.set_etag(matched)
+    else:
+        encoding = "identity"
+        for candidate in ("br", "gzip"):
+            if candidate in prepared.variants and request.accept_encodings[candidate] > 0:
+                encoding = candidate
+                break
+        body, etag = prepared.variants[encoding]
+        response = app.response_class(body, mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+
+    response.headers["Cache-Control"] = catalog_cache_control()
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["X-Catalog-Version"] = module_data.version
+    return response
+
+
+# The catalog is immutable while the server runs: serialise and compress it once
+prepared_catalog = PreparedResponse({'format': CATALOG_FORMAT, 'version': module_data.version,
+                                     'categories': module_data.modules_by_category})
+prepared_categories = PreparedResponse(module_data.get_categories())
+prepared_modules = {category: PreparedResponse(module_data.get_modules_by_category(category))
+                    for category in module_data.get_categories()}
+prepared_no_modules = PreparedResponse([])
+# Search results only depend on the query, so they are prepared once per query
+# (with cheaper compression settings, as they are built on request)
+search_response_cache = TTLCache(SEARCH_RESPONSE_CACHE_SIZE, ttl=float("inf"))
+
 
 # API Routes
 @app.route('/')
 def index():
-    return send_from_directory('static', 'index.html')
+    # index.html lives next to app.py and loads the catalog from /api/catalog
+    return send_from_directory(app.root_path, 'index.html')
+
+
+@app.route('/api/catalog')
+def get_catalog():
+    """Returns the whole module catalog (format of module_catalog.json plus its version)"""
+    return send_prepared(prepared_catalog)
 
 
 @app.route('/api/categories')
 def get_categories():
     """Returns all module categories"""
-    return jsonify(module_data.get_categories())
+    return send_prepared(prepared_categories)
 
 
 @app.route('/api/modules/<category>')
 def get_modules(category):
     """Returns modules for a specific category"""
-    modules = module_data.get_modules_by_category(category)
-    return jsonify(modules)
+    return send_prepared(prepared_modules.get(category, prepared_no_modules))
 
 
 @app.route('/api/search')
 def search_modules():
-    """Searches for modules"""
+    """Searches for modules (all matches, or the best ?limit=n)"""
     query = request.args.get('q', '')
-    results = module_data.search_modules(query)
-    return jsonify(results)
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(1, limit)
+
+    key = (query.strip().lower(), limit)
+    prepared, _ = search_response_cache.get(key)
+    if prepared is None:
+        prepared = PreparedResponse(module_data.search_modules(query, limit), gzip_level=6, brotli_quality=5)
+        search_response_cache.set(key, prepared)
+    return send_prepared(prepared)
 
 
 @app.route('/api/check_imports', methods=['POST'])
 def check_imports():
-    """Checks if modules can be imported"""
+    """
+    Checks if modules can be imported
+
+    By default modules are only looked up, not executed. With "deep": true
+    each module is imported in its own process and "timeout" sets the
+    per-module limit in seconds. With "details": true the response contains
+    success, error and time per module instead of a plain boolean.
+    """
     data = request.json
     module_names = data.get('modules', [])
 
     if not module_names:
         return jsonify({'error': 'No modules provided'}), 400
 
-    results = ModuleChecker.check_importable(module_names)
-    return jsonify(results)
+    try:
+        timeout = max(0.1, min(float(data.get('timeout', IMPORT_CHECK_TIMEOUT)), IMPORT_CHECK_TIMEOUT))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid timeout'}), 400
+
+    if data.get('deep'):
+        results = ModuleChecker.check_imports_isolated(module_names, timeout)
+    else:
+        results = ModuleChecker.find_modules(module_names)
+    if data.get('details'):
+        return jsonify(results)
+    return jsonify({name: result['success'] for name, result in results.items()})
+
+
+@app.route('/api/check_imports/stream', methods=['GET', 'POST'])
+def check_imports_stream():
+    """
+    Streaming variant of check_imports
+
+    POST takes the same body. GET takes the same options from the query string
+    (?modules=a,b or repeated modules=..., deep=1, timeout=...), because a
+    browser EventSource can only send GET.
+
+    Every module result is sent as soon as it is known, in completion order,
+    with "elapsed" (seconds since the request started). The last message is
+    {"done": true, "count": ..., "elapsed": ...}; an EventSource should close
+    itself on it, otherwise it reconnects and starts the checks again.
+
+    The format is NDJSON (one JSON object per line), or Server-Sent Events
+    if the client sends "Accept: text/event-stream" (as EventSource does) or
+    ?format=sse.
+    """
+    if request.method == 'GET':
+        module_names = [name.strip() for value in request.args.getlist('modules')
+                        for name in value.split(',') if name.strip()]
+        data = {'deep': request.args.get('deep', '').lower() in ('1', 'true', 'yes'),
+                'timeout': request.args.get('timeout', IMPORT_CHECK_TIMEOUT)}
+    else:
+        data = request.get_json(silent=True) or {}
+        module_names = data.get('modules', [])
+
+    if not module_names or not isinstance(module_names, list):
+        return jsonify({'error': 'No modules provided'}), 400
+
+    try:
+        timeout = max(0.1, min(float(data.get('timeout', IMPORT_CHECK_TIMEOUT)), IMPORT_CHECK_TIMEOUT))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid timeout'}), 400
+
+    deep = bool(data.get('deep'))
+    use_sse = (request.args.get('format') == 'sse'
+               or request.accept_mimetypes.best == 'text/event-stream')
+    start = time.perf_counter()
+
+    def results():
+        if deep:
+            yield from ModuleChecker.iter_imports_isolated(module_names, timeout)
+        else:
+            # Lookups take microseconds each, so they are simply sent one by one
+            for name in dict.fromkeys(module_names):
+                yield name, ModuleChecker.find_modules([name])[name]
+
+    def encode(message: Dict[str, Any]) -> str:
+        line = json.dumps(message)
+        return f"data: {line}\n\n" if use_sse else line + "\n"
+
+    def generate():
+        count = 0
+        for name, result in results():
+            count += 1
+            yield encode({'module': name, **result, 'elapsed': round(time.perf_counter() - start, 4)})
+        yield encode({'done': True, 'count': count, 'elapsed': round(time.perf_counter() - start, 4)})
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream' if use_sse else 'application/x-ndjson',
+        headers={
+            'Cache-Control': 'no-cache',
+            # Keep reverse proxies (nginx) from buffering the stream
+            'X-Accel-Buffering': 'no',
+        }
+    )
 
 
 @app.route('/api/module_version/<module_name>')
 def get_module_version(module_name):
-    """Gets the version of a module"""
-    version = ModuleChecker.get_module_version(module_name)
+    """Gets the version of a module (?deep=1 imports it if the index has no version)"""
+    deep = request.args.get('deep', '').lower() in ('1', 'true', 'yes')
+    version = ModuleChecker.get_module_version(module_name, deep)
     return jsonify({'module': module_name, 'version': version})
 
 
@@ -256,17 +665,116 @@ def get_popularity(category):
     return jsonify(popularity)
 
 
-@app.route('/api/pypi_info/<module_name>')
-def get_pypi_info(module_name):
-    """Gets information about a module from PyPI"""
+def _batch_result(future) -> Dict[str, Any]:
+    """Turns a finished future into a per-item batch result"""
+    try:
+        return {'ok': True, 'value': future.result()}
+    except Exception as e:
+        return {'ok': False, 'error': str(e)}
+
+
+@app.route('/api/batch', methods=['POST'])
+def batch():
+    """
+    Resolves several operations for a list of modules in one round-trip
+
+    Body:
+        modules: List of module names
+        operations: Subset of BATCH_OPERATIONS (default: all)
+        platform: Platform for the install commands (default: server platform)
+        deep: Import modules for "version" and "import_check" (like the single endpoints)
+        timeout: Per-module limit in seconds for deep import checks
+
+    Each module gets one entry per operation, either {"ok": true, "value": ...}
+    or {"ok": false, "error": "..."}, so a failing item does not fail the batch.
+    """
+    data = request.get_json(silent=True) or {}
+    module_names = data.get('modules')
+    operations = data.get('operations', list(BATCH_OPERATIONS))
+
+    if (not isinstance(module_names, list) or not module_names
+            or not all(isinstance(name, str) and name for name in module_names)):
+        return jsonify({'error': 'modules must be a non-empty list of module names'}), 400
+    if len(module_names) > BATCH_MAX_MODULES:
+        return jsonify({'error': f'At most {BATCH_MAX_MODULES} modules per batch'}), 400
+    if not isinstance(operations, list) or not operations:
+        return jsonify({'error': 'operations must be a non-empty list'}), 400
+    unknown = [operation for operation in operations if operation not in BATCH_OPERATIONS]
+    if unknown:
+        return jsonify({'error': f'Unknown operations: {", ".join(map(str, unknown))}'}), 400
+
     try:
-        # Make a request to the PyPI JSON API
-        response = requests.get(f"https://pypi.org/pypi/{module_name}/json", timeout=5)
+        timeout = max(0.1, min(float(data.get('timeout', IMPORT_CHECK_TIMEOUT)), IMPORT_CHECK_TIMEOUT))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid timeout'}), 400
+
+    deep = bool(data.get('deep'))
+    platform_name = data.get('platform') or platform.system()
+    # Duplicates are resolved once
+    module_names = list(dict.fromkeys(module_names))
+
+    # With deep, "version" reuses the probe of "import_check" instead of importing every module twice
+    shared_probe = deep and 'version' in operations and 'import_check' in operations
+
+    start = time.perf_counter()
+    futures = {}
+    for name in module_names:
+        if 'version' in operations and not shared_probe:
+            futures[(name, 'version')] = batch_executor.submit(
+                ModuleChecker.get_module_version, name, deep, timeout)
+        if 'install_command' in operations:
+            futures[(name, 'install_command')] = batch_executor.submit(
+                ModuleChecker.get_module_install_command, name, platform_name)
+
+    # Import checks already run concurrently per module, so the whole list is one job
+    import_future = None
+    if 'import_check' in operations:
+        if deep:
+            import_future = batch_executor.submit(ModuleChecker.check_imports_isolated, module_names, timeout)
+        else:
+            import_future = batch_executor.submit(ModuleChecker.find_modules, module_names)
+
+    results = {name: {} for name in module_names}
+    for (name, operation), future in futures.items():
+        results[name][operation] = _batch_result(future)
 
-        if response.status_code == 200:
-            return jsonify(response.json())
+    checks = {}
+    if import_future is not None:
+        try:
+            checks = import_future.result()
+        except Exception as e:
+            for name in module_names:
+                results[name]['import_check'] = {'ok': False, 'error': str(e)}
         else:
-            return jsonify({'error': f'Error loading information: Status code {response.status_code}'}), 404
+            for name in module_names:
+                results[name]['import_check'] = {'ok': True, 'value': checks[name]}
+
+    if shared_probe:
+        version_futures = {
+            name: batch_executor.submit(ModuleChecker.get_module_version, name, deep, timeout, checks.get(name, {}))
+            for name in module_names
+        }
+        for name, future in version_futures.items():
+            results[name]['version'] = _batch_result(future)
+
+    return jsonify({'results': results, 'elapsed': round(time.perf_counter() - start, 4)})
+
+
+@app.route('/api/pypi_info/<module_name>')
+def get_pypi_info(module_name):
+    """
+    Gets information about a module from PyPI
+
+    Query parameters:
+        fields: Optional comma-separated dotted paths (e.g. "info.summary,info.version")
+                to return only those fields instead of the whole document
+    """
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    try:
+        data = fetch_pypi_project(module_name)
+        return jsonify(project_fields(data, fields) if fields else data)
+    except PyPIError as e:
+        return jsonify({'error': f'Error loading information: {e}'}), 404 if e.status else 500
     except Exception as e:
         return jsonify({'error': f'Error loading information: {str(e)}'}), 500
 
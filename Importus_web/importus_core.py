@@ -0,0 +1,906 @@
+"""
+Code shared by the desktop app (Importus3.py) and the web app (app.py)
+
+Both frontends import from here, so that module search, catalog handling,
+the index of installed distributions, import probing and PyPI access cannot
+drift apart.
+"""
+import bisect
+import hashlib
+import heapq
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import marshal
+import math
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import quote
+
+
+# Field weights for the full-text search (BM25F)
+SEARCH_FIELD_WEIGHTS = {"name": 3, "description": 1}
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+# Maximum number of vocabulary terms a prefix is expanded to
+SEARCH_PREFIX_EXPANSION = 64
+SEARCH_PREFIX_WEIGHT = 0.7
+SEARCH_FUZZY_WEIGHT = 0.4
+# Bonus when the whole query occurs in (or equals) the module name
+SEARCH_SUBSTRING_BONUS = 2.0
+SEARCH_EXACT_NAME_BONUS = 10.0
+
+_SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+class SearchHit(NamedTuple):
+    """
+    Reference to a catalog entry instead of a copy of the module data
+    """
+    doc_id: int
+    category: str
+    position: int
+    score: float
+
+
+def _search_tokens(text: str) -> List[str]:
+    """
+    Splits a text into lower-case words ("scikit-learn" -> ["scikit", "learn"])
+    """
+    return _SEARCH_TOKEN_PATTERN.findall(text.lower())
+
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    Returns all three-character substrings of a text
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _within_edit_distance(a: str, b: str, limit: int) -> bool:
+    """
+    Checks whether the Levenshtein distance of two words is at most limit
+
+    Stops as soon as no cell of the current matrix row is within the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class SearchIndex:
+    """
+    Inverted index over name and description of all catalog entries
+
+    Supports exact words, prefixes, fuzzy matches (edit distance), substrings
+    of module names (via trigrams) and BM25 ranking. The state consists of
+    built-in types and arrays; pack_state turns it into a form that marshal
+    can store.
+    """
+
+    def __init__(self, state: Dict[str, Any]):
+        self.refs = state["refs"]
+        self.names = state["names"]
+        self.doc_lengths = state["doc_lengths"]
+        self.avg_length = state["avg_length"]
+        self.postings = state["postings"]
+        self.vocabulary = state["vocabulary"]
+        self.name_trigrams = state["name_trigrams"]
+        self.term_trigrams = state["term_trigrams"]
+
+    @staticmethod
+    def build_state(modules_by_category: Dict[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+        """
+        Builds the index for all modules of the catalog
+
+        Args:
+            modules_by_category: Modules per category
+
+        Returns:
+            State for SearchIndex(state)
+        """
+        refs = []
+        names = []
+        doc_lengths = array("I")
+        postings = {}
+        name_trigrams = {}
+
+        for category, modules in modules_by_category.items():
+            for position, module in enumerate(modules):
+                doc_id = len(refs)
+                refs.append((category, position))
+                name = module["name"].lower()
+                names.append(name)
+                for trigram in _trigrams(name):
+                    name_trigrams.setdefault(trigram, array("I")).append(doc_id)
+
+                # Weighted term frequency across both fields
+                frequencies = {}
+                length = 0
+                for field, weight in SEARCH_FIELD_WEIGHTS.items():
+                    tokens = _search_tokens(module.get(field) or "")
+                    length += weight * len(tokens)
+                    for token in tokens:
+                        frequencies[token] = frequencies.get(token, 0) + weight
+                doc_lengths.append(length)
+                for token, frequency in frequencies.items():
+                    docs, tfs = postings.setdefault(token, (array("I"), array("H")))
+                    docs.append(doc_id)
+                    tfs.append(min(frequency, 0xFFFF))
+
+        vocabulary = sorted(postings)
+        term_trigrams = {}
+        for term_id, term in enumerate(vocabulary):
+            for trigram in _trigrams(f"${term}$"):
+                term_trigrams.setdefault(trigram, array("I")).append(term_id)
+
+        return {
+            "refs": refs,
+            "names": names,
+            "doc_lengths": doc_lengths,
+            "avg_length": (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 1.0,
+            "postings": postings,
+            "vocabulary": vocabulary,
+            "name_trigrams": name_trigrams,
+            "term_trigrams": term_trigrams,
+        }
+
+    @staticmethod
+    def pack_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replaces the arrays of a state by their bytes (marshal cannot store arrays)
+        """
+        return dict(
+            state,
+            doc_lengths=state["doc_lengths"].tobytes(),
+            postings={term: (docs.tobytes(), tfs.tobytes()) for term, (docs, tfs) in state["postings"].items()},
+            name_trigrams={trigram: ids.tobytes() for trigram, ids in state["name_trigrams"].items()},
+            term_trigrams={trigram: ids.tobytes() for trigram, ids in state["term_trigrams"].items()},
+        )
+
+    @staticmethod
+    def unpack_state(packed: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reverses pack_state
+        """
+        def to_array(typecode: str, data: bytes) -> array:
+            values = array(typecode)
+            values.frombytes(data)
+            return values
+
+        return dict(
+            packed,
+            doc_lengths=to_array("I", packed["doc_lengths"]),
+            postings={term: (to_array("I", docs), to_array("H", tfs))
+                      for term, (docs, tfs) in packed["postings"].items()},
+            name_trigrams={trigram: to_array("I", ids) for trigram, ids in packed["name_trigrams"].items()},
+            term_trigrams={trigram: to_array("I", ids) for trigram, ids in packed["term_trigrams"].items()},
+        )
+
+    def _expand(self, token: str) -> Tuple[List[tuple], bool]:
+        """
+        Expands a query word to matching vocabulary terms
+
+        Returns:
+            (list of (term, weight), complete): terms matched exactly, by prefix or -
+            if neither matches - fuzzy within a small edit distance. Complete is
+            False for fuzzy matches or a capped prefix expansion.
+        """
+        expansions = []
+        if token in self.postings:
+            expansions.append((token, 1.0))
+
+        start = bisect.bisect_left(self.vocabulary, token)
+        end = start + SEARCH_PREFIX_EXPANSION
+        for term in self.vocabulary[start:end]:
+            if not term.startswith(token):
+                break
+            if term != token:
+                expansions.append((term, SEARCH_PREFIX_WEIGHT))
+        complete = end >= len(self.vocabulary) or not self.vocabulary[end].startswith(token)
+
+        if not expansions and len(token) >= 4:
+            complete = False
+            limit = 1 if len(token) < 8 else 2
+            # Padded so that short words still yield enough trigrams
+            token_trigrams = _trigrams(f"${token}$")
+            shared = {}
+            for trigram in token_trigrams:
+                for term_id in self.term_trigrams.get(trigram, ()):
+                    shared[term_id] = shared.get(term_id, 0) + 1
+            # Each edit destroys at most three trigrams
+            needed = len(token_trigrams) - 3 * limit
+            for term_id, count in shared.items():
+                term = self.vocabulary[term_id]
+                if count >= needed and _within_edit_distance(token, term, limit):
+                    expansions.append((term, SEARCH_FUZZY_WEIGHT))
+        return expansions, complete
+
+    @staticmethod
+    def _postings_within(docs, tfs, restrict):
+        """
+        Yields (doc id, frequency) of a posting list, optionally only for some documents
+
+        With few allowed documents the sorted posting list is probed by binary
+        search instead of walking the whole list.
+        """
+        if restrict is None:
+            return zip(docs, tfs)
+        if len(restrict) * 16 < len(docs):
+            found = []
+            for doc_id in restrict:
+                i = bisect.bisect_left(docs, doc_id)
+                if i < len(docs) and docs[i] == doc_id:
+                    found.append((doc_id, tfs[i]))
+            return found
+        return [(doc_id, tf) for doc_id, tf in zip(docs, tfs) if doc_id in restrict]
+
+    def _name_substring_matches(self, text: str, candidates=None) -> Set[int]:
+        """
+        Finds all modules whose name contains the text (three characters or more)
+        """
+        if len(text) < 3:
+            return set()
+        if candidates is not None:
+            return {doc_id for doc_id in candidates if text in self.names[doc_id]}
+        lists = sorted((self.name_trigrams.get(trigram, ()) for trigram in _trigrams(text)), key=len)
+        found = set(lists[0])
+        for doc_ids in lists[1:]:
+            found.intersection_update(doc_ids)
+            if not found:
+                break
+        return {doc_id for doc_id in found if text in self.names[doc_id]}
+
+    def match(self, query: str, candidates=None) -> Tuple[Dict[int, float], bool]:
+        """
+        Scores all modules matching the query
+
+        Every word of the query has to match (exactly, as prefix or fuzzy).
+        Modules whose name contains the whole query are found as well and
+        ranked higher.
+
+        Args:
+            query: The search query
+            candidates: Optionally only score these doc ids, e.g. the complete
+                hits of a query that this one merely extends
+
+        Returns:
+            (doc id -> score, complete). Only a complete result may serve as
+            candidates for a refinement.
+        """
+        text = query.strip().lower()
+        if not text:
+            return {}, False
+
+        expansions = []
+        # Shorter queries ran without the name substring search
+        complete = len(text) >= 3
+        for token in _search_tokens(text):
+            terms, token_complete = self._expand(token)
+            expansions.append(terms)
+            complete = complete and token_complete
+        if not complete:
+            # Fuzzy matches may lie outside the candidates
+            candidates = None
+
+        doc_count = len(self.refs)
+        scores = None
+        restrict = candidates
+        for terms in expansions:
+            token_scores = {}
+            for term, weight in terms:
+                docs, tfs = self.postings[term]
+                idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, tf in self._postings_within(docs, tfs, restrict):
+                    norm = 1 - SEARCH_BM25_B + SEARCH_BM25_B * self.doc_lengths[doc_id] / self.avg_length
+                    score = weight * idf * tf * (SEARCH_BM25_K1 + 1) / (tf + SEARCH_BM25_K1 * norm)
+                    # Several expansions of the same word only count once
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: score + token_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in token_scores}
+            if not scores:
+                break
+            # Score further words only for the hits so far
+            restrict = scores
+        scores = scores or {}
+
+        for doc_id in self._name_substring_matches(text, candidates):
+            bonus = SEARCH_EXACT_NAME_BONUS if self.names[doc_id] == text else SEARCH_SUBSTRING_BONUS
+            scores[doc_id] = scores.get(doc_id, 0.0) + bonus
+        return scores, complete
+
+    def top_hits(self, scores: Dict[int, float], limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Picks the best-scored hits from the result of match (all of them without limit)
+        """
+        if limit is None:
+            best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        else:
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [SearchHit(doc_id, *self.refs[doc_id], score) for doc_id, score in best]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Searches the index
+
+        Args:
+            query: The search query
+            limit: Maximum number of hits (None: all hits)
+
+        Returns:
+            Hits sorted by relevance
+        """
+        return self.top_hits(self.match(query)[0], limit)
+
+
+CATALOG_FORMAT = 1
+# Version of the precompiled form (bump when the indexes change)
+CATALOG_COMPILED_FORMAT = 3
+
+# Module catalog shared by both apps (override with IMPORTUS_CATALOG)
+CATALOG_FILE = os.environ.get("IMPORTUS_CATALOG") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "module_catalog.json")
+# Private per-user directory for the compiled catalog (override with IMPORTUS_CATALOG_CACHE)
+CATALOG_CACHE_DIR = os.environ.get("IMPORTUS_CATALOG_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".python_module_explorer", "catalog_cache")
+
+
+def _compile_catalog(raw: Dict[str, Any], version: str) -> Dict[str, Any]:
+    """
+    Prepares the JSON catalog with prebuilt lookup indexes
+
+    Args:
+        raw: Contents of the catalog file
+        version: Content hash of the catalog file
+
+    Returns:
+        Dictionary with modules per category, module names, name and search index
+    """
+    if raw.get("format") != CATALOG_FORMAT:
+        raise ValueError(f"Unsupported catalog format: {raw.get('format')}")
+
+    modules_by_category = raw["categories"]
+    module_names = []
+    name_index = {}
+    for category, modules in modules_by_category.items():
+        for position, module in enumerate(modules):
+            module_names.append(module["name"])
+            name_index.setdefault(module["name"].lower(), []).append((category, position))
+
+    return {
+        "format": CATALOG_FORMAT,
+        "version": version,
+        "modules_by_category": modules_by_category,
+        "module_names": module_names,
+        "name_index": name_index,
+        "search_index": SearchIndex.build_state(modules_by_category),
+    }
+
+
+def _read_compiled(compiled_path: str, digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads a compiled catalog, or returns None if it is missing, outdated or damaged
+
+    The file starts with a marshalled header (format, digest of the JSON file,
+    digest of the payload), followed by the marshalled payload.
+    """
+    try:
+        with open(compiled_path, "rb") as f:
+            header = marshal.load(f)
+            if header[:2] != (CATALOG_COMPILED_FORMAT, digest):
+                return None
+            payload = f.read()
+        if hashlib.sha256(payload).hexdigest() != header[2]:
+            return None
+        catalog = marshal.loads(payload)
+        catalog["search_index"] = SearchIndex.unpack_state(catalog["search_index"])
+        return catalog
+    except (OSError, EOFError, ValueError, TypeError, KeyError, IndexError):
+        return None
+
+
+def _write_compiled(cache_dir: str, compiled_path: str, digest: str, catalog: Dict[str, Any]) -> None:
+    """
+    Stores a compiled catalog and removes outdated ones
+
+    Written atomically, so concurrently starting processes never read half a file.
+    """
+    packed = dict(catalog, search_index=SearchIndex.pack_state(catalog["search_index"]))
+    payload = marshal.dumps(packed)
+    header = (CATALOG_COMPILED_FORMAT, digest, hashlib.sha256(payload).hexdigest())
+    temp_path = f"{compiled_path}.{os.getpid()}.tmp"
+    try:
+        # Private to the user: nobody else may place a compiled catalog here
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            marshal.dump(header, f)
+            f.write(payload)
+        os.replace(temp_path, compiled_path)
+    except OSError:
+        # Read-only location: fall back to parsing the JSON on every start
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+
+    for name in os.listdir(cache_dir):
+        if name.startswith("catalog-") and name.endswith(".marshal") and name != os.path.basename(compiled_path):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def load_catalog(path: str = CATALOG_FILE, cache_dir: str = CATALOG_CACHE_DIR) -> Dict[str, Any]:
+    """
+    Loads the module catalog, preferring the precompiled form
+
+    The compiled copy with prebuilt indexes is stored with marshal (which
+    cannot execute code when loading, unlike pickle) in a private per-user
+    cache directory. It is named after the SHA-256 of the JSON file and only
+    used if that digest and the digest of its payload still match; otherwise
+    it is rebuilt from the JSON file.
+
+    Args:
+        path: Path to the JSON catalog file
+        cache_dir: Directory for the compiled copy
+
+    Returns:
+        Compiled catalog (see _compile_catalog)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    compiled_path = os.path.join(cache_dir, f"catalog-{digest}.marshal")
+
+    catalog = _read_compiled(compiled_path, digest)
+    if catalog is None:
+        catalog = _compile_catalog(json.loads(data.decode("utf-8")), digest[:16])
+        _write_compiled(cache_dir, compiled_path, digest, catalog)
+    return catalog
+
+
+def normalize_distribution_name(name: str) -> str:
+    """Normalizes a package name according to PEP 503 (e.g. "Scikit_Learn" -> "scikit-learn")"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# Minimum time (seconds) before the index checks again whether the
+# installation directories have changed
+INDEX_RECHECK_SECONDS = 2.0
+
+
+class DistributionIndex:
+    """
+    Index of installed distributions based on importlib.metadata
+
+    Built lazily on first access. Maps normalized package names to their
+    version and top-level import names (e.g. "pillow" -> "PIL") without
+    importing any package. Replaces pkg_resources, which scans all of
+    sys.path when it is imported.
+
+    When the mtime of a directory on sys.path changes (e.g. site-packages
+    after pip install), the index is rebuilt.
+    """
+
+    def __init__(self):
+        self._versions = None
+        self._imports_by_distribution = {}
+        self._distributions_by_import = {}
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _path_signature():
+        """Modification times of all directories on sys.path"""
+        signature = []
+        for path in sys.path:
+            try:
+                signature.append((path, os.stat(path or os.curdir).st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(signature)
+
+    def _ensure_built(self):
+        """Builds the index on first access and after changes to sys.path"""
+        with self._lock:
+            now = time.monotonic()
+            if self._versions is not None and now - self._checked_at < INDEX_RECHECK_SECONDS:
+                return
+            self._checked_at = now
+
+            signature = self._path_signature()
+            if self._versions is None or signature != self._signature:
+                # Also drop the directory caches used by find_spec
+                importlib.invalidate_caches()
+                self._build()
+                self._signature = signature
+
+    def invalidate(self):
+        """Forces a rebuild on the next access (e.g. after an installation)"""
+        with self._lock:
+            self._versions = None
+
+    def _build(self):
+        """Reads all distributions from importlib.metadata"""
+        versions = {}
+        imports_by_distribution = {}
+        distributions_by_import = {}
+
+        for dist in importlib.metadata.distributions():
+            name = dist.metadata['Name']
+            if not name:
+                continue
+            key = normalize_distribution_name(name)
+            # As with imports, the first entry on sys.path wins
+            if key in versions:
+                continue
+            versions[key] = dist.version
+
+            import_names = self._top_level_names(dist)
+            imports_by_distribution[key] = import_names
+            for import_name in import_names:
+                distributions_by_import.setdefault(import_name, key)
+
+        self._versions = versions
+        self._imports_by_distribution = imports_by_distribution
+        self._distributions_by_import = distributions_by_import
+
+    @staticmethod
+    def _top_level_names(dist) -> List[str]:
+        """Top-level import names from top_level.txt, otherwise derived from the file list"""
+        top_level = dist.read_text('top_level.txt')
+        if top_level:
+            return [name for name in top_level.split() if name.isidentifier()]
+
+        names = []
+        for path in dist.files or []:
+            parts = path.parts
+            if len(parts) == 1 and path.suffix == '.py':
+                candidate = path.stem
+            elif len(parts) > 1:
+                candidate = parts[0]
+            else:
+                continue
+            if candidate.isidentifier() and candidate not in names:
+                names.append(candidate)
+        return names
+
+    def version(self, name: str) -> Optional[str]:
+        """Installed version for a package name ("Pillow") or import name ("PIL"), or None"""
+        self._ensure_built()
+        key = normalize_distribution_name(name)
+        if key in self._versions:
+            return self._versions[key]
+        distribution = self._distributions_by_import.get(name) or self._distributions_by_import.get(name.lower())
+        return self._versions.get(distribution) if distribution else None
+
+    def import_names(self, name: str) -> List[str]:
+        """Top-level import names of an installed distribution (e.g. "beautifulsoup4" -> ["bs4"])"""
+        self._ensure_built()
+        return self._imports_by_distribution.get(normalize_distribution_name(name), [])
+
+
+# Shared index for all version and presence lookups
+distribution_index = DistributionIndex()
+
+
+# Per-module time limit for isolated import checks (seconds)
+IMPORT_CHECK_TIMEOUT = 20.0
+
+# Maximum number of concurrent import check processes
+IMPORT_CHECK_WORKERS = min(8, os.cpu_count() or 1)
+
+# Marks the result line of the probe process (modules may print output themselves)
+IMPORT_PROBE_MARKER = "__IMPORT_PROBE__"
+
+# Probe process script: imports one module and reports the result, duration and
+# version attribute as JSON
+IMPORT_PROBE_SCRIPT = (
+    "import importlib, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "try:\n"
+    "    module = importlib.import_module(sys.argv[1])\n"
+    "    result = {'success': True, 'error': None, 'version': None}\n"
+    "    for attribute in ('__version__', 'VERSION', 'version'):\n"
+    "        try:\n"
+    "            if hasattr(module, attribute):\n"
+    "                result['version'] = str(getattr(module, attribute))\n"
+    "                break\n"
+    "        except Exception:\n"
+    "            pass\n"
+    "except BaseException as e:\n"
+    "    result = {'success': False, 'error': f'{type(e).__name__}: {e}', 'version': None}\n"
+    "result['seconds'] = time.perf_counter() - start\n"
+    f"print({IMPORT_PROBE_MARKER!r} + json.dumps(result), flush=True)\n"
+)
+
+
+def import_candidates(module_name: str) -> List[str]:
+    """
+    Possible top-level import names for a module or package name
+
+    Args:
+        module_name: Name as in the catalog (e.g. "Pillow", "scikit-learn")
+
+    Returns:
+        Import names in the order in which they are tried
+    """
+    top_level = module_name.split(".")[0]
+    candidates = [top_level, top_level.lower().replace("-", "_")]
+    candidates.extend(distribution_index.import_names(module_name))
+    return list(dict.fromkeys(name for name in candidates if name.isidentifier()))
+
+
+def find_import_name(module_name: str) -> Optional[str]:
+    """
+    Name under which find_spec locates a module, without importing it
+
+    Submodules keep their path below the resolved top-level name
+    ("Pillow" -> "PIL", "PIL.Image" -> "PIL.Image").
+
+    Returns:
+        The import name, or None if no candidate is found
+    """
+    submodule = module_name.partition(".")[2]
+    for candidate in import_candidates(module_name):
+        try:
+            if importlib.util.find_spec(candidate) is not None:
+                return f"{candidate}.{submodule}" if submodule else candidate
+        except (ImportError, ValueError):
+            continue
+    return None
+
+
+def probe_import(module_name: str, timeout: float = IMPORT_CHECK_TIMEOUT) -> Dict[str, Any]:
+    """
+    Imports a module in a separate Python process
+
+    Args:
+        module_name: Name of the module
+        timeout: Time limit in seconds, after which the process is killed
+
+    Returns:
+        Dictionary with 'success', 'error' (failure reason or None),
+        'seconds' (import time) and 'timed_out'; if the probe process
+        reported back, also 'version' (version attribute or None)
+    """
+    # Resolve the import name like the fast check does ("Pillow" -> "PIL")
+    import_name = find_import_name(module_name) or module_name
+    start = time.perf_counter()
+
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE_SCRIPT, import_name],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            # Do not open a console window per probe on Windows
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        )
+    except subprocess.TimeoutExpired:
+        return {"success": False, "error": f"Timed out after {timeout:g} s",
+                "seconds": time.perf_counter() - start, "timed_out": True}
+    except OSError as e:
+        return {"success": False, "error": f"Could not start probe process: {e}",
+                "seconds": 0.0, "timed_out": False}
+
+    # Use the last result line and ignore anything else the module printed
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(IMPORT_PROBE_MARKER):
+            result = json.loads(line[len(IMPORT_PROBE_MARKER):])
+            result["timed_out"] = False
+            return result
+
+    # The process ended without a result (e.g. a crash in C code)
+    stderr_lines = completed.stderr.strip().splitlines()
+    reason = stderr_lines[-1] if stderr_lines else f"Process exited with code {completed.returncode}"
+    return {"success": False, "error": reason,
+            "seconds": time.perf_counter() - start, "timed_out": False}
+
+
+def iter_imports_isolated(module_names: List[str], timeout: float = IMPORT_CHECK_TIMEOUT,
+                          max_workers: int = IMPORT_CHECK_WORKERS):
+    """
+    Imports several modules in parallel in isolated processes (see probe_import)
+
+    Every module has its own time limit, so a hanging import does not stall
+    the remaining checks. Yields (name, result) in completion order. If the
+    generator is closed early (e.g. the client of a streaming response
+    disconnects), probes that have not started yet are cancelled.
+    """
+    names = list(dict.fromkeys(module_names))
+    if not names:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names))))
+    futures = {}
+    try:
+        for name in names:
+            futures[executor.submit(probe_import, name, timeout)] = name
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Drop probes that have not started yet (shutdown(cancel_futures=True) needs Python 3.9)
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def check_imports_isolated(module_names: List[str], timeout: float = IMPORT_CHECK_TIMEOUT,
+                           max_workers: int = IMPORT_CHECK_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Like iter_imports_isolated, but waits for all probes
+
+    Returns:
+        Dictionary with module names as keys (in input order) and
+        the probe_import result as values
+    """
+    names = list(dict.fromkeys(module_names))
+    results = dict(iter_imports_isolated(names, timeout, max_workers))
+    return {name: results[name] for name in names}
+
+
+# Base URL of the PyPI JSON API, e.g. a local mirror or a stub server for tests
+PYPI_BASE_URL = os.environ.get("IMPORTUS_PYPI_URL", "https://pypi.org/pypi")
+# On-disk cache shared by the desktop and the web app
+PYPI_CACHE_DIR = os.environ.get("IMPORTUS_PYPI_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".python_module_explorer", "pypi_cache")
+# How long a cache entry is used without asking PyPI again (seconds)
+PYPI_CACHE_MAX_AGE = 600
+PYPI_TIMEOUT = 5
+
+
+class PyPIError(Exception):
+    """
+    Error fetching from PyPI (status is the HTTP status code, if any)
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class PyPIClient:
+    """
+    Shared access to the PyPI JSON API with a connection pool and an on-disk cache
+
+    Per project the JSON document and a small meta file with ETag and
+    Last-Modified are stored. Within max_age the answer comes from the cache
+    without any network access; afterwards it is revalidated with
+    If-None-Match / If-Modified-Since. On 304 the document is kept and only the
+    meta file is renewed. If PyPI is unreachable, a stale entry is returned.
+    """
+
+    def __init__(self, base_url: str = PYPI_BASE_URL, cache_dir: str = PYPI_CACHE_DIR,
+                 max_age: float = PYPI_CACHE_MAX_AGE, timeout: float = PYPI_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.timeout = timeout
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        """
+        Creates a pooled session on first use
+        """
+        with self._lock:
+            if self._session is None:
+                try:
+                    import requests
+                except ImportError:
+                    # The desktop app does not require requests: use the copy bundled with pip
+                    from pip._vendor import requests
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = "Python-Module-Explorer"
+                self._session = session
+            return self._session
+
+    def _cache_paths(self, project: str) -> tuple:
+        base = os.path.join(self.cache_dir, normalize_distribution_name(project))
+        return base + ".json", base + ".meta.json"
+
+    @staticmethod
+    def _read_json(path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: str, value) -> None:
+        # Replace atomically so concurrent readers never see half a file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def get_project(self, project: str) -> Dict[str, Any]:
+        """
+        Returns the JSON document of a project from PyPI
+
+        Args:
+            project: Project name
+
+        Returns:
+            The JSON document ("info", "releases", ...)
+
+        Raises:
+            PyPIError: If the project could not be loaded and nothing is cached
+        """
+        data_path, meta_path = self._cache_paths(project)
+        meta = self._read_json(meta_path)
+        data = self._read_json(data_path) if meta else None
+        if data is None:
+            meta = None
+        elif time.time() - meta.get("fetched", 0) < self.max_age:
+            return data
+
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        url = f"{self.base_url}/{quote(project, safe='')}/json"
+        try:
+            response = self._get_session().get(url, headers=headers, timeout=self.timeout)
+        except Exception as e:
+            if data is not None:
+                return data
+            raise PyPIError(str(e)) from e
+
+        if response.status_code == 304 and data is not None:
+            meta["fetched"] = time.time()
+            self._write_json(meta_path, meta)
+            return data
+
+        if response.status_code != 200:
+            raise PyPIError(f"Status code {response.status_code}", response.status_code)
+
+        data = response.json()
+        self._write_json(data_path, data)
+        self._write_json(meta_path, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched": time.time(),
+        })
+        return data
+
+
+# Global PyPI client (session and cache are shared by the whole process)
+pypi_client = PyPIClient()
@@ -0,0 +1,18 @@
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in (ROOT, os.path.join(ROOT, "Importus_web"), os.path.join(ROOT, "Converter")):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+# Kompilierter Katalog und PyPI-Cache der Tests landen nicht im Home-Verzeichnis
+_CACHE_ROOT = tempfile.mkdtemp(prefix="werkzeugkiste-tests-")
+os.environ.setdefault("IMPORTUS_CATALOG_CACHE", os.path.join(_CACHE_ROOT, "catalog"))
+os.environ.setdefault("IMPORTUS_PYPI_CACHE", os.path.join(_CACHE_ROOT, "pypi"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_CACHE_ROOT, ignore_errors=True)
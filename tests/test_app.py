@@ -0,0 +1,348 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+import app as web_app
+import importus_core
+from app import ModuleChecker, SingleFlight, TTLCache, project_fields
+
+
+@pytest.fixture
+def client():
+    web_app.app.config["TESTING"] = True
+    with web_app.app.test_client() as client:
+        yield client
+
+
+def test_check_imports_resolves_names_in_both_modes(client):
+    pytest.importorskip("PIL")
+    names = ["Pillow", "PIL.Image", "no_such_module_xyz"]
+    fast = client.post("/api/check_imports", json={"modules": names}).get_json()
+    deep = client.post("/api/check_imports", json={"modules": names, "deep": True}).get_json()
+
+    assert fast == deep == {"Pillow": True, "PIL.Image": True, "no_such_module_xyz": False}
+
+
+def test_prepared_response_variants():
+    small = web_app.PreparedResponse(["a"])
+    assert list(small.variants) == ["identity"]
+
+    large = web_app.PreparedResponse({"text": "x" * (web_app.COMPRESS_MIN_SIZE * 2)})
+    assert "gzip" in large.variants
+    assert gzip.decompress(large.variants["gzip"][0]) == large.variants["identity"][0]
+    assert len(set(large.etags())) == len(large.variants)
+
+
+def test_catalog_etag_and_encoding(client):
+    plain = client.get("/api/catalog")
+    zipped = client.get("/api/catalog", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.status_code == zipped.status_code == 200
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(zipped.data) == plain.data
+    assert plain.headers["ETag"] != zipped.headers["ETag"]
+    assert plain.headers["Vary"] == "Accept-Encoding"
+    assert plain.headers["Cache-Control"] == "public, no-cache"
+    assert plain.get_json()["version"] == web_app.module_data.version
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip"])
+def test_not_modified_echoes_the_matched_etag(client, accept_encoding):
+    first = client.get("/api/catalog", headers={"Accept-Encoding": accept_encoding})
+    etag = first.headers["ETag"]
+
+    # The client may revalidate with any encoding; the 304 confirms the variant it holds
+    for headers in ({"If-None-Match": etag},
+                    {"If-None-Match": etag, "Accept-Encoding": "gzip"},
+                    {"If-None-Match": f'"other", W/{etag}'}):
+        response = client.get("/api/catalog", headers=headers)
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.data == b""
+        assert response.headers["Vary"] == first.headers["Vary"]
+        assert response.headers["Cache-Control"] == first.headers["Cache-Control"]
+
+
+def test_stale_etag_gets_full_response(client):
+    response = client.get("/api/catalog", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.get_json()["categories"]
+
+
+def test_versioned_request_is_immutable(client):
+    response = client.get(f"/api/catalog?v={web_app.module_data.version}")
+    assert "immutable" in response.headers["Cache-Control"]
+
+
+def test_batch_output_format(client):
+    response = client.post("/api/batch", json={"modules": ["json", "no_such_module_xyz", "json"]})
+    assert response.status_code == 200
+    data = response.get_json()
+
+    assert set(data) == {"results", "elapsed"}
+    # Duplicates are resolved once
+    assert list(data["results"]) == ["json", "no_such_module_xyz"]
+    for result in data["results"].values():
+        assert set(result) == set(web_app.BATCH_OPERATIONS)
+        assert all(entry["ok"] for entry in result.values())
+    assert data["results"]["json"]["import_check"]["value"]["success"] is True
+    assert data["results"]["no_such_module_xyz"]["import_check"]["value"]["success"] is False
+    assert "pip install json" in data["results"]["json"]["install_command"]["value"]
+
+
+def test_batch_failing_item_does_not_fail_the_batch(client, monkeypatch):
+    original = ModuleChecker.get_module_install_command
+
+    def install_command(name, platform_name):
+        if name == "broken":
+            raise RuntimeError("kaputt")
+        return original(name, platform_name)
+
+    monkeypatch.setattr(ModuleChecker, "get_module_install_command", staticmethod(install_command))
+    data = client.post("/api/batch", json={"modules": ["json", "broken"],
+                                           "operations": ["install_command"]}).get_json()
+
+    assert data["results"]["broken"] == {"install_command": {"ok": False, "error": "kaputt"}}
+    assert data["results"]["json"]["install_command"]["ok"] is True
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"modules": []},
+    {"modules": ["json", ""]},
+    {"modules": ["json"], "operations": ["delete"]},
+    {"modules": ["json"], "operations": []},
+    {"modules": ["json"], "timeout": "soon"},
+    {"modules": [f"m{i}" for i in range(web_app.BATCH_MAX_MODULES + 1)]},
+])
+def test_batch_rejects_invalid_requests(client, body):
+    response = client.post("/api/batch", json=body)
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def _check_stream_messages(messages, names):
+    *results, done = messages
+    assert done["done"] is True
+    assert done["count"] == len(names)
+    assert sorted(message["module"] for message in results) == sorted(names)
+    for message in results:
+        assert {"success", "error", "elapsed"} <= set(message)
+        assert message["success"] == (message["module"] != "no_such_module_xyz")
+    assert all(message["elapsed"] <= done["elapsed"] for message in results)
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_stream_ndjson(client, deep):
+    names = ["json", "no_such_module_xyz", "os"]
+    response = client.post("/api/check_imports/stream", json={"modules": names, "deep": deep})
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.headers["Cache-Control"] == "no-cache"
+    lines = response.get_data(as_text=True).splitlines()
+    _check_stream_messages([json.loads(line) for line in lines], names)
+
+
+def test_stream_sse_via_get(client):
+    response = client.get("/api/check_imports/stream?modules=json,no_such_module_xyz&modules=os",
+                          headers={"Accept": "text/event-stream"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = response.get_data(as_text=True).split("\n\n")
+    assert events[-1] == ""
+    assert all(event.startswith("data: ") for event in events[:-1])
+    _check_stream_messages([json.loads(event[len("data: "):]) for event in events[:-1]],
+                           ["json", "no_such_module_xyz", "os"])
+
+
+def test_stream_format_parameter_selects_sse(client):
+    response = client.post("/api/check_imports/stream?format=sse", json={"modules": ["json"]})
+    assert response.mimetype == "text/event-stream"
+    assert response.get_data(as_text=True).startswith("data: ")
+
+
+@pytest.mark.parametrize("method, kwargs", [
+    ("get", {}),
+    ("get", {"query_string": {"modules": " , "}}),
+    ("post", {"json": {"modules": "json"}}),
+    ("post", {"json": {"modules": ["json"], "timeout": "soon"}}),
+])
+def test_stream_rejects_invalid_requests(client, method, kwargs):
+    response = getattr(client, method)("/api/check_imports/stream", **kwargs)
+    assert response.status_code == 400
+
+
+def test_closing_the_stream_cancels_pending_probes(monkeypatch):
+    calls = []
+
+    def probe_import(name, timeout):
+        calls.append(name)
+        time.sleep(0.05)
+        return {"success": True, "error": None}
+
+    monkeypatch.setattr(importus_core, "probe_import", probe_import)
+    results = ModuleChecker.iter_imports_isolated([f"m{i}" for i in range(20)], 1.0, max_workers=1)
+    next(results)
+    results.close()
+    time.sleep(0.2)
+
+    assert len(calls) <= 2
+
+
+def run_single_flight(flight, fn, callers=5):
+    """Starts one leader, waits until it runs, then lets the other callers join"""
+    results = [None] * callers
+
+    def call(i):
+        try:
+            results[i] = flight.do("key", fn)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    threads[0].start()
+    while not flight.in_flight("key"):
+        time.sleep(0.001)
+    for thread in threads[1:]:
+        thread.start()
+    return threads, results
+
+
+def test_single_flight_merges_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"name": "requests"}
+
+    threads, results = run_single_flight(flight, fetch)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert all(result == {"name": "requests"} for result in results)
+    assert not flight.in_flight("key")
+
+
+def test_single_flight_raises_for_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        raise ValueError("PyPI down")
+
+    threads, results = run_single_flight(flight, fetch)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not flight.in_flight("key")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_fresh_stale_expired():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, stale=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") == (1, "fresh")
+    clock.now += 9.9
+    assert cache.get("a") == (1, "fresh")
+    clock.now += 0.1
+    assert cache.get("a") == (1, "stale")
+    clock.now += 4.9
+    assert cache.get("a") == (1, "stale")
+    clock.now += 0.1
+    assert cache.get("a") == (None, None)
+    assert cache.get("missing") == (None, None)
+
+
+def test_ttl_cache_set_renews_the_entry():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, stale=5, clock=clock)
+    cache.set("a", 1)
+    clock.now += 12
+    cache.set("a", 2)
+
+    assert cache.get("a") == (2, "fresh")
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=10, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") == (None, None)
+    assert cache.get("a") == (1, "fresh")
+    assert cache.get("c") == (3, "fresh")
+
+
+PROJECT = {
+    "info": {"name": "requests", "version": "2.32.3", "summary": "HTTP for Humans."},
+    "releases": {"2.32.3": []},
+}
+
+
+def test_project_fields_keeps_requested_paths():
+    assert project_fields(PROJECT, ["info.version", "info.summary"]) == {
+        "info": {"version": "2.32.3", "summary": "HTTP for Humans."}
+    }
+    assert project_fields(PROJECT, ["releases"]) == {"releases": {"2.32.3": []}}
+
+
+def test_project_fields_skips_unknown_paths():
+    assert project_fields(PROJECT, ["info.nope", "nope", "info.version.major"]) == {}
+    assert project_fields(PROJECT, ["info.name", "info.nope"]) == {"info": {"name": "requests"}}
+
+
+def test_pypi_info_fields_parameter(client, monkeypatch):
+    monkeypatch.setattr(web_app, "fetch_pypi_project", lambda project: PROJECT)
+
+    assert client.get("/api/pypi_info/requests").get_json() == PROJECT
+    response = client.get("/api/pypi_info/requests?fields=info.version, info.unknown,")
+    assert response.get_json() == {"info": {"version": "2.32.3"}}
+
+
+def test_deep_batch_probes_each_module_once(client, monkeypatch):
+    probe_import = importus_core.probe_import
+    calls = []
+
+    def counting_probe(name, timeout):
+        calls.append(name)
+        return probe_import(name, timeout)
+
+    monkeypatch.setattr(importus_core, "probe_import", counting_probe)
+    monkeypatch.setattr(ModuleChecker, "probe_import", staticmethod(counting_probe))
+    monkeypatch.setattr(importus_core.distribution_index, "version", lambda name: None)
+    names = ["json", "no_such_module_xyz"]
+    data = client.post("/api/batch", json={"modules": names, "deep": True,
+                                           "operations": ["version", "import_check"]}).get_json()
+
+    assert sorted(calls) == sorted(names)
+    # The version is read from the same probe as the import check
+    assert data["results"]["json"]["version"] == {"ok": True, "value": json.__version__}
+    assert data["results"]["json"]["import_check"]["value"]["success"] is True
+    assert data["results"]["no_such_module_xyz"]["version"] == {"ok": True, "value": "N/A"}
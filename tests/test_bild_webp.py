@@ -0,0 +1,358 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image
+
+import Bild_webp
+from Bild_webp import ConversionCache, JobCheckpoint, OutputNames, convert_batch, convert_file, record_result
+
+
+def bild(path, farbe='red', groesse=(64, 48)):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.new('RGB', groesse, farbe).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def quelle(tmp_path):
+    return bild(tmp_path / 'src' / 'foto.jpg')
+
+
+@pytest.fixture
+def ausgabe(tmp_path):
+    path = tmp_path / 'out'
+    path.mkdir()
+    return str(path)
+
+
+def cache_mit(quelle, ausgabe, **optionen):
+    cache = ConversionCache(ausgabe)
+    cache.update(convert_file(quelle, ausgabe, 80, False, **optionen))
+    cache.save()
+    return ConversionCache(ausgabe)
+
+
+def test_cache_round_trip(quelle, ausgabe):
+    cache = cache_mit(quelle, ausgabe)
+
+    stat = cache.lookup(quelle, 80, False)
+    assert stat['cached'] is True
+    assert stat['input_path'] == quelle
+    assert stat['output_path'] == os.path.join(ausgabe, 'foto.webp')
+    assert cache.hits == 1
+
+
+def test_cache_andere_einstellungen(quelle, ausgabe):
+    cache = cache_mit(quelle, ausgabe)
+
+    assert cache.lookup(quelle, 81, False) is None
+    assert cache.lookup(quelle, 80, True) is None
+    assert cache.lookup(quelle, 80, False, max_dimension=32) is None
+
+
+def test_cache_beruehrte_datei_mit_gleichem_inhalt(quelle, ausgabe):
+    cache = cache_mit(quelle, ausgabe)
+    stat = os.stat(quelle)
+    os.utime(quelle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    assert cache.lookup(quelle, 80, False) is not None
+
+
+def test_cache_geaenderte_quelle_oder_fehlende_ausgabe(quelle, ausgabe):
+    cache = cache_mit(quelle, ausgabe)
+    bild(quelle, 'blue', (80, 60))
+    assert cache.lookup(quelle, 80, False) is None
+
+    cache = cache_mit(quelle, ausgabe)
+    os.remove(os.path.join(ausgabe, 'foto.webp'))
+    assert cache.lookup(quelle, 80, False) is None
+
+
+def test_cache_defektes_manifest(quelle, ausgabe):
+    cache_mit(quelle, ausgabe)
+    with open(os.path.join(ausgabe, Bild_webp.CACHE_MANIFEST), 'w') as f:
+        f.write('{kein json')
+
+    assert ConversionCache(ausgabe).entries == {}
+
+
+def test_ausgabenamen_kollisionen(tmp_path):
+    names = OutputNames()
+    names.claim(str(tmp_path / 'a' / 'bild.jpg'))
+    names.claim(str(tmp_path / 'a' / 'bild.jpg'))
+    names.claim(str(tmp_path / 'a' / 'anderes.jpg'))
+
+    for kollision in ('a/bild.png', 'b/bild.jpg', 'b/BILD.jpeg'):
+        with pytest.raises(ValueError, match='bild'):
+            names.claim(str(tmp_path / kollision))
+
+
+def test_convert_batch_weist_kollisionen_ab(tmp_path, ausgabe):
+    bild(tmp_path / 'src' / 'bild.jpg', 'red')
+    bild(tmp_path / 'src' / 'bild.png', 'blue')
+    bild(tmp_path / 'src' / 'sub' / 'bild.jpg', 'green')
+    bild(tmp_path / 'src' / 'sub' / 'anderes.jpg')
+
+    for _ in range(2):
+        results = convert_batch([str(tmp_path / 'src')], ausgabe, workers=2)
+        fehler = sorted(stat['input_path'] for stat in results if 'error' in stat)
+        assert fehler == [str(tmp_path / 'src' / 'bild.png'), str(tmp_path / 'src' / 'sub' / 'bild.jpg')]
+
+    # Die Ausgabe stammt immer von der ersten Datei in Scan-Reihenfolge
+    with Image.open(os.path.join(ausgabe, 'bild.webp')) as img:
+        assert img.convert('RGB').getpixel((0, 0))[0] > 200
+
+
+def test_checkpoint_round_trip(quelle, ausgabe):
+    checkpoint = JobCheckpoint(ausgabe, 'auftrag')
+    checkpoint.record(convert_file(quelle, ausgabe, 80, False))
+    checkpoint.close()
+    # Beim Absturz abgeschnittene letzte Zeile
+    with open(checkpoint.path, 'a', encoding='utf-8') as f:
+        f.write('{"input_path": "/abgeschn')
+
+    fortsetzung = JobCheckpoint(ausgabe, 'auftrag')
+    assert fortsetzung.exists()
+    assert fortsetzung.load() == 1
+    stat = fortsetzung.lookup(quelle)
+    assert stat['resumed'] is True
+    assert stat['output_path'] == os.path.join(ausgabe, 'foto.webp')
+    assert fortsetzung.resumed == 1
+
+
+def test_checkpoint_veraenderte_ausgabe(quelle, ausgabe):
+    checkpoint = JobCheckpoint(ausgabe, 'auftrag')
+    checkpoint.record(convert_file(quelle, ausgabe, 80, False))
+    checkpoint.close()
+    with open(os.path.join(ausgabe, 'foto.webp'), 'ab') as f:
+        f.write(b'x')
+
+    checkpoint.load()
+    assert checkpoint.lookup(quelle) is None
+
+
+def test_checkpoint_abschluss_raeumt_auf(quelle, ausgabe):
+    erster = JobCheckpoint(ausgabe, 'erster')
+    zweiter = JobCheckpoint(ausgabe, 'zweiter')
+    for checkpoint in (erster, zweiter):
+        checkpoint.record({'input_path': quelle, 'webp_size': 1})
+        checkpoint.close()
+    job_dir = os.path.join(ausgabe, Bild_webp.JOB_DIR)
+
+    erster.finish()
+    assert os.listdir(job_dir) == ['zweiter.log']
+    zweiter.discard()
+    assert not os.path.exists(job_dir)
+
+
+def test_record_result(quelle, ausgabe):
+    cache = ConversionCache(ausgabe)
+    checkpoint = JobCheckpoint(ausgabe, 'auftrag')
+    stat = convert_file(quelle, ausgabe, 80, False)
+
+    record_result(dict(stat, cached=True), cache, checkpoint)
+    assert cache.entries == {} and not checkpoint.exists()
+
+    # Übernommene Ergebnisse nur ins Manifest, sie stehen schon im Log
+    record_result(dict(stat, resumed=True), cache, checkpoint)
+    assert list(cache.entries) == [os.path.abspath(quelle)] and not checkpoint.exists()
+
+    record_result(stat, cache, checkpoint)
+    checkpoint.close()
+    assert checkpoint.load() == 1
+
+
+def test_convert_batch_setzt_auftrag_fort(tmp_path, ausgabe):
+    erste = bild(tmp_path / 'src' / 'a.jpg')
+    bild(tmp_path / 'src' / 'b.jpg', 'blue')
+    checkpoint = JobCheckpoint(ausgabe, 'auftrag')
+    checkpoint.record(convert_file(erste, ausgabe, 90, False))
+    checkpoint.close()
+
+    results = convert_batch([str(tmp_path / 'src')], ausgabe, workers=1, job_id='auftrag')
+
+    assert {os.path.basename(stat['input_path']): bool(stat.get('resumed')) for stat in results} == {
+        'a.jpg': True, 'b.jpg': False
+    }
+    assert not os.path.exists(os.path.join(ausgabe, Bild_webp.JOB_DIR))
+    # Das übernommene Ergebnis landet wie in der GUI im Manifest
+    assert ConversionCache(ausgabe).lookup(erste, 90, False) is not None
+
+
+def test_srcset_manifest_ersetzt_ueberschriebene_eintraege(tmp_path, ausgabe):
+    jpg = bild(tmp_path / 'src' / 'bild.jpg')
+    png = bild(tmp_path / 'andere' / 'bild.png', 'blue')
+    variants = {'widths': [32, 64], 'formats': ['webp']}
+
+    convert_batch([jpg], ausgabe, variants=variants)
+    convert_batch([png], ausgabe, variants=variants)
+
+    with open(os.path.join(ausgabe, Bild_webp.SRCSET_MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert list(manifest) == ['bild.png']
+    assert manifest['bild.png']['srcset']['webp'] == 'bild-32w.webp 32w, bild-64w.webp 64w'
+
+
+def rauschbild(groesse=(240, 180)):
+    return Image.effect_noise(groesse, 60).convert('RGB').resize((groesse[0] * 2, groesse[1] * 2), Image.BICUBIC)
+
+
+@pytest.fixture
+def zaehler(monkeypatch):
+    aufrufe = {'methoden': [], 'ssim': 0}
+    encode_probe = Bild_webp._encode_probe
+    image_ssim = Bild_webp.image_ssim
+
+    def zaehle_encode(probe, quality, lossless, method):
+        aufrufe['methoden'].append(method)
+        return encode_probe(probe, quality, lossless, method)
+
+    def zaehle_ssim(reference, candidate, window=16):
+        aufrufe['ssim'] += 1
+        return image_ssim(reference, candidate, window)
+
+    monkeypatch.setattr(Bild_webp, '_encode_probe', zaehle_encode)
+    monkeypatch.setattr(Bild_webp, 'image_ssim', zaehle_ssim)
+    return aufrufe
+
+
+def test_image_ssim_gleiche_bilder():
+    img = rauschbild()
+    assert Bild_webp.image_ssim(img, img) == pytest.approx(1.0)
+
+
+def test_auto_zaehlt_proben_und_ssim(zaehler):
+    quality, method, info = Bild_webp.auto_encode_settings(rauschbild(), 90, False, {'min_ssim': 0.98})
+
+    assert method == 4
+    assert 6 not in zaehler['methoden']
+    assert info['probe_encodes'] == len(zaehler['methoden']) <= 6
+    # Jede Qualität wird höchstens einmal bewertet, auch für info['ssim']
+    assert zaehler['ssim'] == info['metric_evaluations'] <= 6
+    assert info['target_met'] and info['ssim'] >= 0.98
+    assert Bild_webp.AUTO_QUALITY_RANGE[0] <= quality <= Bild_webp.AUTO_QUALITY_RANGE[1]
+
+
+def test_auto_method_6_nur_mit_zeitbudget(zaehler):
+    img = rauschbild()
+
+    Bild_webp.auto_encode_settings(img, 90, False, {'max_seconds': 1e-9})
+    assert 6 not in zaehler['methoden']
+
+    zaehler['methoden'].clear()
+    _, method, info = Bild_webp.auto_encode_settings(img, 90, False, {'max_seconds': 60})
+    assert zaehler['methoden'].count(6) == 1
+    assert method in (4, 6)
+    assert zaehler['ssim'] == info['metric_evaluations'] == 0
+
+
+def test_auto_groessenziel_ohne_ssim(zaehler):
+    img = rauschbild()
+    _, _, ohne_ziel = Bild_webp.auto_encode_settings(img, 90, False, {})
+    grenze = ohne_ziel['estimated_bytes'] // 2
+
+    quality, _, info = Bild_webp.auto_encode_settings(img, 90, False, {'max_bytes': grenze})
+
+    assert quality < 90
+    assert info['estimated_bytes'] <= grenze or quality == Bild_webp.AUTO_QUALITY_RANGE[0]
+    assert zaehler['ssim'] == 0
+
+
+@pytest.fixture
+def grosses_jpeg(tmp_path):
+    path = tmp_path / 'src' / 'gross.jpg'
+    path.parent.mkdir(exist_ok=True)
+    Image.new('RGB', (4000, 3000), 'blue').save(path, quality=80)
+    return str(path)
+
+
+def test_speicherschaetzung_beruecksichtigt_draft(grosses_jpeg):
+    voll = Bild_webp.estimate_decode_memory(grosses_jpeg)
+    verkleinert = Bild_webp.estimate_decode_memory(grosses_jpeg, max_dimension=500)
+
+    assert voll == 4000 * 3000 * 3 * Bild_webp.MEMORY_OVERHEAD_FACTOR
+    # draft() dekodiert JPEG mit Faktor 1/8 direkt auf 500x375
+    assert verkleinert == 500 * 375 * 3 * Bild_webp.MEMORY_OVERHEAD_FACTOR
+
+    budget = Bild_webp.MemoryBudget(verkleinert * 2)
+    assert budget.try_acquire(verkleinert)
+    assert not budget.try_acquire(voll)
+    assert budget.try_acquire(verkleinert)
+    budget.release(verkleinert)
+    budget.release(verkleinert)
+    # Eine einzelne Datei über dem Budget läuft allein
+    assert budget.try_acquire(voll)
+
+
+def test_grosses_jpeg_wird_verkleinert_dekodiert(grosses_jpeg, ausgabe, monkeypatch):
+    from PIL import JpegImagePlugin
+
+    aufrufe = []
+    draft = JpegImagePlugin.JpegImageFile.draft
+
+    def merke_draft(self, mode, size):
+        result = draft(self, mode, size)
+        aufrufe.append(self.size)
+        return result
+
+    monkeypatch.setattr(JpegImagePlugin.JpegImageFile, 'draft', merke_draft)
+    stat = convert_file(grosses_jpeg, ausgabe, 80, False, max_dimension=500)
+
+    assert aufrufe == [(500, 375)]
+    with Image.open(stat['output_path']) as img:
+        assert img.size == (500, 375)
+
+
+def test_convert_batch_mit_kleinem_speicherbudget(tmp_path, ausgabe):
+    quellen = []
+    for i in range(3):
+        path = tmp_path / 'src' / f'gross{i}.jpg'
+        path.parent.mkdir(exist_ok=True)
+        Image.new('RGB', (2400, 1600), (i * 80, 0, 0)).save(path)
+        quellen.append(str(path))
+
+    ergebnisse = convert_batch(quellen, ausgabe, workers=2, use_cache=False, max_dimension=300,
+                               memory_budget=1024 * 1024)
+
+    assert sorted(stat['filename'] for stat in ergebnisse) == ['gross0.jpg', 'gross1.jpg', 'gross2.jpg']
+    assert all('error' not in stat for stat in ergebnisse)
+    for stat in ergebnisse:
+        with Image.open(stat['output_path']) as img:
+            assert max(img.size) == 300
+
+
+def test_perzentil_nearest_rank():
+    werte = [float(i) for i in range(1, 21)]
+
+    assert Bild_webp._percentile(werte, 0.50) == 10.0
+    assert Bild_webp._percentile(werte, 0.95) == 19.0
+    assert Bild_webp._percentile(werte, 1.0) == 20.0
+    assert Bild_webp._percentile(werte, 0.0) == 1.0
+    assert Bild_webp._percentile([0.5], 0.95) == 0.5
+
+
+def test_stage_timings_bekannte_dauern():
+    stats = [{'timings': {'decode': i / 100, 'encode': i / 10, 'write': 0.001}} for i in range(1, 11)]
+    stats.append({'timings': {'decode': 99.0}, 'cached': True})
+    stats.append({'timings': {'decode': 99.0}, 'error': 'kaputt'})
+    stats.append({'filename': 'ohne_zeiten.jpg'})
+
+    histogramme = Bild_webp.stage_timings(stats)
+
+    assert set(histogramme) == set(Bild_webp.TIMING_STAGES)
+    decode = histogramme['decode']
+    assert decode['count'] == 10
+    assert decode['total'] == pytest.approx(0.55)
+    assert decode['p50'] == pytest.approx(0.05)
+    assert decode['p95'] == pytest.approx(0.10)
+    assert decode['max'] == pytest.approx(0.10)
+    # Fehlende Phasen zählen als 0
+    assert histogramme['convert'] == {'count': 10, 'total': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    assert histogramme['encode']['p50'] == pytest.approx(0.5)
+
+    zeilen = Bild_webp.format_stage_timings(histogramme)
+    assert zeilen[0] == "Öffnen/Dekodieren: p50 50.0 ms, p95 100.0 ms, max 100.0 ms (gesamt 0.6 s)"
+    assert Bild_webp.stage_timings(stats[-3:]) == {}
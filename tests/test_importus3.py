@@ -0,0 +1,288 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("tkinter")
+import Importus3
+from Importus3 import IncrementalSearch, ModuleChecker, SearchIndex, SelectionModel, VirtualTable
+
+
+def test_schnelle_und_tiefe_pruefung_stimmen_ueberein():
+    pytest.importorskip('PIL')
+    for name in ('Pillow', 'PIL.Image', 'gibt_es_nicht_xyz'):
+        fast = ModuleChecker.find_modules([name])[name]['success']
+        deep = ModuleChecker.probe_import(name, timeout=30)['success']
+        assert fast == deep, name
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     json.decoder.scanner
+import time:       200 |        320 |   json.decoder
+import time:        80 |         80 |   json.encoder
+import time:       300 |        700 | json
+Ausgabe des Moduls selbst
+import time:        40 |         40 | zipimport
+"""
+
+
+def test_parse_importtime_baut_baum_aus_post_order():
+    roots = ModuleChecker.parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [root['name'] for root in roots] == ['json', 'zipimport']
+    json_node = roots[0]
+    assert (json_node['self_us'], json_node['cumulative_us']) == (300, 700)
+    assert [child['name'] for child in json_node['children']] == ['json.decoder', 'json.encoder']
+    decoder = json_node['children'][0]
+    assert [child['name'] for child in decoder['children']] == ['json.decoder.scanner']
+    assert decoder['children'][0]['children'] == []
+
+
+def test_parse_importtime_ignoriert_fremde_zeilen():
+    assert ModuleChecker.parse_importtime("") == []
+    assert ModuleChecker.parse_importtime("Traceback (most recent call last):\nimport time: x | y | z\n") == []
+
+
+def test_parse_importtime_mit_echter_ausgabe():
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import json"],
+        capture_output=True, text=True, check=True
+    ).stderr
+    roots = {root['name']: root for root in ModuleChecker.parse_importtime(output)}
+
+    assert 'json' in roots
+    children = ModuleChecker._flatten_import_tree(roots['json'])[1:]
+    assert all(node['cumulative_us'] <= roots['json']['cumulative_us'] for node in children)
+
+
+MODULES = {
+    'Web': [
+        {'name': 'requests', 'description': 'HTTP für Menschen'},
+        {'name': 'httpx', 'description': 'Asynchroner HTTP-Client'},
+        {'name': 'html5lib', 'description': 'HTML-Parser nach Standard'},
+    ],
+    'Daten': [
+        {'name': 'pandas', 'description': 'Tabellen und Zeitreihen'},
+        {'name': 'pyarrow', 'description': 'Spaltenformat Arrow'},
+    ] + [{'name': f'helper{i}', 'description': 'Hilfsmodul für Tabellen'} for i in range(300)],
+}
+
+
+@pytest.mark.parametrize('tastendruecke', [
+    ['h', 'ht', 'htt', 'http', 'httpx'],
+    ['t', 'ta', 'tab', 'tabe', 'tabel', 'tabelle', 'tabellen'],
+    ['hel', 'help', 'helper1', 'helper12', 'helper1', 'help'],
+    ['re', 'req', 'reqe', 'reqeu', 'reqeusts'],
+    ['html', 'html par', 'html parser'],
+])
+def test_inkrementelle_suche_liefert_dasselbe_wie_volle_suche(tastendruecke):
+    index = SearchIndex(SearchIndex.build_state(MODULES))
+    live = IncrementalSearch(index)
+
+    for query in tastendruecke:
+        assert live.search(query) == index.search(query), query
+
+
+def test_inkrementelle_suche_mit_limit():
+    index = SearchIndex(SearchIndex.build_state(MODULES))
+    live = IncrementalSearch(index)
+
+    for query in ['hel', 'help', 'helper']:
+        assert live.search(query, limit=10) == index.search(query, limit=10)
+    # Die gemerkte Treffermenge ist vollständig, nicht auf das Limit gekürzt
+    assert len(live.search('helper')) == 300
+
+
+class FakeWidget:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def pack(self, **kwargs):
+        pass
+
+    def bind(self, sequence, callback):
+        pass
+
+
+class FakeScrollbar(FakeWidget):
+    position = None
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class FakeTreeview(FakeWidget):
+    """Merkt sich nur Einträge und deren Werte, wie ein Treeview ohne Tk"""
+
+    def __init__(self, *args, **kwargs):
+        self.values = {}
+        self.next_id = 0
+        self.filled = []
+
+    def heading(self, column_id, **kwargs):
+        pass
+
+    def column(self, column_id, **kwargs):
+        pass
+
+    def insert(self, parent, index):
+        self.next_id += 1
+        item_id = f"I{self.next_id}"
+        self.values[item_id] = None
+        return item_id
+
+    def delete(self, *item_ids):
+        for item_id in item_ids:
+            del self.values[item_id]
+
+    def item(self, item_id, values, tags):
+        self.values[item_id] = values
+        self.filled.append(item_id)
+
+
+@pytest.fixture
+def tabelle(monkeypatch):
+    monkeypatch.setattr(Importus3, 'ttk', SimpleNamespace(Frame=FakeWidget, Scrollbar=FakeScrollbar,
+                                                           Treeview=FakeTreeview))
+    table = VirtualTable(None, [('name', 'Name', 100, 'w')], row_values=lambda row: (row,),
+                         row_key=lambda row: row, row_height=20)
+    # 11 Zeilen Höhe abzüglich Überschrift = 10 sichtbare Zeilen
+    table._on_resize(SimpleNamespace(height=20 * 11))
+    return table
+
+
+def sichtbar(table):
+    return [table.tree.values[item_id][0] for item_id in table.items]
+
+
+def test_virtuelle_tabelle_zeigt_nur_sichtbares_fenster(tabelle):
+    tabelle.set_rows([f"modul{i:03}" for i in range(100)])
+
+    assert tabelle.visible_rows == 10
+    assert len(tabelle.tree.values) == 10
+    assert sichtbar(tabelle) == [f"modul{i:03}" for i in range(10)]
+    assert tabelle.scrollbar.position == (0.0, 0.1)
+
+
+def test_virtuelle_tabelle_scrollt_und_begrenzt(tabelle):
+    tabelle.set_rows([f"modul{i:03}" for i in range(100)])
+
+    tabelle._on_mousewheel(SimpleNamespace(num=5))
+    assert tabelle.offset == 3
+    assert sichtbar(tabelle)[0] == "modul003"
+
+    tabelle.scroll_to(95)
+    assert tabelle.offset == 90
+    assert sichtbar(tabelle) == [f"modul{i:03}" for i in range(90, 100)]
+    assert tabelle.scrollbar.position == (0.9, 1.0)
+    assert tabelle.row_index(tabelle.items[2]) == 92
+    assert tabelle.row_index("unbekannt") is None
+
+    tabelle.scroll_to(-5)
+    assert tabelle.offset == 0
+
+
+def test_virtuelle_tabelle_schrumpft_und_waechst(tabelle):
+    tabelle.set_rows(["a", "b", "c"])
+    assert sichtbar(tabelle) == ["a", "b", "c"]
+    assert len(tabelle.tree.values) == 3
+    assert tabelle.scrollbar.position == (0.0, 1.0)
+
+    tabelle._on_resize(SimpleNamespace(height=20 * 3))
+    assert tabelle.visible_rows == 2
+    assert sichtbar(tabelle) == ["a", "b"]
+    assert len(tabelle.tree.values) == 2
+
+
+def test_virtuelle_tabelle_refresh_keys_nur_sichtbare_zeilen(tabelle):
+    rows = [f"modul{i:03}" for i in range(50)] + ["modul005"]
+    tabelle.set_rows(rows)
+    tabelle.scroll_to(3)
+    tabelle.tree.filled.clear()
+
+    # modul005 steht zweimal in der Liste, aber nur einmal im sichtbaren Fenster (3-12)
+    assert tabelle.refresh_keys(["modul005", "modul040", "gibt_es_nicht"]) == 1
+    assert tabelle.tree.filled == [tabelle.items[2]]
+
+    tabelle.scroll_to(41)
+    assert tabelle.refresh_keys(["modul005"]) == 1
+    assert tabelle.refresh_keys(["modul012"]) == 0
+
+
+@pytest.mark.parametrize('anzahl', [5, 40])
+def test_auswahl_bleibt_sortiert(anzahl):
+    namen = [f"modul{i:03}" for i in range(anzahl)]
+    auswahl = SelectionModel(["m_mitte"])
+    for name in reversed(namen):
+        auswahl.add(name)
+    # Mehr als 32 Änderungen auf einmal werden neu sortiert statt einzeln eingefügt
+    auswahl.update(f"z{name}" for name in namen)
+    auswahl.difference_update(namen[::2])
+
+    assert auswahl.sorted() == sorted(set(namen[1::2]) | {f"z{name}" for name in namen} | {"m_mitte"})
+    assert list(auswahl) == auswahl.sorted()
+
+
+@pytest.fixture
+def auswahl():
+    model = SelectionModel(["json"])
+    model.ereignisse = []
+    model.subscribe(lambda added, removed: model.ereignisse.append((set(added), set(removed))))
+    return model
+
+
+def test_auswahl_meldet_einzelne_aenderungen(auswahl):
+    auswahl.add("os")
+    auswahl.add("os")
+    auswahl.remove("gibt_es_nicht")
+    assert auswahl.toggle("json") is False
+
+    assert auswahl.ereignisse == [({"os"}, set()), (set(), {"json"})]
+
+
+def test_auswahl_batch_meldet_einmal(auswahl):
+    with auswahl.batch():
+        auswahl.add("os")
+        auswahl.update(["sys", "re"])
+        auswahl.remove("json")
+        assert auswahl.ereignisse == []
+
+    assert auswahl.ereignisse == [({"os", "sys", "re"}, {"json"})]
+    assert auswahl.sorted() == ["os", "re", "sys"]
+
+
+def test_auswahl_batch_hebt_hinzufuegen_und_entfernen_auf(auswahl):
+    with auswahl.batch():
+        auswahl.add("os")
+        auswahl.remove("os")
+        auswahl.remove("json")
+        auswahl.add("json")
+
+    assert auswahl.ereignisse == []
+    assert auswahl.sorted() == ["json"]
+
+
+def test_auswahl_verschachtelte_batches_melden_erst_aussen(auswahl):
+    with auswahl.batch():
+        auswahl.add("os")
+        with auswahl.batch():
+            auswahl.add("sys")
+            auswahl.clear()
+        assert auswahl.ereignisse == []
+        auswahl.add("re")
+
+    assert auswahl.ereignisse == [({"re"}, {"json"})]
+    assert len(auswahl) == 1
+
+
+def test_auswahl_batch_meldet_auch_bei_ausnahme(auswahl):
+    with pytest.raises(RuntimeError):
+        with auswahl.batch():
+            auswahl.add("os")
+            raise RuntimeError("abgebrochen")
+
+    assert auswahl.ereignisse == [({"os"}, set())]
+    auswahl.add("sys")
+    assert auswahl.ereignisse[-1] == ({"sys"}, set())
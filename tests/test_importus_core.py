@@ -0,0 +1,287 @@
+import hashlib
+import json
+import marshal
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import importus_core
+from importus_core import PyPIClient, PyPIError, SearchIndex, find_import_name, import_candidates, load_catalog, probe_import
+
+MODULES = {
+    "Web": [
+        {"name": "requests", "description": "HTTP library for humans"},
+        {"name": "httpx", "description": "Async HTTP client"},
+        {"name": "requests-toolbelt", "description": "Utilities for requests"},
+    ],
+    "Parsing": [
+        {"name": "beautifulsoup4", "description": "HTML and XML parser"},
+        {"name": "lxml", "description": "Fast XML and HTML processing"},
+    ],
+}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex(SearchIndex.build_state(MODULES))
+
+
+def names(hits):
+    return [MODULES[hit.category][hit.position]["name"] for hit in hits]
+
+
+def test_exact_name_ranks_first(index):
+    assert names(index.search("requests"))[:2] == ["requests", "requests-toolbelt"]
+
+
+def test_prefix_fuzzy_and_name_substring(index):
+    assert "requests" in names(index.search("requ"))
+    assert "requests" in names(index.search("reqeusts"))
+    assert names(index.search("soup")) == ["beautifulsoup4"]
+
+
+def test_every_word_has_to_match(index):
+    assert names(index.search("async http")) == ["httpx"]
+    assert set(names(index.search("xml html"))) == {"beautifulsoup4", "lxml"}
+    assert index.search("html nonexistentword") == []
+
+
+def test_hits_reference_the_catalog(index):
+    hit = index.search("lxml")[0]
+    assert (hit.category, hit.position) == ("Parsing", 1)
+    assert hit.score > 0
+
+
+def test_search_without_limit_returns_every_match():
+    modules = {"Many": [{"name": f"module{i}", "description": "common helper"} for i in range(450)]}
+    index = SearchIndex(SearchIndex.build_state(modules))
+
+    hits = index.search("common")
+    assert len(hits) == 450
+    assert len({hit.doc_id for hit in hits}) == 450
+    assert index.search("common", limit=5) == hits[:5]
+
+
+def test_packed_state_survives_marshal(index):
+    packed = marshal.loads(marshal.dumps(SearchIndex.pack_state(SearchIndex.build_state(MODULES))))
+    restored = SearchIndex(SearchIndex.unpack_state(packed))
+
+    for query in ("requests", "reqeusts", "soup", "xml html"):
+        assert restored.search(query) == index.search(query)
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({"format": importus_core.CATALOG_FORMAT, "categories": MODULES}), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def compile_calls(monkeypatch):
+    calls = []
+    original = importus_core._compile_catalog
+
+    def compile_catalog(raw, version):
+        calls.append(version)
+        return original(raw, version)
+
+    monkeypatch.setattr(importus_core, "_compile_catalog", compile_catalog)
+    return calls
+
+
+def compiled_files(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith(".marshal"))
+
+
+def test_catalog_is_compiled_once(catalog_file, tmp_path, compile_calls):
+    cache_dir = str(tmp_path / "cache")
+    first = load_catalog(catalog_file, cache_dir)
+    second = load_catalog(catalog_file, cache_dir)
+
+    assert len(compile_calls) == 1
+    assert len(compiled_files(cache_dir)) == 1
+    assert second["version"] == first["version"]
+    assert second["name_index"] == first["name_index"]
+    assert SearchIndex(second["search_index"]).search("soup") == SearchIndex(first["search_index"]).search("soup")
+
+
+def test_stale_digest_rebuilds(catalog_file, tmp_path, compile_calls):
+    cache_dir = str(tmp_path / "cache")
+    old = load_catalog(catalog_file, cache_dir)
+    old_file = compiled_files(cache_dir)[0]
+
+    with open(catalog_file, encoding="utf-8") as f:
+        raw = json.load(f)
+    raw["categories"]["Web"].append({"name": "aiohttp", "description": "Async HTTP"})
+    with open(catalog_file, "w", encoding="utf-8") as f:
+        json.dump(raw, f)
+    # Put the old compiled copy where the new digest would be expected
+    with open(catalog_file, "rb") as f:
+        new_file = f"catalog-{hashlib.sha256(f.read()).hexdigest()}.marshal"
+    os.replace(os.path.join(cache_dir, old_file), os.path.join(cache_dir, new_file))
+
+    new = load_catalog(catalog_file, cache_dir)
+    assert len(compile_calls) == 2
+    assert "aiohttp" in new["module_names"]
+    assert new["version"] != old["version"]
+    assert compiled_files(cache_dir) == [new_file]
+
+
+def test_corrupted_payload_falls_back_to_json(catalog_file, tmp_path, compile_calls):
+    cache_dir = str(tmp_path / "cache")
+    expected = load_catalog(catalog_file, cache_dir)
+    path = os.path.join(cache_dir, compiled_files(cache_dir)[0])
+    with open(path, "r+b") as f:
+        f.seek(-10, os.SEEK_END)
+        f.write(b"\x00" * 10)
+
+    catalog = load_catalog(catalog_file, cache_dir)
+    assert len(compile_calls) == 2
+    assert catalog["module_names"] == expected["module_names"]
+    # The damaged copy has been replaced by a valid one
+    load_catalog(catalog_file, cache_dir)
+    assert len(compile_calls) == 2
+
+
+def test_unwritable_cache_dir_does_not_raise(catalog_file, tmp_path, compile_calls):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache_dir = str(blocker / "cache")
+
+    for _ in range(2):
+        catalog = load_catalog(catalog_file, cache_dir)
+        assert "requests" in catalog["module_names"]
+    assert len(compile_calls) == 2
+
+
+def test_import_candidates():
+    assert import_candidates("json") == ["json"]
+    # The name as given comes first, then lower case with underscores
+    assert import_candidates("My-Module.sub") == ["my_module"]
+    assert import_candidates("Tkinter")[:2] == ["Tkinter", "tkinter"]
+    assert import_candidates("123-abc") == []
+
+
+def test_find_import_name_via_distribution():
+    pytest.importorskip("PIL")
+    assert "PIL" in import_candidates("Pillow")
+    assert find_import_name("Pillow") == "PIL"
+    assert find_import_name("PIL") == "PIL"
+    assert find_import_name("PIL.Image") == "PIL.Image"
+    assert find_import_name("no_such_module_xyz") is None
+
+
+def test_probe_import():
+    result = probe_import("json", timeout=30)
+    assert result["success"] is True
+    assert result["version"]
+    assert result["timed_out"] is False
+
+    missing = probe_import("no_such_module_xyz", timeout=30)
+    assert missing["success"] is False
+    assert "ModuleNotFoundError" in missing["error"]
+
+
+def test_probe_import_timeout(tmp_path, monkeypatch):
+    (tmp_path / "slow_module_xyz.py").write_text("import time\ntime.sleep(30)\n")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+    result = probe_import("slow_module_xyz", timeout=0.5)
+    assert result["success"] is False
+    assert result["timed_out"] is True
+
+
+class PyPIStub:
+    """Minimal PyPI JSON API: answers 304 when the client sends the current ETag"""
+
+    etag = '"v1"'
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def __init__(self):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests.append((self.path, dict(self.headers)))
+                if self.headers.get("If-None-Match") == stub.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps({"info": {"name": self.path.split("/")[2]}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", stub.etag)
+                self.send_header("Last-Modified", stub.last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/pypi"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def pypi_stub():
+    stub = PyPIStub()
+    yield stub
+    stub.stop()
+
+
+def stub_client(stub, tmp_path, max_age=600):
+    return PyPIClient(base_url=stub.url, cache_dir=str(tmp_path / "pypi"), max_age=max_age, timeout=2)
+
+
+def test_pypi_fresh_cache_skips_the_network(pypi_stub, tmp_path):
+    client = stub_client(pypi_stub, tmp_path)
+
+    assert client.get_project("requests")["info"]["name"] == "requests"
+    assert client.get_project("requests")["info"]["name"] == "requests"
+    assert len(pypi_stub.requests) == 1
+
+
+def test_pypi_revalidates_with_304(pypi_stub, tmp_path):
+    client = stub_client(pypi_stub, tmp_path, max_age=0)
+
+    first = client.get_project("requests")
+    second = client.get_project("requests")
+
+    assert second == first
+    assert len(pypi_stub.requests) == 2
+    first_headers, second_headers = (headers for _, headers in pypi_stub.requests)
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == PyPIStub.etag
+    assert second_headers["If-Modified-Since"] == PyPIStub.last_modified
+
+
+def test_pypi_stale_entry_when_unreachable(pypi_stub, tmp_path):
+    client = stub_client(pypi_stub, tmp_path, max_age=0)
+    data = client.get_project("requests")
+    pypi_stub.stop()
+
+    assert client.get_project("requests") == data
+    with pytest.raises(PyPIError):
+        client.get_project("flask")
+
+
+def test_pypi_cache_key_is_normalized(pypi_stub, tmp_path):
+    client = stub_client(pypi_stub, tmp_path)
+
+    data = client.get_project("Foo_Bar")
+
+    assert client.get_project("foo-bar") == data
+    assert client.get_project("foo.bar") == data
+    assert len(pypi_stub.requests) == 1
+    assert client._cache_paths("Foo_Bar") == client._cache_paths("foo-bar")